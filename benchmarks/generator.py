@@ -0,0 +1,54 @@
+"""
+Measures the wall time and the peak traced memory of table generation for a
+large expression grammar. Memory is measured in a separate run, since tracing
+allocations slows generation down. Also reports the states and the compiled
+table memory before and after minimization, and the wall time of LR1 generation
+with 1, 2 and 4 workers and the given number of workers, with the number of
+cores it was measured on.
+
+    python benchmarks/generator.py [levels] [workers]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+from grammars import expression_grammar
+
+from syntactes import LALR1Generator, LR1Generator, MinimizationStats, SLRGenerator
+
+levels = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+workers = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+grammar = expression_grammar(levels)
+
+for generator_cls in (SLRGenerator, LALR1Generator, LR1Generator):
+    start = time.perf_counter()
+    table = generator_cls(grammar).generate(workers)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    generator_cls(grammar).generate()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{generator_cls.__name__}: {len(table.rows)} states, "
+        f"{elapsed:.2f} s, peak memory {peak / 2**20:.1f} MiB"
+    )
+
+    minimization = MinimizationStats()
+    table.minimize(minimization)
+    print(
+        f"  minimized: {minimization.states_before} -> "
+        f"{minimization.states_after} states, "
+        f"{minimization.nbytes_before / 2**10:.1f} KiB -> "
+        f"{minimization.nbytes_after / 2**10:.1f} KiB"
+    )
+
+print(f"LR1Generator on {os.cpu_count()} cores:")
+for count in sorted({1, 2, 4, workers}):
+    start = time.perf_counter()
+    LR1Generator(grammar).generate(count)
+    elapsed = time.perf_counter() - start
+    print(f"  {count} workers: {elapsed:.2f} s")
@@ -0,0 +1,130 @@
+import random
+
+from syntactes import Associativity, Grammar, Rule, Token
+
+
+def expression_grammar(levels: int) -> Grammar:
+    """
+    Creates an expression grammar with `levels` levels of left-associative
+    binary operators, parenthesized expressions and comma-separated argument
+    lists:
+
+    ```
+    S -> E0 $
+    Ei -> Ei opi Ei+1 | Ei+1           for i in 0..levels-1
+    En -> ( E0 ) | x | f ( A ) | f ( )
+    A -> A , E0 | E0
+    ```
+    """
+    EOF = Token.eof()
+    S = Token("S", False)
+    A = Token("A", False)
+    x = Token("x", True)
+    f = Token("f", True)
+    LPAREN = Token("(", True)
+    RPAREN = Token(")", True)
+    COMMA = Token(",", True)
+
+    expressions = [Token(f"E{i}", False) for i in range(levels + 1)]
+    operators = [Token(f"op{i}", True) for i in range(levels)]
+
+    rules = [Rule(0, S, expressions[0], EOF)]
+    for i in range(levels):
+        lhs, rhs = expressions[i], expressions[i + 1]
+        rules.append(Rule(len(rules), lhs, lhs, operators[i], rhs))
+        rules.append(Rule(len(rules), lhs, rhs))
+
+    last = expressions[levels]
+    rules.append(Rule(len(rules), last, LPAREN, expressions[0], RPAREN))
+    rules.append(Rule(len(rules), last, x))
+    rules.append(Rule(len(rules), last, f, LPAREN, A, RPAREN))
+    rules.append(Rule(len(rules), last, f, LPAREN, RPAREN))
+    rules.append(Rule(len(rules), A, A, COMMA, expressions[0]))
+    rules.append(Rule(len(rules), A, expressions[0]))
+
+    tokens = {EOF, S, A, x, f, LPAREN, RPAREN, COMMA, *expressions, *operators}
+
+    return Grammar(rules[0], rules, tokens)
+
+
+def precedence_expression_grammar(levels: int) -> Grammar:
+    """
+    Creates the ambiguous form of `expression_grammar(levels)`, with the levels
+    of operators declared as left-associative precedence levels instead of a
+    non-terminal per level. Accepts the same streams:
+
+    ```
+    S -> E $
+    E -> E opi E                       for i in 0..levels-1
+    E -> ( E ) | x | f ( A ) | f ( )
+    A -> A , E | E
+    ```
+    """
+    EOF = Token.eof()
+    S = Token("S", False)
+    E = Token("E", False)
+    A = Token("A", False)
+    x = Token("x", True)
+    f = Token("f", True)
+    LPAREN = Token("(", True)
+    RPAREN = Token(")", True)
+    COMMA = Token(",", True)
+    operators = [Token(f"op{i}", True) for i in range(levels)]
+
+    rules = [Rule(0, S, E, EOF)]
+    for operator in operators:
+        rules.append(Rule(len(rules), E, E, operator, E))
+    rules.append(Rule(len(rules), E, LPAREN, E, RPAREN))
+    rules.append(Rule(len(rules), E, x))
+    rules.append(Rule(len(rules), E, f, LPAREN, A, RPAREN))
+    rules.append(Rule(len(rules), E, f, LPAREN, RPAREN))
+    rules.append(Rule(len(rules), A, A, COMMA, E))
+    rules.append(Rule(len(rules), A, E))
+
+    tokens = {EOF, S, E, A, x, f, LPAREN, RPAREN, COMMA, *operators}
+    precedence = [(Associativity.LEFT, (operator,)) for operator in operators]
+
+    return Grammar(rules[0], rules, tokens, precedence)
+
+
+def expression_tokens(levels: int, length: int, seed: int = 0) -> list[Token]:
+    """
+    Creates a random valid stream of about `length` tokens, ending with EOF, for
+    the grammar of `expression_grammar(levels)`.
+    """
+    rng = random.Random(seed)
+    x = Token("x", True)
+    f = Token("f", True)
+    LPAREN = Token("(", True)
+    RPAREN = Token(")", True)
+    COMMA = Token(",", True)
+    operators = [Token(f"op{i}", True) for i in range(levels)]
+
+    tokens = []
+
+    def expression(depth: int) -> None:
+        tokens.append(x)
+        while len(tokens) < length and rng.random() < 0.8:
+            tokens.append(rng.choice(operators))
+            choice = rng.random() if depth < 8 else 0
+            if choice < 0.7:
+                tokens.append(x)
+            elif choice < 0.85:
+                tokens.append(LPAREN)
+                expression(depth + 1)
+                tokens.append(RPAREN)
+            else:
+                tokens.extend((f, LPAREN))
+                expression(depth + 1)
+                while rng.random() < 0.5:
+                    tokens.append(COMMA)
+                    expression(depth + 1)
+                tokens.append(RPAREN)
+
+    while len(tokens) < length:
+        if tokens:
+            tokens.append(operators[0])
+        expression(0)
+    tokens.append(Token.eof())
+
+    return tokens
@@ -0,0 +1,73 @@
+"""
+Measures the parsing throughput, in tokens per second, of `SLRParser`, of
+`CompiledParser` and of `CompressedParser` on the same SLR table, for a large
+expression grammar and a long random valid stream of tokens. Also reports the
+compression ratio of the SLR and LR1 tables of the grammar, and the throughput
+of `SLRParser` on the ambiguous form of the grammar with precedence
+declarations.
+
+    python benchmarks/parser.py [levels] [tokens]
+"""
+
+import sys
+import time
+
+from grammars import (
+    expression_grammar,
+    expression_tokens,
+    precedence_expression_grammar,
+)
+
+from syntactes import LR1Generator, SLRGenerator
+from syntactes.parser import CompiledParser, CompressedParser, SLRParser
+
+levels = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+length = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+grammar = expression_grammar(levels)
+stream = expression_tokens(levels, length)
+table = SLRGenerator(grammar).generate()
+
+start = time.perf_counter()
+compiled = table.compile()
+elapsed = time.perf_counter() - start
+print(
+    f"compiled {len(table.rows)} states in {elapsed * 1000:.1f} ms, "
+    f"{compiled.nbytes() / 2**10:.1f} KiB"
+)
+
+compressed = table.compress()
+for generator_cls in (SLRGenerator, LR1Generator):
+    generated = generator_cls(grammar).generate()
+    start = time.perf_counter()
+    generated = generated.compress()
+    elapsed = time.perf_counter() - start
+    print(
+        f"{generator_cls.__name__} table compressed in {elapsed * 1000:.1f} ms, "
+        f"{generated.dense_nbytes() / 2**10:.1f} KiB -> "
+        f"{generated.nbytes() / 2**10:.1f} KiB, "
+        f"ratio {generated.compression_ratio():.2f}"
+    )
+
+for name, parser in (
+    ("SLRParser", SLRParser(table)),
+    ("CompiledParser", CompiledParser(compiled)),
+    ("CompressedParser", CompressedParser(compressed)),
+):
+    start = time.perf_counter()
+    parser.parse(stream)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{name}: {len(stream)} tokens in {elapsed:.2f} s, "
+        f"{len(stream) / elapsed:,.0f} tokens/s"
+    )
+
+precedence_table = SLRGenerator(precedence_expression_grammar(levels)).generate()
+parser = SLRParser(precedence_table)
+start = time.perf_counter()
+parser.parse(stream)
+elapsed = time.perf_counter() - start
+print(
+    f"SLRParser with precedence: {len(precedence_table.rows)} states, "
+    f"{len(stream)} tokens in {elapsed:.2f} s, {len(stream) / elapsed:,.0f} tokens/s"
+)
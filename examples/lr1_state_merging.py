@@ -0,0 +1,43 @@
+from syntactes import Grammar, LALR1Generator, LR1Generator, Rule, Token
+
+EOF = Token.eof()
+S = Token("S", is_terminal=False)
+E = Token("E", False)
+T = Token("T", False)
+F = Token("F", False)
+x = Token("x", True)
+PLUS = Token("+", True)
+TIMES = Token("*", True)
+LPAREN = Token("(", True)
+RPAREN = Token(")", True)
+
+tokens = {EOF, S, E, T, F, x, PLUS, TIMES, LPAREN, RPAREN}
+
+# 0. S -> E $
+# 1. E -> E + T
+# 2. E -> T
+# 3. T -> T * F
+# 4. T -> F
+# 5. F -> ( E )
+# 6. F -> x
+rule_1 = Rule(0, S, E, EOF)
+rule_2 = Rule(1, E, E, PLUS, T)
+rule_3 = Rule(2, E, T)
+rule_4 = Rule(3, T, T, TIMES, F)
+rule_5 = Rule(4, T, F)
+rule_6 = Rule(5, F, LPAREN, E, RPAREN)
+rule_7 = Rule(6, F, x)
+
+rules = (rule_1, rule_2, rule_3, rule_4, rule_5, rule_6, rule_7)
+
+grammar = Grammar(rule_1, rules, tokens)
+
+generators = {
+    "canonical LR1": LR1Generator(grammar),
+    "merged LR1": LR1Generator(grammar, merge_states=True),
+    "LALR1": LALR1Generator(grammar),
+}
+
+for name, generator in generators.items():
+    table = generator.generate()
+    print(f"{name}: {len(table.rows)} states, {len(table.conflicts())} conflicts")
@@ -0,0 +1,79 @@
+from syntactes import Associativity, Grammar, Rule, SLRGenerator, Token
+from syntactes.parser import SLRParser, execute_on
+
+EOF = Token.eof()
+S = Token("S", is_terminal=False)
+E = Token("E", False)
+PLUS = Token("+", True)
+MINUS = Token("-", True)
+TIMES = Token("*", True)
+POWER = Token("^", True)
+UMINUS = Token("UMINUS", True)  # only gives unary minus its precedence
+
+
+def number(value):
+    return Token("x", True, value)
+
+
+tokens = {EOF, S, E, number(None), PLUS, MINUS, TIMES, POWER}
+
+# 0. S -> E $
+# 1. E -> E + E
+# 2. E -> E - E
+# 3. E -> E * E
+# 4. E -> E ^ E
+# 5. E -> - E
+# 6. E -> x
+rule_1 = Rule(0, S, E, EOF)
+rule_2 = Rule(1, E, E, PLUS, E)
+rule_3 = Rule(2, E, E, MINUS, E)
+rule_4 = Rule(3, E, E, TIMES, E)
+rule_5 = Rule(4, E, E, POWER, E)
+rule_6 = Rule(5, E, MINUS, E, precedence=UMINUS)
+rule_7 = Rule(6, E, number(None))
+
+rules = (rule_1, rule_2, rule_3, rule_4, rule_5, rule_6, rule_7)
+
+# from the lowest to the highest precedence
+precedence = [
+    (Associativity.LEFT, [PLUS, MINUS]),
+    (Associativity.LEFT, [TIMES]),
+    (Associativity.RIGHT, [POWER]),
+    (Associativity.RIGHT, [UMINUS]),
+]
+
+grammar = Grammar(rule_1, rules, tokens, precedence)
+
+table = SLRGenerator(grammar).generate()
+print(f"{len(table.rows)} states, {len(table.conflicts())} conflicts")
+
+stack = []
+
+execute_on(rule_2)(lambda *_: stack.append(stack.pop(-2) + stack.pop()))
+execute_on(rule_3)(lambda *_: stack.append(stack.pop(-2) - stack.pop()))
+execute_on(rule_4)(lambda *_: stack.append(stack.pop(-2) * stack.pop()))
+execute_on(rule_5)(lambda *_: stack.append(stack.pop(-2) ** stack.pop()))
+execute_on(rule_6)(lambda *_: stack.append(-stack.pop()))
+execute_on(rule_7)(lambda x: stack.append(x.value))
+
+parser = SLRParser(table)
+
+# 1 - 2 * 3 ^ 2 ^ 0 - - 4 = 1 - (2 * (3 ^ (2 ^ 0))) - (-4) = -1
+parser.parse(
+    [
+        number(1),
+        MINUS,
+        number(2),
+        TIMES,
+        number(3),
+        POWER,
+        number(2),
+        POWER,
+        number(0),
+        MINUS,
+        MINUS,
+        number(4),
+        EOF,
+    ]
+)
+print(stack.pop())
@@ -1,4 +1,6 @@
 from .token import Token
 from .rule import Rule
-from .grammar import Grammar
-from .generator import LR0Generator, SLRGenerator, LR1Generator
+from .grammar import Associativity, Grammar, GrammarDiff
+from .generator import LR0Generator, SLRGenerator, LALR1Generator, LR1Generator
+from .stats import GenerationStats, MinimizationStats
+from .cache import TableCache
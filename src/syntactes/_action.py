@@ -37,11 +37,17 @@ class Action:
 
     The `actionable_number` refers to the state number for `State` actionables and
     to the rule number for `Rule` actionables.
+
+    Actions are immutable; the hash is computed once on creation.
     """
 
+    __slots__ = ("actionable", "action_type", "_hash")
+
     def __init__(self, actionable: Actionable, action_type: ActionType) -> None:
-        self.actionable = actionable
-        self.action_type = action_type
+        _set = object.__setattr__
+        _set(self, "actionable", actionable)
+        _set(self, "action_type", action_type)
+        _set(self, "_hash", hash((actionable, action_type)))
 
     @staticmethod
     def shift(state: Actionable) -> "Action":
@@ -64,6 +70,12 @@ class Action:
         """
         return Action(None, ActionType.ACCEPT)
 
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __reduce__(self):
+        return (Action, (self.actionable, self.action_type))
+
     def __repr__(self) -> str:
         return f"<Action: {self}>"
 
@@ -74,7 +86,7 @@ class Action:
         return f"{self.action_type.abbreviated()}{self.actionable.number}"
 
     def __hash__(self) -> int:
-        return hash((self.actionable, self.action_type))
+        return self._hash
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, Action):
@@ -0,0 +1,142 @@
+from syntactes import Grammar, Token
+from syntactes._terminal_set import TerminalSet
+
+
+class GrammarAnalysis:
+    """
+    Nullable, FIRST and FOLLOW sets of a grammar.
+
+    All sets are computed once, with a fixpoint iteration over the rules of the
+    grammar, when the analysis is created. Lookups afterwards are dictionary
+    lookups; FIRST sets of symbol sequences are memoized.
+
+    FIRST and FOLLOW sets are `TerminalSet`s over the terminal ids of the
+    compiled grammar.
+    """
+
+    def __init__(self, grammar: Grammar) -> None:
+        self.grammar = grammar.compile()
+        self._null = Token.null()
+        self._empty = self.grammar.terminal_set()
+        self._nullable: set[Token] = set()
+        self._first: dict[Token, int] = dict()
+        self._follow: dict[Token, TerminalSet] = dict()
+        self._first_of_sequence: dict[tuple[Token, ...], TerminalSet] = dict()
+
+        self._compute_nullable()
+        self._compute_first()
+        self._compute_follow()
+
+    def nullable(self, *symbols: Token) -> bool:
+        """
+        Returns True if the given sequence of symbols can derive the empty string,
+        False otherwise. The empty sequence is nullable.
+        """
+        return all(self._symbol_is_nullable(s) for s in symbols)
+
+    def first(self, *symbols: Token) -> TerminalSet:
+        """
+        Returns the FIRST set of the given sequence of symbols.
+
+        The FIRST set of a symbol 'G' is the set of terminal symbols that can
+        begin a string derived from 'G'.
+
+        e.g. 't', 'k' and 'a' would be the FIRST set of G for the below rules:
+        1. G -> t
+        2. G -> kM
+        3. G -> T
+        4. T -> a
+        where M is either terminal or non-terminal and T is non-terminal.
+        'a' would be included in the FIRST set because if rule 4 is substituted in
+        rule 3, 'a' (which is a terminal) could be derived from 'G'.
+
+        For a sequence X Y Z, FIRST(Y) is included only if X can derive the empty
+        string, FIRST(Z) only if both X and Y can, and so on.
+        """
+        _set = self._first_of_sequence.get(symbols)
+        if _set is None:
+            bits = self._sequence_first(symbols)
+            _set = TerminalSet(bits, self.grammar.terminals, self.grammar.symbol_ids)
+            self._first_of_sequence[symbols] = _set
+
+        return _set
+
+    def follow(self, symbol: Token) -> TerminalSet:
+        """
+        Returns the FOLLOW set of the given symbol.
+
+        The FOLLOW set of a non-terminal 'G' is the set of terminals that can
+        immediately follow 'G' in a string derived from the starting rule.
+        The FOLLOW set of a terminal is empty.
+        """
+        return self._follow.get(symbol, self._empty)
+
+    def _symbol_is_nullable(self, symbol: Token) -> bool:
+        return symbol == self._null or symbol in self._nullable
+
+    def _sequence_first(self, symbols: tuple[Token, ...]) -> int:
+        bits = 0
+
+        for symbol in symbols:
+            bits |= self._first.get(symbol, 0)
+
+            if not self._symbol_is_nullable(symbol):
+                break
+
+        return bits
+
+    def _compute_nullable(self) -> None:
+        changed = True
+        while changed:
+            changed = False
+
+            for rule in self.grammar.rules:
+                if rule.lhs in self._nullable:
+                    continue
+
+                if self.nullable(*rule.rhs):
+                    self._nullable.add(rule.lhs)
+                    changed = True
+
+    def _compute_first(self) -> None:
+        first = self._first
+        for terminal in self.grammar.terminals:
+            first[terminal] = 1 << self.grammar.symbol_id(terminal)
+
+        changed = True
+        while changed:
+            changed = False
+
+            for rule in self.grammar.rules:
+                bits = first.get(rule.lhs, 0)
+                new = bits | self._sequence_first(rule.rhs)
+
+                if new != bits:
+                    first[rule.lhs] = new
+                    changed = True
+
+    def _compute_follow(self) -> None:
+        follow: dict[Token, int] = {s: 0 for s in self.grammar.non_terminals}
+
+        changed = True
+        while changed:
+            changed = False
+
+            for rule in self.grammar.rules:
+                for i, symbol in enumerate(rule.rhs):
+                    if symbol.is_terminal:
+                        continue
+
+                    bits = follow[symbol]
+
+                    rest = rule.rhs[i + 1 :]
+                    new = bits | self._sequence_first(rest)
+                    if self.nullable(*rest):
+                        new |= follow[rule.lhs]
+
+                    if new != bits:
+                        follow[symbol] = new
+                        changed = True
+
+        terminals, ids = self.grammar.terminals, self.grammar.symbol_ids
+        self._follow = {s: TerminalSet(b, terminals, ids) for s, b in follow.items()}
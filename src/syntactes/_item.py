@@ -1,5 +1,6 @@
 from typing import Optional, Protocol
 
+from syntactes._terminal_set import TerminalSet
 from syntactes.rule import Rule
 from syntactes.token import Token
 
@@ -13,29 +14,29 @@ class LR0Item:
     """
     Item of LR0 parser. Contains rule and current position in rule.
     Current position is denoted with the dot '.'.
+
+    Items are immutable; the hash and the symbol after the dot are computed
+    once on creation.
+
+    `after_dot` is the symbol after the dot in the item, or None if the dot is
+    in the last position.
     """
 
+    __slots__ = ("rule", "position", "after_dot", "_hash")
+
     def __init__(self, rule: Rule, position: int) -> None:
-        self.rule = rule
-        self.position = position
+        _set = object.__setattr__
+        _set(self, "rule", rule)
+        _set(self, "position", position)
+        _set(self, "after_dot", _after_dot(rule, position))
+        _set(self, "_hash", hash((rule, position)))
 
     def dot_is_last(self) -> bool:
         """
         Returns True if the dot in the item is in the last position of the rhs,
-        False otherwise.
-        """
-        return self.position == self.rule.rhs_len
-
-    @property
-    def after_dot(self) -> Optional[Token]:
-        """
-        Returns the symbol after the dot in the current item.
-        If the dot is in the last position, returns None
+        False otherwise. The dot is always last in items of rules with a null rhs.
         """
-        if self.dot_is_last():
-            return None
-
-        return self.rule.rhs[self.position]
+        return self.after_dot is None
 
     @property
     def before_dot(self) -> Optional[Token]:
@@ -48,6 +49,12 @@ class LR0Item:
 
         return self.rule.rhs[self.position - 1]
 
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __reduce__(self):
+        return (LR0Item, (self.rule, self.position))
+
     def __repr__(self) -> str:
         return f"<LR0Item: {self}>"
 
@@ -57,25 +64,38 @@ class LR0Item:
         return f"{self.rule.lhs} -> " + " ".join(map(str, rhs))
 
     def __hash__(self) -> int:
-        return hash((self.rule, self.position))
+        return self._hash
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, LR0Item):
             return False
 
-        return self.rule == other.rule and self.position == other.position
+        return self.position == other.position and self.rule == other.rule
 
 
 class LR1Item(LR0Item):
     """
-    Item of LR1 parser. Contains rule, current position in rule and lookahead token.
-    Current position is denoted with the dot '.'.
+    Item of LR1 parser. Contains rule, current position in rule and the set of
+    lookahead tokens. Current position is denoted with the dot '.'.
+
+    The lookaheads are a `TerminalSet` of the compiled grammar.
+
+    An item stands for all the items with the same rule and position and one of
+    its lookahead tokens; a state holds a single item per rule and position.
     """
 
-    def __init__(self, rule: Rule, position: int, lookahead_token: Token) -> None:
-        self.rule = rule
-        self.position = position
-        self.lookahead_token = lookahead_token
+    __slots__ = ("lookaheads",)
+
+    def __init__(self, rule: Rule, position: int, lookaheads: TerminalSet) -> None:
+        _set = object.__setattr__
+        _set(self, "rule", rule)
+        _set(self, "position", position)
+        _set(self, "after_dot", _after_dot(rule, position))
+        _set(self, "lookaheads", lookaheads)
+        _set(self, "_hash", hash((rule, position, lookaheads)))
+
+    def __reduce__(self):
+        return (LR1Item, (self.rule, self.position, self.lookaheads))
 
     def __repr__(self) -> str:
         return f"<LR1Item: {self}>"
@@ -86,18 +106,26 @@ class LR1Item(LR0Item):
         return (
             f"{self.rule.lhs} -> "
             + " ".join(map(str, rhs))
-            + f", {self.lookahead_token}"
+            + ", "
+            + "/".join(map(str, sorted(self.lookaheads)))
         )
 
     def __hash__(self) -> int:
-        return hash((self.rule, self.position, self.lookahead_token))
+        return self._hash
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, LR1Item):
             return False
 
         return (
-            self.rule == other.rule
-            and self.position == other.position
-            and self.lookahead_token == other.lookahead_token
+            self.position == other.position
+            and self.lookaheads == other.lookaheads
+            and self.rule == other.rule
         )
+
+
+def _after_dot(rule: Rule, position: int) -> Optional[Token]:
+    if position == rule.rhs_len or rule.has_null_rhs():
+        return None
+
+    return rule.rhs[position]
@@ -0,0 +1,137 @@
+import warnings
+
+from syntactes import Grammar, Rule, Token
+from syntactes.grammar import CompiledGrammar
+
+
+class GrammarPruning:
+    """
+    Removal of the useless symbols of a grammar and of the rules that use them.
+    The pruned grammar derives the same language as the given one.
+
+    A non-terminal is unproductive if it derives no string of terminals, and a
+    symbol is unreachable if no sentential form derived from the starting rule
+    contains it. Rules with unproductive symbols are removed first, then the
+    rules of unreachable non-terminals, which leaves every remaining symbol both
+    productive and reachable.
+
+    Tokens that no rule uses, neither as a symbol nor as its precedence, are
+    reported in `unused_tokens` with a warning and left out of the pruned
+    grammar. They are not listed as unreachable.
+
+    Raises ValueError if a symbol of the starting rule is unproductive, since
+    the starting rule then derives no string at all.
+    """
+
+    def __init__(self, grammar: Grammar) -> None:
+        source = grammar.compile()
+        null = Token.null()
+
+        used = {null}
+        for rule in source.rules:
+            used.add(rule.lhs)
+            used.update(rule.rhs)
+            if rule.precedence is not None:
+                used.add(rule.precedence)
+        self.unused_tokens: tuple[Token, ...] = tuple(
+            sorted(t for t in source.tokens if t not in used)
+        )
+        if len(self.unused_tokens) > 0:
+            warnings.warn(
+                "Tokens not used by any rule: "
+                + ", ".join(f"'{t}'" for t in self.unused_tokens)
+            )
+
+        # the pruned grammar keeps the starting rule, so all of its symbols have
+        # to be productive, even if the starting symbol has other rules
+        productive = _productive_symbols(source)
+        if not all(s in productive for s in source.starting_rule.rhs):
+            raise ValueError("The starting rule derives no string of terminals.")
+
+        rules = [r for r in source.rules if all(s in productive for s in r.rhs)]
+        reachable = _reachable_symbols(source.starting_rule.lhs, rules)
+        rules = [r for r in rules if r.lhs in reachable]
+        reachable.update(r.precedence for r in rules if r.precedence is not None)
+
+        self.unproductive: tuple[Token, ...] = tuple(
+            s for s in source.non_terminals if s not in productive
+        )
+        self.unreachable: tuple[Token, ...] = tuple(
+            s
+            for s in source.symbols
+            if s in productive and s not in reachable and s in used
+        )
+        kept = set(rules)
+        self.removed_rules: tuple[Rule, ...] = tuple(
+            r for r in source.rules if r not in kept
+        )
+
+        tokens = {t for t in source.tokens if t in reachable}
+        self.grammar = CompiledGrammar(
+            source.starting_rule, rules, tokens, source.precedence
+        )
+
+    def pretty_str(self) -> str:
+        """
+        Returns a pretty-formatted string with the removed symbols and rules.
+        """
+        string = "GRAMMAR PRUNING\n"
+        string += "unproductive: " + ", ".join(map(str, self.unproductive)) + "\n"
+        string += "unreachable: " + ", ".join(map(str, self.unreachable)) + "\n"
+        string += "unused tokens: " + ", ".join(map(str, self.unused_tokens)) + "\n"
+        string += "removed rules:\n"
+        for rule in self.removed_rules:
+            string += f"{rule.number}. {rule}\n"
+
+        return string
+
+
+def _productive_symbols(grammar: CompiledGrammar) -> set[Token]:
+    """
+    Returns the terminals and the non-terminals of the grammar that derive some
+    string of terminals.
+
+    Every rule counts its right-hand side symbols that are not yet known to be
+    productive, and the left-hand side of a rule becomes productive when its
+    count drops to zero, so every occurrence is visited once.
+    """
+    null = Token.null()
+    productive = set(grammar.terminals) | {null}
+    pending: dict[Rule, int] = dict()
+    queue = []
+    for rule in dict.fromkeys(grammar.rules):
+        pending[rule] = sum(1 for s in rule.rhs if s != null and not s.is_terminal)
+        if pending[rule] == 0 and rule.lhs not in productive:
+            productive.add(rule.lhs)
+            queue.append(rule.lhs)
+
+    while queue:
+        symbol = queue.pop()
+        for rule, _ in dict.fromkeys(grammar.occurrences_of(symbol)):
+            pending[rule] -= 1
+            if pending[rule] == 0 and rule.lhs not in productive:
+                productive.add(rule.lhs)
+                queue.append(rule.lhs)
+
+    return productive
+
+
+def _reachable_symbols(start: Token, rules: list[Rule]) -> set[Token]:
+    """
+    Returns the symbols that occur in a sentential form derived from `start`
+    with the given rules.
+    """
+    rules_by_lhs: dict[Token, list[Rule]] = dict()
+    for rule in rules:
+        rules_by_lhs.setdefault(rule.lhs, []).append(rule)
+
+    reachable = {start}
+    queue = [start]
+    while queue:
+        for rule in rules_by_lhs.get(queue.pop(), []):
+            for symbol in rule.rhs:
+                if symbol not in reachable:
+                    reachable.add(symbol)
+                    queue.append(symbol)
+
+    return reachable
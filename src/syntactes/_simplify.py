@@ -0,0 +1,118 @@
+from typing import Callable, Optional
+
+from syntactes import Grammar, Rule, Token
+from syntactes.grammar import CompiledGrammar
+
+
+class GrammarSimplification:
+    """
+    Inlining of single-use non-terminals, which removes the reductions of the
+    inlined symbols and the states that follow them. The simplified grammar
+    derives the same language as the given one.
+
+    A non-terminal `N` that appears exactly once, in a rule `X -> α N β`, is
+    inlined: the rule is replaced by a rule `X -> α γ β` for every rule
+    `N -> γ`, and `N` is dropped. Inlining is safe if neither `X -> α N β` nor
+    the rules of `N` have executables. If `X -> N` is a unit rule without an
+    executable, the rules of `N` may have executables: every derived rule
+    `X -> γ` runs the executable of `N -> γ` with the same arguments, which is
+    what the parser would run before reducing `X -> N`. A symbol is not inlined
+    if that would give `X` the same rule twice, or if any of the rules has a
+    precedence, since the derived rules would resolve conflicts differently.
+
+    `origins` maps every derived rule to the rule of the given grammar whose
+    executable it runs.
+    """
+
+    def __init__(
+        self, grammar: Grammar, has_executable: Callable[[Rule], bool]
+    ) -> None:
+        self._source = grammar.compile()
+        self._has_executable = has_executable
+        self._next_number = 1 + max(r.number for r in self._source.rules)
+        self.origins: dict[Rule, Rule] = dict()
+        self.inlined: list[Token] = []
+
+        rules = list(self._source.rules)
+        while True:
+            inlined = self._inline_one(rules)
+            if inlined is None:
+                break
+            rules = inlined
+
+        dropped = set(self.inlined)
+        tokens = {t for t in self._source.tokens if t not in dropped}
+        self.grammar = CompiledGrammar(
+            self._source.starting_rule, rules, tokens, self._source.precedence
+        )
+
+        kept = set(rules)
+        self.origins = {r: o for r, o in self.origins.items() if r in kept}
+
+    def _inline_one(self, rules: list[Rule]) -> Optional[list[Rule]]:
+        """
+        Inlines the first single-use non-terminal that can be inlined, in the
+        order of the rules, and returns the new rules, or None if there is none.
+        """
+        starting_symbol = self._source.starting_rule.lhs
+
+        productions: dict[Token, list[Rule]] = dict()
+        uses: dict[Token, list[tuple[Rule, int]]] = dict()
+        for rule in rules:
+            productions.setdefault(rule.lhs, []).append(rule)
+            for position, symbol in enumerate(rule.rhs):
+                if not symbol.is_terminal:
+                    uses.setdefault(symbol, []).append((rule, position))
+
+        for symbol, symbol_uses in uses.items():
+            if len(symbol_uses) != 1 or symbol == starting_symbol:
+                continue
+
+            rule, position = symbol_uses[0]
+            if (
+                rule.lhs == symbol
+                or rule == self._source.starting_rule
+                or symbol not in productions
+                or self._runs_executable(rule)
+                or self._has_precedence(rule)
+                or any(self._has_precedence(r) for r in productions[symbol])
+            ):
+                continue
+
+            is_unit = rule.rhs_len == 1
+            if not is_unit and any(
+                self._runs_executable(r) for r in productions[symbol]
+            ):
+                continue
+
+            siblings = [r.rhs for r in productions[rule.lhs] if r != rule]
+            new_rhs = []
+            for production in productions[symbol]:
+                body = () if production.has_null_rhs() else production.rhs
+                rhs = rule.rhs[:position] + body + rule.rhs[position + 1 :]
+                new_rhs.append(rhs or (Token.null(),))
+
+            if len(set(siblings + new_rhs)) != len(siblings) + len(new_rhs):
+                continue
+
+            new_rules = []
+            for production, rhs in zip(productions[symbol], new_rhs):
+                new_rule = Rule(self._next_number, rule.lhs, *rhs)
+                self._next_number += 1
+                if is_unit:
+                    self.origins[new_rule] = self.origins.get(production, production)
+                new_rules.append(new_rule)
+
+            self.inlined.append(symbol)
+
+            index = rules.index(rule)
+            rules = rules[:index] + new_rules + rules[index + 1 :]
+            return [r for r in rules if r.lhs != symbol]
+
+        return None
+
+    def _has_precedence(self, rule: Rule) -> bool:
+        return self._source.precedence_token(rule) is not None
+
+    def _runs_executable(self, rule: Rule) -> bool:
+        return self._has_executable(self.origins.get(rule, rule))
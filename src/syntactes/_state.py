@@ -6,17 +6,26 @@ from syntactes._item import Item, LR0Item, LR1Item
 class State(Protocol):
     number: Optional[int]
     items: set[Item]
+    kernel: frozenset[Item]
 
 
 class LR0State:
     """
     State of LR0 parser. A LR0 state is a set of LR0 items.
+
+    A state is identified by its kernel, i.e. the items with the dot after the
+    first position, or all the items for the initial state. The rest of the items
+    are the closure of the kernel, so two states with the same kernel are equal.
     """
 
+    __slots__ = ("number", "items", "is_final", "_kernel", "_hash")
+
     def __init__(self) -> None:
         self.number = None
         self.items = set()
         self.is_final = False
+        self._kernel = None
+        self._hash = None
 
     @staticmethod
     def from_items(items: Iterable[LR0Item]) -> "LR0State":
@@ -28,11 +37,32 @@ class LR0State:
 
         return state
 
+    @classmethod
+    def from_kernel(cls, kernel: frozenset[Item], items: Iterable[Item]) -> "State":
+        """
+        Create a state from its kernel and the closure of the kernel.
+        """
+        state = cls()
+        state.items = set(items)
+        state._kernel = kernel
+
+        return state
+
+    @property
+    def kernel(self) -> frozenset[Item]:
+        if self._kernel is None:
+            kernel = frozenset(item for item in self.items if item.position > 0)
+            self._kernel = kernel if len(kernel) > 0 else frozenset(self.items)
+
+        return self._kernel
+
     def add_item(self, item: LR0Item) -> None:
         """
         Adds an item to the state.
         """
         self.items.add(item)
+        self._kernel = None
+        self._hash = None
 
     def set_number(self, number: int) -> None:
         self.number = number
@@ -47,13 +77,16 @@ class LR0State:
         return f"{self.number}:" + "(" + ", ".join(map(str, self.items)) + ")"
 
     def __hash__(self) -> int:
-        return hash(frozenset(self.items))
+        if self._hash is None:
+            self._hash = hash(self.kernel)
+
+        return self._hash
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, self.__class__):
             return False
 
-        return self.items == other.items
+        return self.kernel == other.kernel
 
 
 class LR1State(LR0State):
@@ -61,10 +94,14 @@ class LR1State(LR0State):
     State of LR1 parser. An LR1 state is a set of LR1 items.
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         self.number = None
         self.items = set()
         self.is_final = False
+        self._kernel = None
+        self._hash = None
 
     @staticmethod
     def from_items(items: Iterable[LR1Item]) -> "LR1State":
@@ -81,6 +118,8 @@ class LR1State(LR0State):
         Adds an item to the state.
         """
         self.items.add(item)
+        self._kernel = None
+        self._hash = None
 
     def __repr__(self) -> str:
         return f"<LR1State: {self.number}>"
@@ -0,0 +1,78 @@
+from typing import Iterator
+
+from syntactes.token import Token
+
+
+class TerminalSet:
+    """
+    Immutable set of terminals, backed by an integer bitmask over the dense
+    terminal ids of a compiled grammar; bit i stands for `terminals[i]`. `ids`
+    maps the symbols of the grammar to their ids, i.e. the `symbol_ids` of the
+    compiled grammar, so that membership is a lookup and a bit test.
+
+    Set operations work on the bitmasks and are only meaningful between sets of
+    the same grammar. Tokens are created only when the set is iterated.
+    """
+
+    __slots__ = ("bits", "terminals", "ids")
+
+    def __init__(
+        self, bits: int, terminals: tuple[Token, ...], ids: dict[Token, int]
+    ) -> None:
+        _set = object.__setattr__
+        _set(self, "bits", bits)
+        _set(self, "terminals", terminals)
+        _set(self, "ids", ids)
+
+    def isdisjoint(self, other: "TerminalSet") -> bool:
+        return self.bits & other.bits == 0
+
+    def __or__(self, other: "TerminalSet") -> "TerminalSet":
+        return TerminalSet(self.bits | other.bits, self.terminals, self.ids)
+
+    def __and__(self, other: "TerminalSet") -> "TerminalSet":
+        return TerminalSet(self.bits & other.bits, self.terminals, self.ids)
+
+    def __sub__(self, other: "TerminalSet") -> "TerminalSet":
+        return TerminalSet(self.bits & ~other.bits, self.terminals, self.ids)
+
+    def __le__(self, other: "TerminalSet") -> bool:
+        return self.bits & ~other.bits == 0
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __iter__(self) -> Iterator[Token]:
+        bits = self.bits
+        while bits:
+            lowest = bits & -bits
+            yield self.terminals[lowest.bit_length() - 1]
+            bits ^= lowest
+
+    def __contains__(self, token: Token) -> bool:
+        i = self.ids.get(token)
+        return i is not None and self.bits >> i & 1 == 1
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __reduce__(self):
+        return (TerminalSet, (self.bits, self.terminals, self.ids))
+
+    def __repr__(self) -> str:
+        return f"<TerminalSet: {self}>"
+
+    def __str__(self) -> str:
+        return "{" + ", ".join(map(str, self)) + "}"
+
+    def __hash__(self) -> int:
+        return hash(self.bits)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, TerminalSet):
+            return False
+
+        return self.bits == other.bits
@@ -0,0 +1,305 @@
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Type, Union
+
+from syntactes import Grammar, Rule, Token
+from syntactes._action import Action, ActionType
+from syntactes._terminal_set import TerminalSet
+from syntactes.generator import Generator
+from syntactes.grammar import CompiledGrammar
+from syntactes.parsing_table import Entry, ParsingTable
+
+FORMAT_VERSION = 1
+
+
+def fingerprint(grammar: Grammar, generator_cls: Type[Generator]) -> str:
+    """
+    Returns a stable fingerprint of the grammar and the generator class, i.e. the
+    sha256 hex digest of their canonical form. The fingerprint does not depend on
+    the iteration order of the rules and tokens of the grammar, nor on hash
+    randomization.
+    """
+    data = {
+        "format": FORMAT_VERSION,
+        "generator": f"{generator_cls.__module__}.{generator_cls.__qualname__}",
+        "starting_rule": _rule_key(grammar.starting_rule),
+        "rules": sorted(_rule_key(rule) for rule in grammar.rules),
+        "tokens": sorted(_token_key(token) for token in grammar.tokens),
+    }
+    if len(grammar.precedence) > 0:
+        data["precedence"] = [
+            [associativity.value, [_token_key(t) for t in terminals]]
+            for associativity, terminals in grammar.precedence
+        ]
+
+    return hashlib.sha256(_dumps(data)).hexdigest()
+
+
+def dumps(
+    table: ParsingTable, grammar: Grammar, generator_cls: Type[Generator]
+) -> bytes:
+    """
+    Serializes a table generated for the given grammar with the given generator
+    class. States, rows and actions are written in a canonical order, so equal
+    tables are serialized to the same bytes.
+    """
+    grammar = grammar.compile()
+    rule_ids = {rule: i for i, rule in enumerate(_canonical_rules(grammar))}
+
+    def item_key(item) -> list:
+        key = [rule_ids[item.rule], item.position]
+        if isinstance(getattr(item, "lookaheads", None), TerminalSet):
+            key.append(item.lookaheads.bits)
+
+        return key
+
+    def action_key(action: Action) -> list:
+        if action.action_type == ActionType.SHIFT:
+            return ["s", action.actionable.number]
+        if action.action_type == ActionType.REDUCE:
+            return ["r", rule_ids[action.actionable]]
+
+        return [action.action_type.abbreviated(), None]
+
+    states = sorted(table.rows, key=lambda s: s.number)
+    data = {
+        "format": FORMAT_VERSION,
+        "fingerprint": fingerprint(grammar, generator_cls),
+        "states": [
+            [s.number, s.is_final, sorted(item_key(i) for i in s.items)] for s in states
+        ],
+        "rows": [
+            [
+                s.number,
+                [
+                    [grammar.symbol_id(token), [action_key(a) for a in actions]]
+                    for token, actions in sorted(
+                        table.rows[s].items(), key=lambda r: grammar.symbol_id(r[0])
+                    )
+                ],
+            ]
+            for s in states
+        ],
+    }
+
+    return _dumps(data)
+
+
+def loads(
+    data: bytes, grammar: Grammar, generator_cls: Type[Generator]
+) -> ParsingTable:
+    """
+    Deserializes a table serialized with `dumps` for the same grammar and
+    generator class.
+
+    Raises ValueError if the data are not a serialized table of the given grammar
+    and generator class.
+    """
+    grammar = grammar.compile()
+    try:
+        data = json.loads(data)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid serialized table: {e}") from None
+
+    if (
+        not isinstance(data, dict)
+        or data.get("format") != FORMAT_VERSION
+        or data.get("fingerprint") != fingerprint(grammar, generator_cls)
+    ):
+        raise ValueError("Serialized table does not match the grammar.")
+
+    rules = _canonical_rules(grammar)
+    try:
+        states = dict()
+        for number, is_final, items in data["states"]:
+            state = generator_cls.state_cls.from_items(
+                _load_item(generator_cls, grammar, rules, key) for key in items
+            )
+            state.set_number(number)
+            if is_final:
+                state.set_final()
+            states[number] = state
+
+        table = generator_cls.table_cls(grammar)
+        for number, row in data["rows"]:
+            for symbol_id, actions in row:
+                token = grammar.symbols[symbol_id]
+                for kind, value in actions:
+                    action = _load_action(kind, value, states, rules)
+                    table.add_entry(Entry(states[number], token, action))
+    except (IndexError, KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid serialized table: {e!r}") from None
+
+    return table
+
+
+class TableCache:
+    """
+    Two-level cache of parsing tables, keyed by the fingerprint of the grammar
+    and the generator class.
+
+    The first level is an in-process LRU of at most `maxsize` tables. If a
+    `directory` is given, tables are also stored there serialized, one file per
+    fingerprint, so that they can be shared between processes and survive
+    restarts. Files are written atomically; unreadable files are treated as
+    misses and overwritten.
+
+    Tables are generated with the default options of the generator class.
+    """
+
+    def __init__(
+        self, maxsize: int = 16, directory: Optional[Union[str, Path]] = None
+    ) -> None:
+        self.maxsize = maxsize
+        self.directory = None if directory is None else Path(directory)
+        self._tables: OrderedDict[str, ParsingTable] = OrderedDict()
+
+    def get(
+        self, grammar: Grammar, generator_cls: Type[Generator]
+    ) -> Optional[ParsingTable]:
+        """
+        Returns the cached table of the given grammar and generator class, or
+        None if the table is not cached.
+        """
+        key = fingerprint(grammar, generator_cls)
+
+        table = self._tables.get(key)
+        if table is not None:
+            self._tables.move_to_end(key)
+            return table
+
+        table = self._read(key, grammar, generator_cls)
+        if table is not None:
+            self._remember(key, table)
+
+        return table
+
+    def put(
+        self, grammar: Grammar, generator_cls: Type[Generator], table: ParsingTable
+    ) -> None:
+        """
+        Caches the table of the given grammar and generator class.
+        """
+        key = fingerprint(grammar, generator_cls)
+        self._remember(key, table)
+        self._write(key, dumps(table, grammar, generator_cls))
+
+    def get_or_generate(
+        self, grammar: Grammar, generator_cls: Type[Generator]
+    ) -> ParsingTable:
+        """
+        Returns the cached table of the given grammar and generator class,
+        generating and caching it if it is not cached.
+        """
+        table = self.get(grammar, generator_cls)
+        if table is None:
+            table = generator_cls(grammar).generate()
+            self.put(grammar, generator_cls, table)
+
+        return table
+
+    def clear(self) -> None:
+        """
+        Clears the in-process cache. Files in the directory are kept.
+        """
+        self._tables.clear()
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def _remember(self, key: str, table: ParsingTable) -> None:
+        self._tables[key] = table
+        self._tables.move_to_end(key)
+        while len(self._tables) > self.maxsize:
+            self._tables.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _read(
+        self, key: str, grammar: Grammar, generator_cls: Type[Generator]
+    ) -> Optional[ParsingTable]:
+        if self.directory is None:
+            return None
+
+        try:
+            data = self._path(key).read_bytes()
+        except OSError:
+            return None
+
+        try:
+            return loads(data, grammar, generator_cls)
+        except ValueError:
+            return None
+
+    def _write(self, key: str, data: bytes) -> None:
+        if self.directory is None:
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+def _dumps(data) -> bytes:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _token_key(token: Token) -> list:
+    return [token.symbol, token.is_terminal]
+
+
+def _rule_key(rule: Rule) -> list:
+    key = [rule.number, _token_key(rule.lhs), [_token_key(s) for s in rule.rhs]]
+    if rule.precedence is not None:
+        key.append(_token_key(rule.precedence))
+
+    return key
+
+
+def _canonical_rules(grammar: CompiledGrammar) -> list[Rule]:
+    """
+    Returns the distinct rules of the grammar in canonical order, i.e. ordered by
+    their canonical form instead of their order in the grammar.
+    """
+    rules = {_dumps(_rule_key(rule)): rule for rule in grammar.rules}
+    return [rules[key] for key in sorted(rules)]
+
+
+def _load_item(
+    generator_cls: Type[Generator],
+    grammar: CompiledGrammar,
+    rules: list[Rule],
+    key: list,
+):
+    if len(key) == 3:
+        rule, position, bits = key
+        return generator_cls.item_cls(
+            rules[rule],
+            position,
+            TerminalSet(bits, grammar.terminals, grammar.symbol_ids),
+        )
+
+    rule, position = key
+    return generator_cls.item_cls(rules[rule], position)
+
+
+def _load_action(kind: str, value, states: dict, rules: list[Rule]) -> Action:
+    if kind == ActionType.SHIFT.abbreviated():
+        return Action.shift(states[value])
+    if kind == ActionType.REDUCE.abbreviated():
+        return Action.reduce(rules[value])
+    if kind == ActionType.ACCEPT.abbreviated():
+        return Action.accept()
+
+    raise ValueError(f"Unknown action '{kind}'")
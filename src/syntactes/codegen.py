@@ -0,0 +1,315 @@
+import sys
+from array import array
+from os import PathLike
+from string import Template
+from typing import Union
+
+from syntactes._action import Action, ActionType
+from syntactes.parsing_table import ParsingTable
+
+# Kinds of action cells; a cell holds `(value << 2) | kind`, as in the binary
+# table format.
+_ERROR, _SHIFT, _REDUCE, _ACCEPT = range(4)
+
+_MODULE = Template(
+    '''"""
+Parser generated by syntactes from the below table. Do not edit.
+
+${header}
+
+The module does not depend on syntactes. Input tokens can be any objects with
+`symbol` and `is_terminal` attributes.
+"""
+
+import sys
+from array import array
+from collections import deque
+
+
+class ParserError(Exception): ...
+
+
+class UnexpectedTokenError(ParserError):
+    """
+    A token was received that does not map to an action. The stream of tokens
+    is syntactically invalid.
+    """
+
+    def __init__(self, received_token, expected_tokens):
+        self.received_token = received_token
+        self.expected_tokens = expected_tokens
+        msg = (
+            f"Received token: {received_token}; "
+            f"expected one of: {[str(e) for e in expected_tokens]}"
+        )
+        super().__init__(msg)
+
+
+class NotAcceptedError(ParserError):
+    """
+    The parser did not receive an accept action. The stream of tokens is
+    syntactically invalid.
+    """
+
+
+class Token:
+    """
+    A symbol of the grammar, as pushed by the parser for the left-hand side of a
+    reduced rule.
+    """
+
+    __slots__ = ("symbol", "is_terminal", "value")
+
+    def __init__(self, symbol, is_terminal, value=None):
+        self.symbol = symbol
+        self.is_terminal = is_terminal
+        self.value = value
+
+    def __repr__(self):
+        return f"<Token: {self}>"
+
+    def __str__(self):
+        return self.symbol
+
+    def __hash__(self):
+        return hash(self.symbol)
+
+    def __eq__(self, other):
+        return (
+            getattr(other, "symbol", None) == self.symbol
+            and getattr(other, "is_terminal", None) is self.is_terminal
+        )
+
+
+def _ints(data):
+    ints = array("i", data)
+    if sys.byteorder != "little":
+        ints.byteswap()
+    return ints
+
+
+# (symbol, is_terminal), ordered by symbol id; terminals first.
+SYMBOLS = ${symbols}
+N_TERMINALS = ${n_terminals}
+N_NON_TERMINALS = ${n_non_terminals}
+
+# (left-hand side symbol id, number of popped symbols, rule, rule whose handler
+# it runs), by rule id. Rules derived by the simplification of the grammar run
+# the handler of the rule they were derived from.
+RULES = ${rules}
+
+# Flat arrays of states x terminals and states x non-terminals, for states
+# 1..${n_states}. An action cell holds (value << 2) | kind, where kind is 0 for
+# error, 1 for shift to state `value`, 2 for reduce by rule `value` and 3 for
+# accept. A goto cell holds the target state or 0.
+ACTION = _ints(${action})
+GOTO = _ints(${goto})
+FINAL = ${final}
+
+TOKENS = tuple(Token(symbol, is_terminal) for symbol, is_terminal in SYMBOLS)
+EOF = Token("$$", True)
+SYMBOL_IDS = {(t.symbol, t.is_terminal): i for i, t in enumerate(TOKENS)}
+
+
+class Parser:
+    """
+    Parser of the grammar of the table.
+
+    `handlers` maps rules, given by id or by their string representation, e.g.
+    "E -> T + E", to callables that are called when the rule is reduced, with
+    an argument for every symbol on the right-hand side of the rule, in the
+    order they are popped from the stack. A handler given by string is also
+    called for the rules derived from that rule, see `RULES`.
+    """
+
+    def __init__(self, handlers=None):
+        self._handlers = [None] * len(RULES)
+        rule_ids = dict()
+        for i, (_, _, _, origin) in enumerate(RULES):
+            rule_ids.setdefault(origin, []).append(i)
+
+        for rule, handler in (handlers or {}).items():
+            for rule_id in rule_ids[rule] if isinstance(rule, str) else [rule]:
+                self._handlers[rule_id] = handler
+
+    def parse(self, stream):
+        """
+        Parses the given stream of tokens. Expects the EOF token as the last one.
+
+        Raises `UnexpectedTokenError` if an unexpected token is received.
+
+        Raises `NotAcceptedError` if the stream of token has been parsed and the
+        parser did not receive an accept action.
+        """
+        action, goto, rules, handlers = ACTION, GOTO, RULES, self._handlers
+        n_terminals, n_non_terminals = N_TERMINALS, N_NON_TERMINALS
+        symbol_ids = SYMBOL_IDS
+
+        states = [1]
+        tokens = []
+        stream = deque(stream)
+        token = None
+
+        while len(stream) > 0:
+            token = stream.popleft()
+            state = states[-1]
+
+            symbol_id = symbol_ids.get((token.symbol, token.is_terminal))
+            if symbol_id is None:
+                cell = 0
+            elif symbol_id < n_terminals:
+                cell = action[(state - 1) * n_terminals + symbol_id]
+            else:
+                target = goto[
+                    (state - 1) * n_non_terminals + symbol_id - n_terminals
+                ]
+                cell = (target << 2) | 1 if target else 0
+
+            kind = cell & 3
+            if kind == 1:
+                tokens.append(token)
+                states.append(cell >> 2)
+            elif kind == 2:
+                lhs, length, _, _ = rules[cell >> 2]
+                args = [tokens.pop() for _ in range(length)]
+                tokens.append(TOKENS[lhs])
+                if length > 0:
+                    del states[-length:]
+
+                handler = handlers[cell >> 2]
+                if handler is not None:
+                    handler(*args)
+
+                stream.appendleft(token)  # reduce actions do not consume tokens
+
+                target = goto[
+                    (states[-1] - 1) * n_non_terminals + lhs - n_terminals
+                ]
+                if target == 0:
+                    raise UnexpectedTokenError(TOKENS[lhs], _expected(states[-1]))
+                states.append(target)
+            elif kind == 0:
+                raise UnexpectedTokenError(token, _expected(state))
+
+        if token is None or (token.symbol, token.is_terminal) != ("$$", True):
+            raise NotAcceptedError("Expected EOF token. ")
+
+        if not FINAL[states[-1] - 1]:
+            raise UnexpectedTokenError(EOF, _expected(states[-1]))
+
+
+def _expected(state):
+    expected = []
+    for i in range(N_TERMINALS):
+        if ACTION[(state - 1) * N_TERMINALS + i]:
+            expected.append(TOKENS[i])
+    for i in range(N_NON_TERMINALS):
+        if GOTO[(state - 1) * N_NON_TERMINALS + i]:
+            expected.append(TOKENS[N_TERMINALS + i])
+
+    return expected
+'''
+)
+
+
+def generate_module(table: ParsingTable) -> str:
+    """
+    Returns the source of a self-contained Python module with the packed action
+    and goto arrays of the given table and a parse loop specialized for them.
+
+    The generated `Parser` behaves like the parser of the table, i.e. it
+    takes the first action of conflicting actions, raises the same errors and
+    calls the reduce handlers with the same arguments. Reduce handlers are given
+    to the generated parser instead of the executables registry, and the rules
+    in `table.origins` run the handlers of their origins.
+    """
+    grammar = table.grammar.compile()
+    symbols = grammar.symbols
+    n_terminals = len(grammar.terminals)
+    n_non_terminals = len(grammar.non_terminals)
+    n_states = max((s.number for s in table.rows), default=0)
+
+    action = array("i", [0] * (n_states * n_terminals))
+    goto = array("i", [0] * (n_states * n_non_terminals))
+    final = bytearray(n_states)
+
+    for state, row in table.rows.items():
+        final[state.number - 1] = state.is_final
+
+        for token, actions in row.items():
+            symbol_id = grammar.symbol_id(token)
+            if token.is_terminal:
+                index = (state.number - 1) * n_terminals + symbol_id
+                action[index] = _encode(actions[0], grammar)
+            else:
+                index = (state.number - 1) * n_non_terminals + symbol_id - n_terminals
+                goto[index] = actions[0].actionable.number
+
+    rules = tuple(
+        (
+            grammar.symbol_id(rule.lhs),
+            0 if rule.has_null_rhs() else rule.rhs_len,
+            str(rule),
+            str(table.origins.get(rule, rule)),
+        )
+        for rule in grammar.rules
+    )
+
+    return _MODULE.substitute(
+        header=_header(table),
+        symbols=_tuple_source(tuple((s.symbol, s.is_terminal) for s in symbols)),
+        n_terminals=n_terminals,
+        n_non_terminals=n_non_terminals,
+        rules=_tuple_source(rules),
+        n_states=n_states,
+        action=repr(_little_endian(action)),
+        goto=repr(_little_endian(goto)),
+        final=repr(bytes(final)),
+    )
+
+
+def write_module(table: ParsingTable, path: Union[str, PathLike]) -> None:
+    """
+    Writes the module generated for the given table to the given path.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(generate_module(table))
+
+
+def _encode(action: Action, grammar) -> int:
+    if action.action_type == ActionType.SHIFT:
+        return (action.actionable.number << 2) | _SHIFT
+    if action.action_type == ActionType.REDUCE:
+        return (grammar.rule_id(action.actionable) << 2) | _REDUCE
+    if action.action_type == ActionType.ACCEPT:
+        return _ACCEPT
+
+    raise ValueError(f"Cannot encode action '{action}'.")
+
+
+def _header(table: ParsingTable) -> str:
+    """
+    Returns the title and the rules of the table, escaped for the module
+    docstring, since symbols can contain backslashes and quotes.
+    """
+    rules = [f"{i}. {r}" for i, r in enumerate(table.grammar.compile().rules)]
+    header = table.header_str() + "\n\n" + "\n".join(rules)
+    return header.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _little_endian(ints: array) -> bytes:
+    ints = array("i", ints)
+    if ints.itemsize != 4:
+        raise ValueError("The generated module requires 4-byte C ints.")
+
+    if sys.byteorder != "little":
+        ints.byteswap()
+
+    return ints.tobytes()
+
+
+def _tuple_source(items: tuple) -> str:
+    if len(items) == 0:
+        return "()"
+
+    return "(\n" + "".join(f"    {item!r},\n" for item in items) + ")"
@@ -1,17 +1,29 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Type
-
-from syntactes import Grammar, Token
-from syntactes._action import Action
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import os
+import time
+from typing import Callable, Hashable, Iterable, Optional, Type
+
+from syntactes import Grammar, GrammarDiff, Rule, Token
+from syntactes._analysis import GrammarAnalysis
+from syntactes._prune import GrammarPruning
+from syntactes._simplify import GrammarSimplification
+from syntactes._action import Action, ActionType
 from syntactes._item import Item, LR0Item, LR1Item
 from syntactes._state import LR0State, LR1State, State
+from syntactes._terminal_set import TerminalSet
+from syntactes.grammar import CompiledGrammar
 from syntactes.parsing_table import (
+    ConflictError,
     Entry,
+    LALR1ParsingTable,
     LR0ParsingTable,
     LR1ParsingTable,
     ParsingTable,
     SLRParsingTable,
 )
+from syntactes.stats import GenerationStats
 
 
 class Generator(ABC):
@@ -19,171 +31,713 @@ class Generator(ABC):
     state_cls: Type[State]
     item_cls: Type[Item]
 
-    def __init__(self, grammar: Grammar) -> None:
-        self.grammar = grammar
+    def __init__(
+        self, grammar: Grammar, simplify: bool = False, prune: bool = False
+    ) -> None:
+        """
+        With `simplify` the table is generated for the grammar with single-use
+        non-terminals inlined, see `GrammarSimplification`, and the reductions of
+        unit rules without executables are bypassed in the table where that does
+        not change the accepted language, see `_bypass_unit_reductions`. The
+        table has fewer states and the parser takes fewer reductions per token.
+        The grammar is simplified for the executables registered when the table
+        is generated, and the table keeps the rules whose executables the
+        derived rules run in `origins`. If the simplified table has conflicts,
+        the table of the given grammar is generated instead.
+
+        With `prune` the unproductive and unreachable symbols of the grammar and
+        the rules that use them are removed before the automaton is constructed,
+        and tokens that no rule uses are warned about, see `GrammarPruning`.
+        The report of the removed symbols and rules is kept in `pruning`.
+        """
+        self.simplify = simplify
+        self.prune = prune
+        self._configure(grammar)
 
     @abstractmethod
     def closure(self, items: set[Item]) -> set[Item]:
         raise NotImplementedError()
 
-    @abstractmethod
     def goto(self, items: set[Item], token: Token) -> set[Item]:
-        raise NotImplementedError()
+        """
+        Computes and returns the GOTO set for the given set of items.
+
+        The goto operation creates a set where all items have the dot past the
+        given symbol.
+        """
+        return self.closure(self._goto_kernel(items, token))
+
+    def transitions(self, state: State) -> dict[Token, State]:
+        """
+        Computes and returns the successors of the given state, keyed by the
+        symbol of the transition. The EOF token has no transition.
 
-    def generate(self) -> ParsingTable:
+        The items of the state are grouped by the symbol after the dot in a single
+        pass, so the kernel and the closure of every successor is computed once.
+        Successor states are not numbered.
+        """
+        return {
+            symbol: self.state_cls.from_kernel(kernel, self.closure(kernel))
+            for symbol, kernel in self._successor_kernels(state.items).items()
+        }
+
+    def generate(
+        self,
+        workers: int = 1,
+        stats: Optional[GenerationStats] = None,
+        progress: Optional[Callable[[int], None]] = None,
+        fail_on_conflict: bool = False,
+    ) -> ParsingTable:
         """
         Generates an parsing table for the configured grammar.
+
+        With `workers` greater than 1 the closures and successors of new states
+        are computed in a pool of that many processes, at most one per core, for
+        the levels of the automaton with enough new states to outweigh sending
+        them to the pool.
+        The table is identical to the one generated serially, including the
+        numbering of the states.
+
+        If `stats` is given, it is filled in with the phase times and the counters
+        of the generation. If `progress` is given, it is called after the closure
+        of every state with the number of closures computed so far; this is the
+        number of states discovered, except that merged LR1 states are closed
+        again when they gain lookaheads. Without either, nothing is counted.
+
+        With `fail_on_conflict`, `syntactes.parsing_table.ConflictError` is raised
+        for the first cell with more than one action, i.e. a conflict that the
+        precedence declarations do not resolve. LR0, SLR and canonical LR1
+        generators check every state right after it is expanded, so generation
+        stops at the first state with a conflict. The lookaheads of LALR1 and of
+        merged LR1 states are known only for the whole automaton, so these
+        tables, and tables generated in parallel, are checked once built.
         """
-        states, shift_entries = self._create_states_and_shift_entries()
-        reduce_entries = self._create_reduce_entries(states)
+        if self.simplify:
+            self._simplify()
 
-        entries = shift_entries | reduce_entries
+        simplified = self.grammar is not self._unsimplified_grammar
+        check_state = self._state_check(workers, fail_on_conflict and not simplified)
+        table = self._generate(workers, stats, progress, check_state)
 
-        table = self.table_cls.from_entries(entries, self.grammar)
+        if simplified and table.has_conflicts():
+            self.grammar = self._unsimplified_grammar
+            self.analysis = GrammarAnalysis(self.grammar)
+            self._origins = dict()
+            check_state = self._state_check(workers, fail_on_conflict)
+            table = self._generate(workers, stats, progress, check_state)
+
+        if fail_on_conflict and table.has_conflicts():
+            raise ConflictError(table.conflicts()[0])
 
         return table
 
-    def get_states(self) -> set[State]:
-        """
-        Returns the set of automaton states for the configured grammar.
+    def _state_check(
+        self, workers: int, fail_on_conflict: bool
+    ) -> Optional[Callable[[State, set[Entry]], None]]:
         """
-        states, _ = self._create_states_and_shift_entries()
-        return states
-
-    def _first(self, *symbols) -> set[Token]:
+        Returns the check of every expanded state for a generation with the
+        given arguments, i.e. `_check_conflicts` if conflicts fail generation and
+        can be found state by state, or None.
         """
-        Computes and returns the FIRST set for the given symbols.
+        if fail_on_conflict and workers == 1 and self._checks_expanded_states():
+            return self._check_conflicts
 
-        The FIRST set of a symbol 'G' is the set of terminal symbols that are
-        first in the right-hand side of a rule where 'G' is the left-hand side.
+        return None
 
-        e.g. 't', 'k' and 'a' would be the FIRST set of G for the below rules:
-        1. G -> t
-        2. G -> kM
-        3. G -> T
-        4. T -> a
-        where M is either terminal or non-terminal and T is non-terminal.
-        'a' would be included in the FIRST set because if rule 4 is substituted in
-        rule 3, 'a' (which is a terminal) could be derived from 'G'.
+    def _checks_expanded_states(self) -> bool:
+        """
+        Returns True if the reduce entries of a state are known as soon as the
+        state is expanded, so that its conflicts can be checked before the rest
+        of the automaton is constructed.
+        """
+        return False
 
-        The computation of the FIRST set looks very simple if symbols = X Y Z, it seems
-        as if Y and Z can be ignored and FIRST(X) is the only thing that matters.
-        But consider a grammar where X -> Y and Y -> ε. Because Y can produce the empty
-        string - and therefore X can produce the empty string - we find that FIRST(XYZ)
-        must include FIRST(Z). Therefore, in computing FIRST sets we must keep track of
-        which symbols can produce the empty string.
+    def _check_conflicts(self, state: State, shift_entries: set[Entry]) -> None:
+        """
+        Raises `ConflictError` for the first cell of the given expanded state
+        with more than one action.
         """
-        if len(symbols) == 0:
-            return set()
+        reduce_entries = self._create_reduce_entries({state})
+        entries = self._resolve_precedence(shift_entries, reduce_entries)
+        row = self.table_cls.from_entries(self._sorted_entries(entries), self.grammar)
+        if row.has_conflicts():
+            raise ConflictError(row.conflicts()[0])
+
+    def _generate(
+        self,
+        workers: int,
+        stats: Optional[GenerationStats],
+        progress: Optional[Callable[[int], None]],
+        check_state: Optional[Callable[[State, set[Entry]], None]] = None,
+        memo: Optional["_Memo"] = None,
+    ) -> ParsingTable:
+        if stats is None and progress is not None:
+            stats = GenerationStats()
+        hooks = _Hooks(stats, progress, check_state)
+        if memo is None:
+            memo = _Memo()
+
+        start = time.perf_counter()
+        states, shift_entries = self._create_states_and_shift_entries(
+            workers, hooks, memo
+        )
+        states_end = time.perf_counter()
+
+        reduce_entries: set[Entry] = set()
+        expanded: set[State] = set()
+        for state in states:
+            reused = memo.reduce_entries(state)
+            if reused is None:
+                expanded.add(state)
+            else:
+                reduce_entries |= reused
+        reduce_entries |= self._create_reduce_entries(expanded)
+        entries = self._resolve_precedence(shift_entries, reduce_entries)
+        if self.simplify:
+            states, entries = self._bypass_unit_reductions(states, entries)
+        reduce_entries_end = time.perf_counter()
+
+        entries = self._sorted_entries(entries)
+        table = self.table_cls.from_entries(entries, self.grammar)
+        table.origins = dict(self._origins)
+        table_end = time.perf_counter()
+
+        if stats is not None:
+            stats.phase_times = {
+                "states": states_end - start,
+                "reduce_entries": reduce_entries_end - states_end,
+                "table": table_end - reduce_entries_end,
+            }
+            stats.items = sum(len(state.items) for state in states)
+            stats.states = len(states)
+            stats.entries = len(entries)
+            stats.conflicts = len(table.conflicts())
 
-        symbol = symbols[0]
+        return table
 
-        if symbol.is_terminal:
-            return {symbol}
+    def regenerate(self, previous: ParsingTable, diff: GrammarDiff) -> ParsingTable:
+        """
+        Generates the parsing table of the configured grammar edited by `diff`,
+        reusing the states of `previous`, a table generated for the configured
+        grammar. Afterwards the generator is configured for the edited grammar.
+
+        A state of `previous` is reused unless some of its items has a symbol
+        affected by the diff at or after the dot, see `_create_memo`: its
+        closure is not computed again and, where still valid, its successors
+        and its reduce entries are taken from its row. Only the other states
+        are expanded. The table is the same as the one generated from scratch
+        for the edited grammar.
+
+        With `simplify` or `prune` the edited grammar is simplified or pruned
+        again and the table is generated from scratch.
+        """
+        if self.simplify or self.prune:
+            self._configure(diff.apply(self._source_grammar))
+            return self.generate()
+
+        grammar, analysis = self.grammar, self.analysis
+        affected = diff.affected_symbols(grammar)
+        self._configure(diff.apply(grammar))
+
+        memo = self._create_memo(previous, affected, grammar, analysis)
+        return self._generate(1, None, None, memo=memo)
+
+    def _create_memo(
+        self,
+        previous: ParsingTable,
+        affected: set[Token],
+        grammar: CompiledGrammar,
+        analysis: GrammarAnalysis,
+    ) -> "_Memo":
+        """
+        Returns the states of `previous`, a table generated for `grammar` with the
+        given analysis, that the configured grammar can reuse, i.e. the states
+        without an item of a removed rule or with a symbol of `affected` at or
+        after the dot. The lookaheads of LR1 items are translated to the terminal
+        ids of the configured grammar, and states with lookaheads that are no
+        longer terminals of it are not reused.
+
+        Successors and reduce entries are read from the rows of the states, so
+        they are reused only if the grammar has no precedence declarations,
+        since the rows then have every action, and reduce entries only if
+        `_reuses_reduce_entries`.
+        """
+        same_terminals = grammar.terminals == self.grammar.terminals
+        terminals = set(self.grammar.terminals)
+
+        def translate(items: Iterable[Item]) -> Optional[frozenset[Item]]:
+            if self.item_cls is not LR1Item or same_terminals:
+                return frozenset(items)
+
+            items = list(items)
+            if any(not terminals.issuperset(i.lookaheads) for i in items):
+                return None
+
+            return frozenset(
+                LR1Item(i.rule, i.position, self.grammar.terminal_set(i.lookaheads))
+                for i in items
+            )
+
+        kernels: dict[State, Optional[frozenset[Item]]] = dict()
+
+        def kernel_of(state: State) -> Optional[frozenset[Item]]:
+            if state not in kernels:
+                kernels[state] = translate(state.kernel)
+
+            return kernels[state]
+
+        complete = len(self.grammar.levels) == 0
+        reductions = complete and self._reuses_reduce_entries(grammar, analysis)
+        memo = _Memo()
+        rule_ids = self.grammar.rule_ids
+        for state, row in previous.rows.items():
+            if any(item.rule not in rule_ids for item in state.items) or any(
+                s in affected
+                for item in state.items
+                for s in item.rule.rhs[item.position :]
+            ):
+                continue
 
-        _set: set[Token] = set()
+            closure = translate(state.items)
+            if closure is None:
+                continue
 
-        for rule in self.grammar.rules:
-            if rule.lhs != symbol:
+            kernel = kernel_of(state)
+            memo.closures[kernel] = closure
+            if not complete:
                 continue
 
-            if rule.has_null_rhs() and len(symbols) > 1:
-                _set |= self._first(symbols[1:])
+            shifts: dict[Token, frozenset[Item]] = dict()
+            actions: list[tuple[Token, Action]] = []
+            for token, cell in row.items():
+                for action in cell:
+                    if action.action_type == ActionType.SHIFT:
+                        shifts[token] = kernel_of(action.actionable)
+                    else:
+                        actions.append((token, action))
+
+            if any(successor is None for successor in shifts.values()):
                 continue
 
-            if rule.rhs[0].is_terminal:
-                _set.add(rule.rhs[0])
-            elif rule.rhs_len == 1:
-                _set |= self._first(*rule.rhs)
+            symbols = sorted(shifts, key=self.grammar.symbol_id)
+            memo.successors[kernel] = {symbol: shifts[symbol] for symbol in symbols}
+            if reductions:
+                memo.reductions[kernel] = actions
 
-        return _set
+        return memo
 
-    def _follow(self, symbol: Token) -> set[Token]:
+    def _reuses_reduce_entries(
+        self, grammar: CompiledGrammar, analysis: GrammarAnalysis
+    ) -> bool:
         """
-        Computes and returns the FOLLOW set for the given symbol.
+        Returns True if the reduce and accept entries of a state in a table
+        generated for `grammar`, with the given analysis, are the same as those
+        of the state with the same items in a table of the configured grammar.
+        """
+        return False
 
-        The FOLLOW set of a symbol 'G' is the set of terminals that can immediately
-        follow 'G' in a rule.
+    def _configure(self, grammar: Grammar) -> None:
+        """
+        Configures the generator for the given grammar, pruned if `prune` is set.
+        With `simplify` the grammar is simplified when a table is generated,
+        see `_simplify`.
         """
-        if symbol.is_terminal:
-            return set()
+        self._source_grammar = grammar.compile()
+        self.grammar = self._source_grammar
+        self.pruning: Optional[GrammarPruning] = None
 
-        _set: set[Token] = set()
+        if self.prune:
+            self.pruning = GrammarPruning(self._source_grammar)
+            self.grammar = self.pruning.grammar
 
-        for rule in self.grammar.rules:
-            for i, s in enumerate(rule.rhs):
-                if s != symbol:
-                    continue
+        self._unsimplified_grammar = self.grammar
+        self._origins: dict[Rule, Rule] = dict()
+        self.analysis = GrammarAnalysis(self.grammar)
 
-                if i == rule.rhs_len - 1:
-                    if rule.lhs == symbol:
-                        continue
+    def _simplify(self) -> None:
+        """
+        Configures the generator for the simplification of the configured
+        grammar with the executables registered now, see `GrammarSimplification`.
+        The rules whose executables the derived rules run are kept in `_origins`.
+        """
+        # imported here, since the parser package imports the generators
+        from syntactes.parser import ExecutablesRegistry
 
-                    _set |= self._follow(rule.lhs)
-                else:
-                    _set |= self._first(rule.rhs[i + 1])
+        simplification = GrammarSimplification(
+            self._unsimplified_grammar, ExecutablesRegistry.is_registered
+        )
+        self.grammar = simplification.grammar
+        self._origins = simplification.origins
+        self.analysis = GrammarAnalysis(self.grammar)
 
-        return _set
+    def _has_executable(self, rule: Rule) -> bool:
+        """
+        Returns True if an executable is registered for the given rule or for the
+        rule whose executable it runs.
+        """
+        # imported here, since the parser package imports the generators
+        from syntactes.parser import ExecutablesRegistry
+
+        return ExecutablesRegistry.is_registered(self._origins.get(rule, rule))
 
-    def _create_states_and_shift_entries(self) -> tuple[set[State], set[Entry]]:
+    def get_states(self) -> set[State]:
         """
-        Computes and returns the states and entries for shift actions.
+        Returns the set of automaton states for the configured grammar.
         """
-        states, entries = dict(), set()
+        states, _ = self._create_states_and_shift_entries()
+        return states
 
-        initial_items = self._create_initial_items()
-        initial_state = self.state_cls.from_items(initial_items)
-        initial_state.set_number(1)
-        states[initial_state] = 1
+    def _create_states_and_shift_entries(
+        self,
+        workers: int = 1,
+        hooks: Optional["_Hooks"] = None,
+        memo: Optional["_Memo"] = None,
+    ) -> tuple[set[State], set[Entry]]:
+        """
+        Computes and returns the states and entries for shift actions. The
+        closures and GOTO kernels computed are counted with `hooks`; closures
+        and successors found in `memo` are not computed again, unless states
+        are expanded in parallel.
 
-        _states, _entries = dict(), set()
-        while (_states, _entries) != (states, entries):
-            _states = {s: n for s, n in states.items()}
-            _entries = {e for e in entries}
-            states, entries = self._extend_states_and_shift_entries(_states, _entries)
+        States are discovered with a worklist; every state is expanded exactly
+        once, right after it is first created.
+        """
+        if hooks is None:
+            hooks = _Hooks()
+        if memo is None:
+            memo = _Memo()
+
+        # more processes than cores only add the cost of sending states
+        workers = min(workers, os.cpu_count() or 1)
+        if workers > 1:
+            return self._create_states_and_shift_entries_in_parallel(workers, hooks)
 
-        return set(states.keys()), entries
+        states: dict[frozenset[Item], State] = dict()
+        entries: set[Entry] = set()
 
-    def _extend_states_and_shift_entries(
-        self, states: dict[State, int], entries: set[Entry]
-    ) -> tuple[dict[State, int], set[Entry]]:
+        initial_items = self._create_initial_items()
+        hooks.count_closure()
+        initial_state = self.state_cls.from_items(initial_items)
+        initial_state.set_number(1)
+        states[initial_state.kernel] = initial_state
+
+        worklist = deque([initial_state])
+        while len(worklist) > 0:
+            state = worklist.popleft()
+            self._expand_state(state, states, entries, worklist, hooks, memo)
+
+        return set(states.values()), entries
+
+    def _expand_state(
+        self,
+        state: State,
+        states: dict[frozenset[Item], State],
+        entries: set[Entry],
+        worklist: deque[State],
+        hooks: "_Hooks",
+        memo: "_Memo",
+    ) -> None:
         """
-        Extends states and entries following the below algorithm:
+        Expands the given state following the below algorithm:
 
         ```
-        for each state S in states
-            for each item A -> a.Xb in S
-                J = goto(S, X)
+        for each symbol X after the dot in some item of S
+            K = kernel of goto(S, X)
+            if K not in states
+                J = closure(K)
                 states.add(J)
-                entries.add((S->J, X))
+                worklist.append(J)
+            entries.add((S->J, X))
         ```
-        """
-        _states = {s: n for s, n in states.items()}
-        _entries = {e for e in entries}
 
+        States are looked up by kernel, so the closure is computed only for
+        kernels that have not been seen before, and only if it is not in `memo`.
+        """
         EOF = Token.eof()
-        for state in states:
-            for item in state.items:
-                if item.dot_is_last():
-                    continue
+        if any(item.after_dot == EOF for item in state.items):
+            state.set_final()
+
+        successors = memo.successors_of(state.kernel)
+        if successors is None:
+            successors = self._successor_kernels(state.items)
+            hooks.count_gotos(len(successors))
+
+        shift_entries: set[Entry] = set()
+        for symbol, kernel in successors.items():
+            new = states.get(kernel)
+            if new is None:
+                items = memo.closure(kernel)
+                if items is None:
+                    items = self.closure(kernel)
+                    hooks.count_closure()
+                new = self.state_cls.from_kernel(kernel, items)
+                new.set_number(len(states) + 1)
+                states[kernel] = new
+                worklist.append(new)
+
+            shift_entries.add(Entry(state, symbol, Action.shift(new)))
+
+        entries |= shift_entries
+        hooks.expanded(state, shift_entries)
+
+    def _create_states_and_shift_entries_in_parallel(
+        self, workers: int, hooks: "_Hooks"
+    ) -> tuple[set[State], set[Entry]]:
+        """
+        Computes and returns the states and entries for shift actions, expanding
+        the states of every breadth-first level of the automaton in a process
+        pool.
+
+        The parent numbers new kernels in the order of the serial worklist, i.e.
+        by the number of the expanded state and then by symbol id, and the
+        workers compute the closure and the successor kernels of every new
+        kernel. Levels are processed in order, so the numbering is the same as in
+        the serial construction.
+
+        Sending kernels to the workers and their closures back costs more than
+        computing a closure, so only levels with at least `_PARALLEL_KERNELS`
+        new kernels per worker are expanded in the pool, in chunks of kernels.
+        Smaller levels are expanded by the parent, and the pool is started on
+        the first large level.
+        """
+        EOF = Token.eof()
+        initial_state = self.state_cls.from_items(self._create_initial_items())
+        hooks.count_closure()
+        initial_state.set_number(1)
 
-                if item.after_dot == EOF:
-                    state.set_final()
-                    continue
+        states: dict[frozenset[Item], State] = {initial_state.kernel: initial_state}
+        numbers: dict[frozenset[Item], int] = {initial_state.kernel: 1}
+        shifts: list[tuple[State, Token, frozenset[Item]]] = []
+
+        successors = self._successor_kernels(initial_state.items)
+        hooks.count_gotos(len(successors))
+        frontier = [(initial_state, successors)]
+        executor: Optional[ProcessPoolExecutor] = None
+        try:
+            while len(frontier) > 0:
+                kernels: list[frozenset[Item]] = []
+                for state, successors in frontier:
+                    if any(item.after_dot == EOF for item in state.items):
+                        state.set_final()
+
+                    for symbol, kernel in successors.items():
+                        if kernel not in numbers:
+                            numbers[kernel] = len(numbers) + 1
+                            kernels.append(kernel)
+
+                        shifts.append((state, symbol, kernel))
+
+                if len(kernels) < _PARALLEL_KERNELS * workers:
+                    results = map(self._closure_and_successors, kernels)
+                else:
+                    if executor is None:
+                        executor = ProcessPoolExecutor(
+                            workers, initializer=_init_worker, initargs=(self,)
+                        )
+                    # two chunks per worker, so that workers that finish early
+                    # take over the chunks left
+                    chunksize = -(-len(kernels) // (2 * workers))
+                    results = executor.map(_expand_kernel, kernels, chunksize=chunksize)
+
+                frontier = []
+                for kernel, (items, successors) in zip(kernels, results):
+                    hooks.count_closure()
+                    hooks.count_gotos(len(successors))
+                    state = self.state_cls.from_kernel(kernel, items)
+                    state.set_number(numbers[kernel])
+                    states[kernel] = state
+                    frontier.append((state, successors))
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        entries = {
+            Entry(state, symbol, Action.shift(states[kernel]))
+            for state, symbol, kernel in shifts
+        }
+
+        return set(states.values()), entries
+
+    def _closure_and_successors(
+        self, kernel: frozenset[Item]
+    ) -> tuple[set[Item], dict[Token, frozenset[Item]]]:
+        """
+        Computes and returns the closure of the given kernel and the successor
+        kernels of the closure.
+        """
+        items = self.closure(kernel)
+        return items, self._successor_kernels(items)
 
-                new_items = self.goto(state.items, item.after_dot)
+    def _resolve_precedence(
+        self, shift_entries: set[Entry], reduce_entries: set[Entry]
+    ) -> set[Entry]:
+        """
+        Returns the entries with the shift/reduce conflicts that the precedence
+        declarations of the grammar resolve removed, see
+        `CompiledGrammar.resolve_shift_reduce`.
+
+        Every reduce of a cell is resolved against the shift of the cell. The
+        reduce is dropped if the shift is kept and the shift is dropped if any
+        reduce is kept; with a non-associative terminal both are dropped, so the
+        cell becomes an error. Unresolved conflicts are kept.
+        """
+        if len(self.grammar.levels) == 0:
+            return shift_entries | reduce_entries
 
-                if len(new_items) == 0:
-                    continue
+        shifts: dict[tuple[State, Token], Entry] = {
+            (e.from_state, e.token): e for e in shift_entries if e.token.is_terminal
+        }
+
+        dropped: set[Entry] = set()
+        for entry in reduce_entries:
+            shift = shifts.get((entry.from_state, entry.token))
+            if shift is None or entry.action.action_type != ActionType.REDUCE:
+                continue
+
+            kept = self.grammar.resolve_shift_reduce(
+                entry.action.actionable, entry.token
+            )
+            if kept in {ActionType.SHIFT, ActionType.REJECT}:
+                dropped.add(entry)
+            if kept in {ActionType.REDUCE, ActionType.REJECT}:
+                dropped.add(shift)
+
+        return (shift_entries | reduce_entries) - dropped
+
+    def _bypass_unit_reductions(
+        self, states: set[State], entries: set[Entry]
+    ) -> tuple[set[State], set[Entry]]:
+        """
+        Redirects the gotos to states whose only action is the reduction of a unit
+        rule `A -> B` without an executable, and returns the states that remain
+        reachable, renumbered in order, and their entries.
+
+        A goto from state `s` with `B` to such a state `t` is replaced by the goto
+        from `s` with `A`, following chains of unit rules, if every terminal that
+        the new target has an action with is a lookahead of the reduction in `t`.
+        The parser then skips the reduction and the goto, and detects errors with
+        the same tokens. The symbol pushed for the skipped reduction is `B`
+        instead of `A`.
+        """
+        rows: dict[State, list[Entry]] = {state: [] for state in states}
+        gotos: dict[tuple[State, Token], State] = dict()
+        for entry in entries:
+            rows[entry.from_state].append(entry)
+            if not entry.token.is_terminal:
+                gotos[(entry.from_state, entry.token)] = entry.action.actionable
+
+        unit_reductions: dict[State, Rule] = dict()
+        for state, row in rows.items():
+            rules = {e.action.actionable for e in row}
+            if (
+                state.number == 1
+                or len(rules) != 1
+                or any(e.action.action_type != ActionType.REDUCE for e in row)
+            ):
+                continue
+
+            rule = rules.pop()
+            if (
+                rule.rhs_len == 1
+                and not rule.rhs[0].is_terminal
+                and not self._has_executable(rule)
+            ):
+                unit_reductions[state] = rule
+
+        def terminals(state: State) -> set[Token]:
+            return {e.token for e in rows[state] if e.token.is_terminal}
+
+        redirected: set[Entry] = set()
+        for entry in entries:
+            target = entry.action.actionable
+            if entry.token.is_terminal or target not in unit_reductions:
+                redirected.add(entry)
+                continue
+
+            while target in unit_reductions:
+                successor = gotos.get((entry.from_state, unit_reductions[target].lhs))
+                if successor is None or not terminals(successor) <= terminals(target):
+                    break
+                target = successor
+
+            redirected.add(Entry(entry.from_state, entry.token, Action.shift(target)))
+
+        initial_state = next(state for state in states if state.number == 1)
+        reachable = {initial_state}
+        worklist = [initial_state]
+        successors: dict[State, list[State]] = {state: [] for state in states}
+        for entry in redirected:
+            if entry.action.action_type == ActionType.SHIFT:
+                successors[entry.from_state].append(entry.action.actionable)
+        while len(worklist) > 0:
+            for successor in successors[worklist.pop()]:
+                if successor not in reachable:
+                    reachable.add(successor)
+                    worklist.append(successor)
+
+        for number, state in enumerate(sorted(reachable, key=lambda s: s.number), 1):
+            state.set_number(number)
+
+        return reachable, {e for e in redirected if e.from_state in reachable}
+
+    def _sorted_entries(self, entries: set[Entry]) -> list[Entry]:
+        """
+        Returns the given entries in a deterministic order: by state number, by
+        symbol id and then shift before reduce before accept, with reduce
+        actions ordered by rule number. Tables are built by adding entries in
+        this order, so rows and conflicting actions are laid out the same way
+        in every run, regardless of hash randomization.
+        """
+        symbol_id = self.grammar.symbol_id
+
+        def key(entry: Entry) -> tuple:
+            action = entry.action
+            if action.action_type == ActionType.SHIFT:
+                action_key = (0, action.actionable.number, "")
+            elif action.action_type == ActionType.REDUCE:
+                action_key = (1, action.actionable.number, str(action.actionable))
+            else:
+                action_key = (2, 0, "")
+
+            return (entry.from_state.number, symbol_id(entry.token), action_key)
+
+        return sorted(entries, key=key)
 
-                new = self.state_cls.from_items(new_items)
+    def _successor_kernels(self, items: set[Item]) -> dict[Token, frozenset[Item]]:
+        """
+        Groups the given items by the symbol after the dot and returns the kernel
+        of the GOTO set for every symbol, ordered by symbol id.
+        """
+        EOF = Token.eof()
+        grouped: dict[Token, list[Item]] = dict()
+
+        for item in items:
+            symbol = item.after_dot
+            if symbol is None or symbol == EOF:
+                continue
 
-                number = _states.setdefault(new, len(_states) + 1)
-                new.set_number(number)
+            grouped.setdefault(symbol, []).append(self._advance(item))
 
-                _entries.add(Entry(state, item.after_dot, Action.shift(new)))
+        return {
+            symbol: frozenset(grouped[symbol])
+            for symbol in sorted(grouped, key=self.grammar.symbol_id)
+        }
+
+    def _goto_kernel(self, items: set[Item], token: Token) -> frozenset[Item]:
+        """
+        Computes and returns the kernel of the GOTO set, i.e. the items with the
+        dot moved past the given symbol, without their closure.
+        """
+        return frozenset(
+            self._advance(item) for item in items if item.after_dot == token
+        )
 
-        return _states, _entries
+    @abstractmethod
+    def _advance(self, item: Item) -> Item:
+        """
+        Returns the given item with the dot moved one position to the right.
+        """
+        raise NotImplementedError()
 
     @abstractmethod
     def _create_initial_items(self) -> set[Item]:
@@ -215,56 +769,46 @@ class LR0Generator(Generator):
         and T -> . x, where E -> T and T -> x are production rules.
         """
         _set = {item for item in items}
-        __set = set()
-
-        while __set != _set:
-            __set = {i for i in _set}
-
-            for item in items:
-                if item.dot_is_last():
-                    continue
+        worklist = [item.after_dot for item in items if not item.dot_is_last()]
+        expanded: set[Token] = set()
 
-                new_items = self._get_related_items(item.after_dot)
-                _set |= new_items
+        while len(worklist) > 0:
+            symbol = worklist.pop()
+            if symbol.is_terminal or symbol in expanded:
+                continue
 
-        return _set
+            expanded.add(symbol)
 
-    def goto(self, items: set[LR0Item], token: Token) -> set[LR0Item]:
-        """
-        Computes and returns the GOTO set for the given set of items.
+            for new_item in self._get_related_items(symbol):
+                _set.add(new_item)
 
-        The goto operation creates a set where all items have the dot past the
-        given symbol.
-        """
-        _set: set[LR0Item] = set()
+                if not new_item.dot_is_last():
+                    worklist.append(new_item.after_dot)
 
-        for item in items:
-            if item.dot_is_last() or item.after_dot != token:
-                continue
-
-            next_item = LR0Item(item.rule, item.position + 1)
-            _set.add(next_item)
+        return _set
 
-        return self.closure(_set)
+    def _advance(self, item: LR0Item) -> LR0Item:
+        return LR0Item(item.rule, item.position + 1)
 
     def _get_related_items(self, symbol: Token) -> set[LR0Item]:
         """
-        e.g. the items X -> .g, Y -> .p would be returned for the below grammar rules:
+        e.g. the items X -> .g, X -> .Y would be returned for symbol X and the
+        below grammar rules:
         1. X -> g
         2. X -> Y
         3. Y -> p
         where 'g' and 'p' are terminals.
         """
-        _set: set[LR0Item] = set()
+        return {LR0Item(rule, 0) for rule in self.grammar.productions(symbol)}
 
-        for rule in self.grammar.rules:
-            if rule.lhs == symbol:
-                _set.add(LR0Item(rule, 0))
+    def _checks_expanded_states(self) -> bool:
+        return True
 
-                if rule.rhs_len == 1 and not rule.rhs[0].is_terminal:
-                    _set |= self._get_related_items(rule.rhs[0])
-
-        return _set
+    def _reuses_reduce_entries(
+        self, grammar: CompiledGrammar, analysis: GrammarAnalysis
+    ) -> bool:
+        # a state with a reduce item reduces with every terminal
+        return grammar.terminals == self.grammar.terminals
 
     def _create_initial_items(self) -> set[LR0Item]:
         return self.closure({LR0Item(self.grammar.starting_rule, 0)})
@@ -283,9 +827,8 @@ class LR0Generator(Generator):
                 if not item.dot_is_last():
                     continue
 
-                for token in self.grammar.tokens:
-                    if token.is_terminal:
-                        entries.add(Entry(state, token, Action.reduce(item.rule)))
+                for token in self.grammar.terminals:
+                    entries.add(Entry(state, token, Action.reduce(item.rule)))
 
         return entries
 
@@ -293,6 +836,14 @@ class LR0Generator(Generator):
 class SLRGenerator(LR0Generator):
     table_cls = SLRParsingTable
 
+    def _reuses_reduce_entries(
+        self, grammar: CompiledGrammar, analysis: GrammarAnalysis
+    ) -> bool:
+        return all(
+            set(analysis.follow(symbol)) == set(self.analysis.follow(symbol))
+            for symbol in grammar.non_terminals
+        )
+
     def _create_reduce_entries(self, states: set[LR0State]) -> set[Entry]:
         """
         Computes and returns the entries for reduce actions and the accept action.
@@ -307,85 +858,253 @@ class SLRGenerator(LR0Generator):
                 if not item.dot_is_last():
                     continue
 
-                for token in self._follow(item.rule.lhs):
+                for token in self.analysis.follow(item.rule.lhs):
                     entries.add(Entry(state, token, Action.reduce(item.rule)))
 
         return entries
 
 
-class LR1Generator(Generator):
-    table_cls = LR1ParsingTable
-    state_cls = LR1State
-    item_cls = LR1Item
+class LALR1Generator(LR0Generator):
+    """
+    Generator of LALR1 parsing tables.
+
+    The states are the states of the LR0 automaton. The lookaheads of the reduce
+    actions are computed with the relations of DeRemer and Pennello over the
+    non-terminal transitions of the automaton:
+
+    ```
+    DR(p, A)       = {t | p -A-> r -t-> }
+    (p, A) reads (r, C)           iff p -A-> r -C-> and C is nullable
+    (p, A) includes (p', B)       iff B -> b A g, g is nullable and p' -b-> p
+    (q, A -> w) lookback (p, A)   iff p -w-> q
+
+    Read(p, A)     = DR(p, A) U {Read(r, C) | (p, A) reads (r, C)}
+    Follow(p, A)   = Read(p, A) U {Follow(p', B) | (p, A) includes (p', B)}
+    LA(q, A -> w)  = U {Follow(p, A) | (q, A -> w) lookback (p, A)}
+    ```
+    """
 
-    def closure(self, items: set[LR1Item]) -> set[LR1Item]:
-        """
-        Computes and returns the closure for the given set of items.
+    table_cls = LALR1ParsingTable
 
-        The closure operation adds more items to a set of items when there
-        is a dot to the left of a non-terminal symbol.
+    def _checks_expanded_states(self) -> bool:
+        return False
+
+    def _reuses_reduce_entries(
+        self, grammar: CompiledGrammar, analysis: GrammarAnalysis
+    ) -> bool:
+        # lookaheads are computed over the whole automaton
+        return False
+
+    def _create_states_and_shift_entries(
+        self,
+        workers: int = 1,
+        hooks: Optional["_Hooks"] = None,
+        memo: Optional["_Memo"] = None,
+    ) -> tuple[set[LR0State], set[Entry]]:
+        states, entries = super()._create_states_and_shift_entries(workers, hooks, memo)
+
+        self._transitions: dict[int, dict[Token, LR0State]] = {
+            state.number: dict() for state in states
+        }
+        for entry in entries:
+            self._transitions[entry.from_state.number][entry.token] = (
+                entry.action.actionable
+            )
+
+        return states, entries
+
+    def _create_reduce_entries(self, states: set[LR0State]) -> set[Entry]:
         """
-        _set = {item for item in items}
-        __set = set()
+        Computes and returns the entries for reduce actions and the accept action.
+        """
+        entries: set[Entry] = set()
+        lookaheads = self._create_lookaheads(states)
 
-        while __set != _set:
-            __set = {i for i in _set}
+        for state in states:
+            for item in state.items:
+                if item.after_dot == Token.eof():
+                    entries.add(Entry(state, Token.eof(), Action.accept()))
 
-            for item in __set:
-                if item.dot_is_last():
+                if not item.dot_is_last():
                     continue
 
-                if item.position + 1 < item.rule.rhs_len:
-                    next_symbol = item.rule.rhs[item.position + 1]
+                for token in lookaheads.get((state.number, item.rule), ()):
+                    entries.add(Entry(state, token, Action.reduce(item.rule)))
+
+        return entries
+
+    def _create_lookaheads(
+        self, states: set[LR0State]
+    ) -> dict[tuple[int, Rule], TerminalSet]:
+        """
+        Computes the lookahead set of every (state number, rule) pair where the
+        state contains a reduce item of the rule.
+        """
+        transitions = self._non_terminal_transitions()
+
+        direct_reads = {t: self._direct_reads(t) for t in transitions}
+        reads = {t: self._reads(t) for t in transitions}
+        read = _digraph(transitions, reads, direct_reads)
+
+        includes, lookback = self._includes_and_lookback(transitions)
+        follow = _digraph(transitions, includes, read)
+
+        lookaheads: dict[tuple[int, Rule], TerminalSet] = dict()
+        for reduction, _transitions in lookback.items():
+            _set = self.grammar.terminal_set()
+            for t in _transitions:
+                _set = _set | follow[t]
+
+            lookaheads[reduction] = _set
+
+        return lookaheads
+
+    def _non_terminal_transitions(self) -> list[tuple[int, Token]]:
+        return [
+            (number, symbol)
+            for number in sorted(self._transitions)
+            for symbol in self._transitions[number]
+            if not symbol.is_terminal
+        ]
+
+    def _direct_reads(self, transition: tuple[int, Token]) -> TerminalSet:
+        number, symbol = transition
+        target = self._transitions[number][symbol]
+
+        return self.grammar.terminal_set(
+            item.after_dot
+            for item in target.items
+            if not item.dot_is_last() and item.after_dot.is_terminal
+        )
+
+    def _reads(self, transition: tuple[int, Token]) -> list[tuple[int, Token]]:
+        number, symbol = transition
+        target = self._transitions[number][symbol]
+
+        return [
+            (target.number, s)
+            for s in self._transitions[target.number]
+            if not s.is_terminal and self.analysis.nullable(s)
+        ]
+
+    def _includes_and_lookback(
+        self, transitions: list[tuple[int, Token]]
+    ) -> tuple[
+        dict[tuple[int, Token], set[tuple[int, Token]]],
+        dict[tuple[int, Rule], set[tuple[int, Token]]],
+    ]:
+        """
+        Computes the includes and lookback relations by walking the right-hand
+        side of every production of A from p, for every transition (p, A).
+        """
+        includes: dict[tuple[int, Token], set[tuple[int, Token]]] = dict()
+        lookback: dict[tuple[int, Rule], set[tuple[int, Token]]] = dict()
+
+        for transition in transitions:
+            number, symbol = transition
+
+            for rule in self.grammar.productions(symbol):
+                rhs = () if rule.has_null_rhs() else rule.rhs
+                current = number
+
+                for i, s in enumerate(rhs):
+                    if not s.is_terminal and self.analysis.nullable(*rhs[i + 1 :]):
+                        includes.setdefault((current, s), set()).add(transition)
+
+                    target = self._transitions[current].get(s)
+                    if target is None:
+                        break
+
+                    current = target.number
                 else:
-                    next_symbol = None
+                    lookback.setdefault((current, rule), set()).add(transition)
 
-                new_items = self._get_related_items(
-                    item.after_dot, next_symbol, item.lookahead_token
-                )
-                _set |= new_items
+        return includes, lookback
 
-        return _set
 
-    def goto(self, items: set[LR1Item], token: Token) -> set[LR1Item]:
+class LR1Generator(Generator):
+    """
+    Generator of LR1 parsing tables.
+
+    With `merge_states` the generator merges states with the same LR0 core
+    while constructing the automaton, whenever their lookaheads are weakly
+    compatible in the sense of Pager. Merging weakly compatible states never
+    introduces reduce/reduce conflicts, so the table accepts the same language
+    as the canonical LR1 table with a state count close to LALR1. Merged states
+    are always constructed serially, since merges depend on the order in which
+    states are discovered.
+    """
+
+    table_cls = LR1ParsingTable
+    state_cls = LR1State
+    item_cls = LR1Item
+
+    def __init__(
+        self,
+        grammar: Grammar,
+        merge_states: bool = False,
+        simplify: bool = False,
+        prune: bool = False,
+    ) -> None:
+        super().__init__(grammar, simplify, prune)
+        self.merge_states = merge_states
+
+    def closure(self, items: set[LR1Item]) -> set[LR1Item]:
         """
-        Computes and returns the GOTO set for the given set of items.
+        Computes and returns the closure for the given set of items.
 
-        The goto operation creates a set where all items have the dot past the
-        given symbol.
+        The closure operation adds more items to a set of items when there
+        is a dot to the left of a non-terminal symbol.
+
+        Items with the same rule and position are merged into a single item with
+        the union of their lookaheads. When an item gains lookaheads, only the
+        new lookaheads are propagated further.
         """
-        _set: set[LR1Item] = set()
+        lookaheads: dict[tuple[Rule, int], int] = dict()
+        worklist: list[tuple[Rule, int, int]] = []
 
-        for item in items:
-            if item.dot_is_last() or item.after_dot != token:
-                continue
+        def merge(rule: Rule, position: int, bits: int) -> None:
+            key = (rule, position)
+            existing = lookaheads.get(key)
 
-            next_item = LR1Item(item.rule, item.position + 1, item.lookahead_token)
-            _set.add(next_item)
+            if existing is None:
+                lookaheads[key] = bits
+                worklist.append((rule, position, bits))
+                return
 
-        return self.closure(_set)
+            new = bits & ~existing
+            if new != 0:
+                lookaheads[key] = existing | new
+                worklist.append((rule, position, new))
 
-    def _get_related_items(
-        self, symbol: Token, next_symbol: Optional[Token], lookahead_token: Token
-    ) -> set[LR1Item]:
-        _set: set[LR1Item] = set()
+        for item in items:
+            merge(item.rule, item.position, item.lookaheads.bits)
 
-        if next_symbol is None:
-            lookaheads = (lookahead_token,)
-        else:
-            lookaheads = (next_symbol, lookahead_token)
+        while len(worklist) > 0:
+            rule, position, bits = worklist.pop()
+            if position == rule.rhs_len or rule.has_null_rhs():
+                continue
 
-        for rule in self.grammar.rules:
-            if rule.lhs != symbol:
+            symbol = rule.rhs[position]
+            if symbol.is_terminal:
                 continue
 
-            for s in self._first(*lookaheads):
-                _set.add(LR1Item(rule, 0, s))
+            rest = rule.rhs[position + 1 :]
+            _bits = self.analysis.first(*rest).bits
+            if self.analysis.nullable(*rest):
+                _bits |= bits
 
-                if rule.rhs_len == 1 and not rule.rhs[0].is_terminal:
-                    _set |= self._get_related_items(rule.rhs[0], None, s)
+            for related in self.grammar.productions(symbol):
+                merge(related, 0, _bits)
 
-        return _set
+        terminals, ids = self.grammar.terminals, self.grammar.symbol_ids
+        return {
+            LR1Item(r, p, TerminalSet(la, terminals, ids))
+            for (r, p), la in lookaheads.items()
+        }
+
+    def _advance(self, item: LR1Item) -> LR1Item:
+        return LR1Item(item.rule, item.position + 1, item.lookaheads)
 
     def _create_reduce_entries(self, states: set[LR1State]) -> set[Entry]:
         """
@@ -401,11 +1120,338 @@ class LR1Generator(Generator):
                 if not item.dot_is_last():
                     continue
 
-                entries.add(
-                    Entry(state, item.lookahead_token, Action.reduce(item.rule))
-                )
+                for token in item.lookaheads:
+                    entries.add(Entry(state, token, Action.reduce(item.rule)))
 
         return entries
 
+    def _checks_expanded_states(self) -> bool:
+        # merged states gain lookaheads after they are expanded
+        return not self.merge_states
+
+    def _reuses_reduce_entries(
+        self, grammar: CompiledGrammar, analysis: GrammarAnalysis
+    ) -> bool:
+        # the lookaheads of merged states depend on the states merged into them
+        return not self.merge_states
+
     def _create_initial_items(self) -> set[LR1Item]:
-        return self.closure({LR1Item(self.grammar.starting_rule, 0, Token.eof())})
+        lookaheads = self.grammar.terminal_set({Token.eof()})
+        return self.closure({LR1Item(self.grammar.starting_rule, 0, lookaheads)})
+
+    def _create_states_and_shift_entries(
+        self,
+        workers: int = 1,
+        hooks: Optional["_Hooks"] = None,
+        memo: Optional["_Memo"] = None,
+    ) -> tuple[set[LR1State], set[Entry]]:
+        if hooks is None:
+            hooks = _Hooks()
+        if memo is None:
+            memo = _Memo()
+
+        if not self.merge_states:
+            return super()._create_states_and_shift_entries(workers, hooks, memo)
+
+        return self._create_merged_states_and_shift_entries(hooks, memo)
+
+    def _create_merged_states_and_shift_entries(
+        self, hooks: "_Hooks", memo: "_Memo"
+    ) -> tuple[set[LR1State], set[Entry]]:
+        """
+        Computes and returns the states and entries for shift actions, merging
+        weakly compatible states with the same core.
+
+        States are kept as kernels, i.e. mappings of LR0 items to lookahead sets
+        as terminal bitmasks.
+        When the kernel of a successor is merged into an existing state and adds
+        lookaheads to it, the state is expanded again so that the new lookaheads
+        reach its successors. States left unreachable by merges are dropped and
+        the remaining states are numbered in breadth-first order. Closures of
+        kernels found in `memo` are not computed again; successors are always
+        computed, since the targets of merged states grow with merges.
+        """
+        kernels: list[dict[LR0Item, int]] = []
+        closures: list[set[LR1Item]] = []
+        transitions: list[dict[Token, int]] = []
+        by_core: dict[frozenset[LR0Item], list[int]] = dict()
+
+        def add(kernel: dict[LR0Item, int]) -> int:
+            kernels.append(kernel)
+            closures.append(set())
+            transitions.append(dict())
+            by_core.setdefault(frozenset(kernel), []).append(len(kernels) - 1)
+            return len(kernels) - 1
+
+        terminals, ids = self.grammar.terminals, self.grammar.symbol_ids
+        start = LR0Item(self.grammar.starting_rule, 0)
+        worklist = deque([add({start: self.grammar.terminal_set({Token.eof()}).bits})])
+        queued = {0}
+
+        while len(worklist) > 0:
+            index = worklist.popleft()
+            queued.discard(index)
+
+            kernel = frozenset(
+                LR1Item(core.rule, core.position, TerminalSet(la, terminals, ids))
+                for core, la in kernels[index].items()
+            )
+            items = memo.closure(kernel)
+            if items is None:
+                items = self.closure(kernel)
+                hooks.count_closure()
+            closures[index] = items
+
+            successors = self._successor_kernels(items)
+            hooks.count_gotos(len(successors))
+            for symbol, _kernel in successors.items():
+                kernel = {
+                    LR0Item(item.rule, item.position): item.lookaheads.bits
+                    for item in _kernel
+                }
+                target = self._find_compatible(kernel, kernels, by_core)
+
+                if target is None:
+                    target = add(kernel)
+                    worklist.append(target)
+                    queued.add(target)
+                elif self._merge_kernel(kernel, kernels[target]):
+                    if target not in queued:
+                        worklist.append(target)
+                        queued.add(target)
+
+                transitions[index][symbol] = target
+
+        return self._number_merged_states(closures, transitions)
+
+    def _find_compatible(
+        self,
+        kernel: dict[LR0Item, int],
+        kernels: list[dict[LR0Item, int]],
+        by_core: dict[frozenset[LR0Item], list[int]],
+    ) -> Optional[int]:
+        """
+        Returns the index of an existing state the given kernel can be merged
+        into, preferring a state that already contains all its lookaheads.
+        """
+        candidates = by_core.get(frozenset(kernel), [])
+
+        for index in candidates:
+            if all(la & ~kernels[index][core] == 0 for core, la in kernel.items()):
+                return index
+
+        for index in candidates:
+            if _weakly_compatible(kernel, kernels[index]):
+                return index
+
+        return None
+
+    @staticmethod
+    def _merge_kernel(kernel: dict[LR0Item, int], into: dict[LR0Item, int]) -> bool:
+        """
+        Adds the lookaheads of `kernel` to `into`. Returns True if any lookahead
+        was added, False otherwise.
+        """
+        changed = False
+        for core, lookaheads in kernel.items():
+            if lookaheads & ~into[core] != 0:
+                into[core] |= lookaheads
+                changed = True
+
+        return changed
+
+    def _number_merged_states(
+        self, closures: list[set[LR1Item]], transitions: list[dict[Token, int]]
+    ) -> tuple[set[LR1State], set[Entry]]:
+        states: dict[int, LR1State] = dict()
+
+        def state_of(index: int) -> LR1State:
+            state = states.get(index)
+            if state is None:
+                state = self.state_cls.from_items(closures[index])
+                state.set_number(len(states) + 1)
+                states[index] = state
+                worklist.append(index)
+
+            return state
+
+        EOF = Token.eof()
+        entries: set[Entry] = set()
+        worklist: deque[int] = deque()
+        state_of(0)
+        while len(worklist) > 0:
+            index = worklist.popleft()
+            state = states[index]
+
+            if any(item.after_dot == EOF for item in state.items):
+                state.set_final()
+
+            symbols = sorted(transitions[index], key=self.grammar.symbol_id)
+            for symbol in symbols:
+                target = state_of(transitions[index][symbol])
+                entries.add(Entry(state, symbol, Action.shift(target)))
+
+        return set(states.values()), entries
+
+
+class _Hooks:
+    """
+    Callbacks of a single generation, passed down to the construction of the
+    automaton: closures and GOTO kernels are counted in `stats`, `progress` is
+    called with the number of closures after every closure and `check_state`
+    is called with every state expanded serially and its shift entries.
+    Without them the hooks do nothing.
+    """
+
+    def __init__(
+        self,
+        stats: Optional[GenerationStats] = None,
+        progress: Optional[Callable[[int], None]] = None,
+        check_state: Optional[Callable[[State, set[Entry]], None]] = None,
+    ) -> None:
+        self.stats = stats
+        self.progress = progress
+        self.check_state = check_state
+
+    def count_closure(self) -> None:
+        if self.stats is None:
+            return
+
+        self.stats.closure_calls += 1
+        if self.progress is not None:
+            self.progress(self.stats.closure_calls)
+
+    def count_gotos(self, gotos: int) -> None:
+        if self.stats is not None:
+            self.stats.goto_calls += gotos
+
+    def expanded(self, state: State, shift_entries: set[Entry]) -> None:
+        if self.check_state is not None:
+            self.check_state(state, shift_entries)
+
+
+class _Memo:
+    """
+    States of a previous generation that a generation can reuse, keyed by
+    kernel: the closures of the kernels, the successor kernels of the states
+    ordered by symbol id and the reduce and accept actions of the states, each
+    only where it is still valid. An empty memo reuses nothing.
+    """
+
+    def __init__(self) -> None:
+        self.closures: dict[frozenset[Item], frozenset[Item]] = dict()
+        self.successors: dict[frozenset[Item], dict[Token, frozenset[Item]]] = dict()
+        self.reductions: dict[frozenset[Item], list[tuple[Token, Action]]] = dict()
+
+    def closure(self, kernel: frozenset[Item]) -> Optional[frozenset[Item]]:
+        return self.closures.get(kernel)
+
+    def successors_of(
+        self, kernel: frozenset[Item]
+    ) -> Optional[dict[Token, frozenset[Item]]]:
+        return self.successors.get(kernel)
+
+    def reduce_entries(self, state: State) -> Optional[set[Entry]]:
+        actions = self.reductions.get(state.kernel)
+        if actions is None:
+            return None
+
+        return {Entry(state, token, action) for token, action in actions}
+
+
+# minimum number of new kernels per worker for a breadth-first level of the
+# automaton to be expanded in the process pool
+_PARALLEL_KERNELS = 32
+
+_worker_generator: Optional[Generator] = None
+
+
+def _init_worker(generator: Generator) -> None:
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _expand_kernel(
+    kernel: frozenset[Item],
+) -> tuple[set[Item], dict[Token, frozenset[Item]]]:
+    return _worker_generator._closure_and_successors(kernel)
+
+
+def _weakly_compatible(kernel: dict[LR0Item, int], other: dict[LR0Item, int]) -> bool:
+    """
+    Returns True if two kernels with the same core are weakly compatible, False
+    otherwise.
+
+    Kernels K and K' are weakly compatible if for every pair of distinct core
+    items i, j either no lookahead of i in K is a lookahead of j in K' and no
+    lookahead of j in K is a lookahead of i in K', or i and j already share a
+    lookahead in K or in K'.
+    """
+    cores = list(kernel)
+
+    for i, core_i in enumerate(cores):
+        for core_j in cores[i + 1 :]:
+            if kernel[core_i] & kernel[core_j] or other[core_i] & other[core_j]:
+                continue
+
+            if kernel[core_i] & other[core_j] or kernel[core_j] & other[core_i]:
+                return False
+
+    return True
+
+
+def _digraph(
+    nodes: Iterable[Hashable],
+    relation: dict[Hashable, Iterable[Hashable]],
+    initial: dict[Hashable, TerminalSet],
+) -> dict[Hashable, TerminalSet]:
+    """
+    Computes F(x) = F'(x) U {F(y) | x R y} for every node x, where F' is given by
+    `initial`, which must have a set for every node, and R by `relation`, with
+    the digraph algorithm of DeRemer and Pennello. Nodes in the same strongly
+    connected component of R end up with the same set. The traversal is
+    iterative so that long chains of the relation do not exhaust the recursion
+    limit.
+    """
+    infinity = float("inf")
+    depth: dict[Hashable, float] = {x: 0 for x in nodes}
+    result: dict[Hashable, TerminalSet] = {x: initial[x] for x in depth}
+    stack: list[Hashable] = []
+
+    for root in depth:
+        if depth[root] != 0:
+            continue
+
+        stack.append(root)
+        depth[root] = len(stack)
+        frames = [(root, iter(relation.get(root, ())), len(stack))]
+
+        while len(frames) > 0:
+            x, edges, d = frames[-1]
+
+            for y in edges:
+                if depth[y] == 0:
+                    stack.append(y)
+                    depth[y] = len(stack)
+                    frames.append((y, iter(relation.get(y, ())), len(stack)))
+                    break
+
+                depth[x] = min(depth[x], depth[y])
+                result[x] = result[x] | result[y]
+            else:
+                frames.pop()
+
+                if depth[x] == d:
+                    while True:
+                        top = stack.pop()
+                        depth[top] = infinity
+                        result[top] = result[x]
+                        if top == x:
+                            break
+
+                if len(frames) > 0:
+                    parent = frames[-1][0]
+                    depth[parent] = min(depth[parent], depth[x])
+                    result[parent] = result[parent] | result[x]
+
+    return result
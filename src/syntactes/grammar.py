@@ -1,6 +1,18 @@
-from typing import Iterable
+from enum import Enum
+from typing import Iterable, Optional
 
 from syntactes import Rule, Token
+from syntactes._action import ActionType
+from syntactes._terminal_set import TerminalSet
+
+
+class Associativity(Enum):
+    LEFT = "left"
+    RIGHT = "right"
+    NONASSOC = "nonassoc"
+
+
+Precedence = tuple[tuple[Associativity, tuple[Token, ...]], ...]
 
 
 class Grammar:
@@ -11,11 +23,257 @@ class Grammar:
     """
 
     def __init__(
-        self, starting_rule: Rule, rules: Iterable[Rule], tokens: set[Token]
+        self,
+        starting_rule: Rule,
+        rules: Iterable[Rule],
+        tokens: set[Token],
+        precedence: Iterable[tuple[Associativity, Iterable[Token]]] = (),
     ) -> None:
         """
         `starting_rule` should also be included in `rules`.
+
+        `precedence` declares the precedence and associativity of terminals, like
+        `%left`, `%right` and `%nonassoc` in yacc: a level of terminals with the
+        same associativity per declaration, from the lowest to the highest
+        precedence. Generators resolve the shift/reduce conflicts between a
+        terminal and a rule that both have a precedence, see
+        `CompiledGrammar.resolve_shift_reduce`.
         """
         self.starting_rule = starting_rule
         self.rules = rules
         self.tokens = tokens
+        self.precedence: Precedence = tuple(
+            (associativity, tuple(terminals)) for associativity, terminals in precedence
+        )
+
+    def compile(self) -> "CompiledGrammar":
+        """
+        Returns the indexed, immutable form of the grammar.
+        """
+        return CompiledGrammar(
+            self.starting_rule, self.rules, self.tokens, self.precedence
+        )
+
+
+class GrammarDiff:
+    """
+    An edit of a grammar, i.e. rules added to and rules removed from it.
+    """
+
+    def __init__(
+        self, added: Iterable[Rule] = (), removed: Iterable[Rule] = ()
+    ) -> None:
+        self.added: tuple[Rule, ...] = tuple(added)
+        self.removed: tuple[Rule, ...] = tuple(removed)
+
+    def apply(self, grammar: Grammar) -> Grammar:
+        """
+        Returns the grammar with the removed rules dropped and the added rules
+        appended. The symbols of the added rules are added to the tokens.
+        """
+        removed = set(self.removed)
+        if grammar.starting_rule in removed:
+            raise ValueError("The starting rule cannot be removed.")
+
+        rules = [r for r in grammar.rules if r not in removed]
+        rules.extend(r for r in self.added if r not in rules)
+
+        tokens = set(grammar.tokens)
+        for rule in self.added:
+            tokens.add(rule.lhs)
+            tokens.update(rule.rhs)
+        tokens.discard(Token.null())
+
+        return Grammar(grammar.starting_rule, rules, tokens, grammar.precedence)
+
+    def changed_symbols(self) -> set[Token]:
+        """
+        Returns the non-terminals whose productions are changed.
+        """
+        return {rule.lhs for rule in self.added + self.removed}
+
+    def affected_symbols(self, grammar: Grammar) -> set[Token]:
+        """
+        Returns the non-terminals of the given grammar, before or after the edit,
+        whose productions, FIRST set or nullability may be changed by the edit,
+        i.e. the changed symbols and the non-terminals that can derive them.
+        """
+        rules = set(grammar.rules) | set(self.added)
+        affected = self.changed_symbols()
+
+        changed = True
+        while changed:
+            changed = False
+
+            for rule in rules:
+                if rule.lhs in affected:
+                    continue
+
+                if any(s in affected for s in rule.rhs):
+                    affected.add(rule.lhs)
+                    changed = True
+
+        return affected
+
+
+class CompiledGrammar(Grammar):
+    """
+    Indexed, immutable form of a grammar.
+
+    The rules are frozen into a tuple and indexed by their left-hand side. Every
+    symbol and every rule is given a dense integer id; terminals are numbered
+    before non-terminals and symbols are ordered by their string representation,
+    so ids do not depend on the iteration order of the given rules and tokens.
+    The id of a terminal is also its bit in a `TerminalSet`.
+
+    The null token is not a symbol of the grammar; it only marks empty
+    right-hand sides.
+
+    Terminals with a declared precedence are mapped to their level, from 1 for
+    the lowest, and their associativity.
+    """
+
+    def __init__(
+        self,
+        starting_rule: Rule,
+        rules: Iterable[Rule],
+        tokens: set[Token],
+        precedence: Iterable[tuple[Associativity, Iterable[Token]]] = (),
+    ) -> None:
+        self.starting_rule = starting_rule
+        self.rules: tuple[Rule, ...] = tuple(rules)
+        self.tokens: frozenset[Token] = frozenset(tokens)
+        self.precedence: Precedence = tuple(
+            (associativity, tuple(terminals)) for associativity, terminals in precedence
+        )
+
+        self.levels: dict[Token, tuple[int, Associativity]] = dict()
+        for level, (associativity, terminals) in enumerate(self.precedence, 1):
+            for terminal in terminals:
+                if not terminal.is_terminal:
+                    raise ValueError(
+                        f"Precedence of non-terminal '{terminal}' cannot be declared."
+                    )
+                if terminal in self.levels:
+                    raise ValueError(
+                        f"Precedence of terminal '{terminal}' is declared twice."
+                    )
+                self.levels[terminal] = (level, associativity)
+
+        symbols = set(self.tokens)
+        for rule in self.rules:
+            symbols.add(rule.lhs)
+            symbols.update(rule.rhs)
+        symbols.discard(Token.null())
+
+        self.terminals: tuple[Token, ...] = tuple(
+            sorted(s for s in symbols if s.is_terminal)
+        )
+        self.non_terminals: tuple[Token, ...] = tuple(
+            sorted(s for s in symbols if not s.is_terminal)
+        )
+        self.symbols: tuple[Token, ...] = self.terminals + self.non_terminals
+        self.symbol_ids: dict[Token, int] = {s: i for i, s in enumerate(self.symbols)}
+        self.rule_ids: dict[Rule, int] = dict()
+        for i, rule in enumerate(self.rules):
+            self.rule_ids.setdefault(rule, i)
+
+        rules_by_lhs: dict[Token, list[Rule]] = {s: [] for s in self.non_terminals}
+        occurrences: dict[Token, list[tuple[Rule, int]]] = {s: [] for s in symbols}
+        for rule in self.rules:
+            rules_by_lhs[rule.lhs].append(rule)
+
+            for position, symbol in enumerate(rule.rhs):
+                if symbol in occurrences:
+                    occurrences[symbol].append((rule, position))
+
+        self.rules_by_lhs: dict[Token, tuple[Rule, ...]] = {
+            s: tuple(r) for s, r in rules_by_lhs.items()
+        }
+        self.occurrences: dict[Token, tuple[tuple[Rule, int], ...]] = {
+            s: tuple(o) for s, o in occurrences.items()
+        }
+
+    def compile(self) -> "CompiledGrammar":
+        return self
+
+    def productions(self, symbol: Token) -> tuple[Rule, ...]:
+        """
+        Returns the rules where `symbol` is the left-hand side.
+        """
+        return self.rules_by_lhs.get(symbol, ())
+
+    def occurrences_of(self, symbol: Token) -> tuple[tuple[Rule, int], ...]:
+        """
+        Returns the (rule, position) pairs where `symbol` appears in the
+        right-hand side of a rule.
+        """
+        return self.occurrences.get(symbol, ())
+
+    def symbol_id(self, symbol: Token) -> int:
+        """
+        Returns the id of the given symbol.
+        """
+        return self.symbol_ids[symbol]
+
+    def terminal_set(self, tokens: Iterable[Token] = ()) -> TerminalSet:
+        """
+        Returns the set of the given terminals as a `TerminalSet`.
+        """
+        bits = 0
+        for token in tokens:
+            bits |= 1 << self.symbol_ids[token]
+
+        return TerminalSet(bits, self.terminals, self.symbol_ids)
+
+    def rule_id(self, rule: Rule) -> int:
+        """
+        Returns the id of the given rule, i.e. its position in `rules`.
+        """
+        return self.rule_ids[rule]
+
+    def precedence_token(self, rule: Rule) -> Optional[Token]:
+        """
+        Returns the terminal whose precedence the given rule takes: its
+        `precedence` terminal if it has one, or else the last terminal of its
+        right-hand side that has a precedence. Returns None if there is none.
+        """
+        if rule.precedence is not None:
+            return rule.precedence
+
+        for symbol in reversed(rule.rhs):
+            if symbol in self.levels:
+                return symbol
+
+        return None
+
+    def resolve_shift_reduce(self, rule: Rule, token: Token) -> Optional[ActionType]:
+        """
+        Resolves the conflict between shifting `token` and reducing `rule`, as
+        yacc does: the action with the higher precedence is taken and, if the
+        precedences are the same, the associativity of the terminal decides,
+        i.e. reduce if left, shift if right and neither if non-associative.
+
+        Returns the action type to keep, `ActionType.REJECT` if neither is kept,
+        or None if the terminal or the rule has no precedence.
+        """
+        token_precedence = self.levels.get(token)
+        rule_token = self.precedence_token(rule)
+        rule_precedence = self.levels.get(rule_token) if rule_token else None
+        if token_precedence is None or rule_precedence is None:
+            return None
+
+        (token_level, associativity), (rule_level, _) = (
+            token_precedence,
+            rule_precedence,
+        )
+        if rule_level > token_level:
+            return ActionType.REDUCE
+        if rule_level < token_level:
+            return ActionType.SHIFT
+
+        return {
+            Associativity.LEFT: ActionType.REDUCE,
+            Associativity.RIGHT: ActionType.SHIFT,
+            Associativity.NONASSOC: ActionType.REJECT,
+        }[associativity]
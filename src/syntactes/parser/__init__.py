@@ -1,3 +1,4 @@
 from .exception import NotAcceptedError, ParserError, UnexpectedTokenError
 from .execute import ExecutablesRegistry, execute_on
-from .parser import LR0Parser, SLRParser, LR1Parser
+from .parser import LR0Parser, SLRParser, LALR1Parser, LR1Parser
+from .compiled import CompiledParser, CompressedParser
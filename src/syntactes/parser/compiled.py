@@ -0,0 +1,230 @@
+from typing import Iterable, Optional, Type
+
+from syntactes import Grammar, LR1Generator, Token
+from syntactes.cache import TableCache
+from syntactes.parser import (
+    ExecutablesRegistry,
+    NotAcceptedError,
+    UnexpectedTokenError,
+)
+from syntactes.parsing_table import CompiledParsingTable, CompressedParsingTable
+from syntactes.parsing_table.compiled import ACCEPT
+
+
+class CompiledParser:
+    """
+    Parser that runs on a `CompiledParsingTable`. States and symbols are ints and
+    actions are read from flat int arrays, so a step of the parser does a single
+    dict lookup, for the id of the received token, and array indexing.
+
+    Accepts the same streams, raises the same errors and calls the same
+    executables as the parser of the table that was compiled.
+    """
+
+    generator_cls: Type = LR1Generator
+
+    def __init__(self, table: CompiledParsingTable) -> None:
+        self._table = table
+
+    @classmethod
+    def from_grammar(
+        cls, grammar: Grammar, cache: Optional[TableCache] = None
+    ) -> "CompiledParser":
+        """
+        Create a parser for the given grammar, with the table generated by
+        `generator_cls`.
+
+        If a `cache` is given, the parsing table is taken from the cache, or
+        generated and cached if it is not cached.
+        """
+        if cache is None:
+            parsing_table = cls.generator_cls(grammar).generate()
+        else:
+            parsing_table = cache.get_or_generate(grammar, cls.generator_cls)
+
+        return cls(cls._compile(parsing_table))
+
+    @staticmethod
+    def _compile(parsing_table):
+        return parsing_table.compile()
+
+    def parse(self, stream: Iterable[Token]) -> None:
+        """
+        Parses the given stream of tokens. Expects the EOF token as the last one.
+
+        Raises `syntactes.parser.UnexpectedTokenError` if an unexpected token is
+        received.
+
+        Raises `syntactes.parser.NotAcceptedError` if the stream of token has been
+        parsed and the parser did not receive an accept action.
+        """
+        table = self._table
+        action, goto, final = table.action, table.goto, table.final
+        n_terminals, n_non_terminals = table.n_terminals, table.n_non_terminals
+        symbol_ids = table.symbol_ids
+        rule_lhs, rule_lengths = table.rule_lhs, table.rule_lengths
+        lhs_tokens = [rule.lhs for rule in table.rules]
+        origins = table.origins
+        executables = [
+            ExecutablesRegistry.get(origins.get(rule, rule)) for rule in table.rules
+        ]
+
+        states = [table.initial_state]
+        tokens = []
+        token = None
+
+        for token in stream:
+            symbol_id = symbol_ids.get(token)
+            if symbol_id is None:
+                raise UnexpectedTokenError(token, table.expected_tokens(states[-1]))
+
+            while True:
+                state = states[-1]
+                if symbol_id < n_terminals:
+                    cell = action[(state - 1) * n_terminals + symbol_id]
+                else:
+                    non_terminal = symbol_id - n_terminals
+                    cell = goto[(state - 1) * n_non_terminals + non_terminal]
+
+                if cell > 0:  # shift
+                    tokens.append(token)
+                    states.append(cell)
+                    break
+
+                if cell == 0:
+                    raise UnexpectedTokenError(token, table.expected_tokens(state))
+
+                if cell == ACCEPT:
+                    break
+
+                # reduce; the token is not consumed
+                rule_id = -cell - 1
+                length = rule_lengths[rule_id]
+                if length > 0:
+                    args = tokens[: -length - 1 : -1]
+                    del tokens[-length:]
+                    del states[-length:]
+                else:
+                    args = ()
+                tokens.append(lhs_tokens[rule_id])
+
+                executables[rule_id](*args)
+
+                lhs = rule_lhs[rule_id]
+                target = goto[(states[-1] - 1) * n_non_terminals + lhs]
+                if target == 0:
+                    raise UnexpectedTokenError(
+                        lhs_tokens[rule_id], table.expected_tokens(states[-1])
+                    )
+                states.append(target)
+
+        if token != Token.eof():
+            raise NotAcceptedError("Expected EOF token. ")
+
+        if not final[states[-1] - 1]:
+            raise UnexpectedTokenError(Token.eof(), table.expected_tokens(states[-1]))
+
+
+class CompressedParser(CompiledParser):
+    """
+    Parser that runs on a `CompressedParsingTable`, with the same loop as
+    `CompiledParser` but action and goto lookups through the base, check and
+    next arrays and the default reductions of the table.
+    """
+
+    def __init__(self, table: CompressedParsingTable) -> None:
+        self._table = table
+        # the default lookaheads of every state as an int bitmask, which is
+        # cheaper to test than the packed bytes of the table
+        size = table.lookahead_bytes
+        self._lookahead_masks = [
+            int.from_bytes(table.default_lookaheads[i : i + size], "little")
+            for i in range(0, len(table.default_lookaheads), size)
+        ]
+
+    @staticmethod
+    def _compile(parsing_table):
+        return parsing_table.compress()
+
+    def parse(self, stream: Iterable[Token]) -> None:
+        """
+        Parses the given stream of tokens. Expects the EOF token as the last one.
+
+        Raises `syntactes.parser.UnexpectedTokenError` if an unexpected token is
+        received.
+
+        Raises `syntactes.parser.NotAcceptedError` if the stream of token has been
+        parsed and the parser did not receive an accept action.
+        """
+        table = self._table
+        action_base, action_check = table.action_base, table.action_check
+        action_next, default = table.action_next, table.default
+        lookahead_masks = self._lookahead_masks
+        goto_base, goto_check, goto_next = (
+            table.goto_base,
+            table.goto_check,
+            table.goto_next,
+        )
+        n_terminals, final = table.n_terminals, table.final
+        symbol_ids = table.symbol_ids
+        rule_lhs, rule_lengths = table.rule_lhs, table.rule_lengths
+        lhs_tokens = [rule.lhs for rule in table.rules]
+        origins = table.origins
+        executables = [
+            ExecutablesRegistry.get(origins.get(rule, rule)) for rule in table.rules
+        ]
+
+        states = [table.initial_state.number]
+        tokens = []
+        token = None
+
+        for token in stream:
+            symbol_id = symbol_ids.get(token)
+            if symbol_id is None:
+                raise UnexpectedTokenError(token, table.expected_tokens(states[-1]))
+
+            while True:
+                state = states[-1]
+                if symbol_id < n_terminals:
+                    if lookahead_masks[state] >> symbol_id & 1:
+                        cell = default[state]
+                    else:
+                        i = action_base[state] + symbol_id
+                        cell = action_next[i] if action_check[i] == state else 0
+                else:
+                    i = goto_base[state] + symbol_id - n_terminals
+                    cell = goto_next[i] if goto_check[i] == state else 0
+
+                if cell > 0:  # shift
+                    tokens.append(token)
+                    states.append(cell)
+                    break
+
+                if cell == 0:
+                    raise UnexpectedTokenError(token, table.expected_tokens(state))
+
+                if cell == ACCEPT:
+                    break
+
+                # reduce; the token is not consumed
+                rule_id = -cell - 1
+                length = rule_lengths[rule_id]
+                if length > 0:
+                    args = tokens[: -length - 1 : -1]
+                    del tokens[-length:]
+                    del states[-length:]
+                else:
+                    args = ()
+                tokens.append(lhs_tokens[rule_id])
+
+                executables[rule_id](*args)
+
+                # the state below the popped symbols of a reduced rule always has
+                # a goto with the left-hand side of the rule
+                states.append(goto_next[goto_base[states[-1]] + rule_lhs[rule_id]])
+
+        if token != Token.eof():
+            raise NotAcceptedError("Expected EOF token. ")
+
+        if not final[states[-1]]:
+            raise UnexpectedTokenError(Token.eof(), table.expected_tokens(states[-1]))
@@ -47,6 +47,13 @@ class ExecutablesRegistry:
         """
         return cls._registry.get(rule, lambda *_, **__: None)
 
+    @classmethod
+    def is_registered(cls, rule: Rule) -> bool:
+        """
+        Returns True if an executable is registered for the given rule.
+        """
+        return rule in cls._registry
+
     @classmethod
     def clear(cls) -> None:
         """
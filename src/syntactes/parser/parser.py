@@ -1,10 +1,18 @@
 from abc import ABC
 from collections import deque
-from typing import Iterable, Type
-
-from syntactes import Grammar, LR0Generator, LR1Generator, SLRGenerator, Token
+from typing import Iterable, Optional, Type
+
+from syntactes import (
+    Grammar,
+    LALR1Generator,
+    LR0Generator,
+    LR1Generator,
+    SLRGenerator,
+    Token,
+)
 from syntactes._action import Action, ActionType
 from syntactes._state import LR0State
+from syntactes.cache import TableCache
 from syntactes.parser import (
     ExecutablesRegistry,
     NotAcceptedError,
@@ -24,12 +32,20 @@ class Parser(ABC):
         self._token_stream: deque[Token] = deque()
 
     @classmethod
-    def from_grammar(cls, grammar: Grammar) -> "Parser":
+    def from_grammar(
+        cls, grammar: Grammar, cache: Optional[TableCache] = None
+    ) -> "Parser":
         """
         Create a parser for the given grammar.
+
+        If a `cache` is given, the parsing table is taken from the cache, or
+        generated and cached if it is not cached.
         """
-        generator = cls.generator_cls(grammar)
-        parsing_table = generator.generate()
+        if cache is None:
+            parsing_table = cls.generator_cls(grammar).generate()
+        else:
+            parsing_table = cache.get_or_generate(grammar, cls.generator_cls)
+
         parser = cls(parsing_table)
         return parser
 
@@ -64,29 +80,37 @@ class Parser(ABC):
             self._set_state(action.actionable)
         elif action.action_type == ActionType.REDUCE:
             rule = action.actionable
-            args = [self._token_stack.pop() for _ in reversed(rule.rhs)]
+            rhs_len = 0 if rule.has_null_rhs() else rule.rhs_len
+            args = [self._token_stack.pop() for _ in range(rhs_len)]
             self._token_stack.append(rule.lhs)
 
-            {self._state_stack.pop() for _ in rule.rhs}
+            {self._state_stack.pop() for _ in range(rhs_len)}
 
-            executable = ExecutablesRegistry.get(rule)
+            executable = ExecutablesRegistry.get(self._table.origins.get(rule, rule))
             executable(*args)
 
             self._token_stream.appendleft(token)  # reduce actions do not consume tokenA
 
-            shift = self._get_action(rule.lhs)
-            self._set_state(shift.actionable)
+            # gotos do not conflict, so the target is taken from the GOTO table
+            # without resolving conflicts
+            state = self._table.get_goto_state(self._get_state(), rule.lhs)
+            if state is None:
+                self._raise_unexpected(rule.lhs)
+            self._set_state(state)
 
     def _get_action(self, token: Token) -> Action:
         actions = self._table.get_actions(self._get_state(), token)
         if actions is None:
-            actions = self._table.get(self._get_state())
-            expected_tokens = [] if actions is None else list(actions.keys())
-            self._raise(UnexpectedTokenError(token, expected_tokens))
+            self._raise_unexpected(token)
 
         action = self._resolve_conflict(actions)
         return action
 
+    def _raise_unexpected(self, token: Token) -> None:
+        actions = self._table.get(self._get_state())
+        expected_tokens = [] if actions is None else list(actions.keys())
+        self._raise(UnexpectedTokenError(token, expected_tokens))
+
     def _resolve_conflict(self, actions: list[Action]) -> Action:
         return actions[0]
 
@@ -114,5 +138,9 @@ class SLRParser(Parser):
     generator_cls = SLRGenerator
 
 
+class LALR1Parser(Parser):
+    generator_cls = LALR1Generator
+
+
 class LR1Parser(Parser):
     generator_cls = LR1Generator
@@ -1,3 +1,12 @@
 from .entry import Entry
-from .conflict import Conflict, ConflictType
-from .table import LR0ParsingTable, SLRParsingTable, LR1ParsingTable, ParsingTable
+from .conflict import Conflict, ConflictError, ConflictType
+from .compiled import CompiledParsingTable
+from .compressed import CompressedParsingTable
+from .mapped import MappedParsingTable, MappedState
+from .table import (
+    LR0ParsingTable,
+    SLRParsingTable,
+    LALR1ParsingTable,
+    LR1ParsingTable,
+    ParsingTable,
+)
@@ -0,0 +1,112 @@
+from array import array
+
+from syntactes import Rule, Token
+from syntactes._action import Action, ActionType
+
+# Action cell of the accept action. Other cells are positive for shifts, holding
+# the number of the target state, negative for reduces, holding -(rule id + 1),
+# and 0 for errors.
+ACCEPT = -(2**31)
+
+
+class CompiledParsingTable:
+    """
+    Parsing table with states and symbols numbered by ints, for parsers that
+    run on ints.
+
+    Actions are held in the flat `array('i')` `action` of states x terminals and
+    gotos in the flat `array('i')` `goto` of states x non-terminals, with state
+    `s` and symbol `i` at index `(s - 1) * n + i`; non-terminals are indexed
+    from 0. Conflicting actions are resolved by taking the first one, as the
+    parser does. Symbol ids and rule ids are those of the compiled grammar.
+    `origins` is that of the given table.
+    """
+
+    def __init__(self, table) -> None:
+        grammar = table.grammar.compile()
+        self.origins: dict[Rule, Rule] = dict(table.origins)
+        self.symbols: tuple[Token, ...] = grammar.symbols
+        self.symbol_ids: dict[Token, int] = grammar.symbol_ids
+        self.rules: tuple[Rule, ...] = grammar.rules
+        self.n_terminals = len(grammar.terminals)
+        self.n_non_terminals = len(grammar.non_terminals)
+        self.n_states = max((s.number for s in table.rows), default=0)
+
+        # left-hand side as a non-terminal index and number of popped symbols
+        self.rule_lhs = array(
+            "i", (grammar.symbol_id(r.lhs) - self.n_terminals for r in self.rules)
+        )
+        self.rule_lengths = array(
+            "i", (0 if r.has_null_rhs() else r.rhs_len for r in self.rules)
+        )
+
+        self.action = array("i", [0] * (self.n_states * self.n_terminals))
+        self.goto = array("i", [0] * (self.n_states * self.n_non_terminals))
+        self.final = bytearray(self.n_states)
+
+        for state, row in table.rows.items():
+            self.final[state.number - 1] = state.is_final
+
+            for token, actions in row.items():
+                symbol_id = grammar.symbol_id(token)
+                if token.is_terminal:
+                    index = (state.number - 1) * self.n_terminals + symbol_id
+                    self.action[index] = _encode(actions[0], grammar)
+                else:
+                    symbol_id -= self.n_terminals
+                    index = (state.number - 1) * self.n_non_terminals + symbol_id
+                    self.goto[index] = actions[0].actionable.number
+
+    @property
+    def initial_state(self) -> int:
+        return 1
+
+    def get_action(self, state: int, symbol_id: int) -> int:
+        """
+        Returns the action cell of the given state with the given terminal.
+        """
+        return self.action[(state - 1) * self.n_terminals + symbol_id]
+
+    def get_goto(self, state: int, non_terminal: int) -> int:
+        """
+        Returns the target state of the given state with the given non-terminal,
+        indexed from 0, or 0 if there is none.
+        """
+        return self.goto[(state - 1) * self.n_non_terminals + non_terminal]
+
+    def expected_tokens(self, state: int) -> list[Token]:
+        """
+        Returns the tokens that the given state has an action or a goto with,
+        ordered by symbol id.
+        """
+        actions = self.action[(state - 1) * self.n_terminals : state * self.n_terminals]
+        gotos = self.goto[
+            (state - 1) * self.n_non_terminals : state * self.n_non_terminals
+        ]
+        expected = [self.symbols[i] for i, cell in enumerate(actions) if cell]
+        expected.extend(
+            self.symbols[self.n_terminals + i] for i, cell in enumerate(gotos) if cell
+        )
+
+        return expected
+
+    def nbytes(self) -> int:
+        """
+        Returns the number of bytes of the action, goto and final state arrays.
+        """
+        return (
+            self.action.itemsize * len(self.action)
+            + self.goto.itemsize * len(self.goto)
+            + len(self.final)
+        )
+
+
+def _encode(action: Action, grammar) -> int:
+    if action.action_type == ActionType.SHIFT:
+        return action.actionable.number
+    if action.action_type == ActionType.REDUCE:
+        return -(grammar.rule_id(action.actionable) + 1)
+    if action.action_type == ActionType.ACCEPT:
+        return ACCEPT
+
+    raise ValueError(f"Cannot encode action '{action}'.")
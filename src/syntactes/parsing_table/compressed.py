@@ -0,0 +1,312 @@
+from array import array
+from collections import Counter
+from typing import Optional
+
+from syntactes import Rule, Token
+from syntactes._action import Action
+from syntactes.parsing_table.compiled import ACCEPT, _encode
+from syntactes.parsing_table.entry import Row
+from syntactes.parsing_table.mapped import MappedState
+
+
+class CompressedParsingTable:
+    """
+    Parsing table compressed with row displacement and default reductions.
+
+    Each state keeps a default reduction, the reduce that fills most of its
+    terminal cells. Those cells are dropped and a bit per terminal records
+    which terminals the default reduction is taken with, so errors are detected
+    in the same state as with the uncompressed table.
+
+    The remaining action cells of a state `s` are placed in the shared
+    `action_next` array at `action_base[s] + terminal id`, where `action_check`
+    holds `s`, and the rows are overlapped so that no two cells land on the same
+    slot. Gotos are compressed the same way in `goto_base`, `goto_check` and
+    `goto_next`, with non-terminals indexed from 0. Cells are encoded as in
+    `CompiledParsingTable`; conflicting actions hold their first action and are
+    kept whole for `get_actions`.
+
+    The table implements the lookups the parser needs, i.e. `initial_state`,
+    `get_actions`, `get` and `get_goto_state`, with the same results as the
+    uncompressed table, and keeps the `origins` of the given table.
+    """
+
+    def __init__(self, table) -> None:
+        grammar = table.grammar.compile()
+        self.origins: dict[Rule, Rule] = dict(table.origins)
+        self.symbols: tuple[Token, ...] = grammar.symbols
+        self.symbol_ids: dict[Token, int] = grammar.symbol_ids
+        self.rules: tuple[Rule, ...] = grammar.rules
+        self.n_terminals = n_terminals = len(grammar.terminals)
+        self.n_non_terminals = len(grammar.non_terminals)
+        self.n_states = n_states = max((s.number for s in table.rows), default=0)
+
+        # left-hand side as a non-terminal index and number of popped symbols
+        self.rule_lhs = array(
+            "i", (grammar.symbol_id(r.lhs) - n_terminals for r in self.rules)
+        )
+        self.rule_lengths = array(
+            "i", (0 if r.has_null_rhs() else r.rhs_len for r in self.rules)
+        )
+
+        # per state arrays are indexed by the state number; index 0 is unused
+        self.final = bytearray(n_states + 1)
+        self.default = array("i", [0] * (n_states + 1))
+        self.lookahead_bytes = (n_terminals + 7) // 8
+        self.default_lookaheads = bytearray((n_states + 1) * self.lookahead_bytes)
+        self._conflicts: dict[tuple[int, int], list[Action]] = dict()
+
+        action_rows: dict[int, dict[int, int]] = dict()
+        goto_rows: dict[int, dict[int, int]] = dict()
+        for state, row in table.rows.items():
+            number = state.number
+            self.final[number] = state.is_final
+            actions = action_rows.setdefault(number, dict())
+            gotos = goto_rows.setdefault(number, dict())
+
+            for token, token_actions in row.items():
+                symbol_id = grammar.symbol_id(token)
+                if not token.is_terminal:
+                    target = token_actions[0].actionable.number
+                    gotos[symbol_id - n_terminals] = target
+                    continue
+
+                actions[symbol_id] = _encode(token_actions[0], grammar)
+                if len(token_actions) > 1:
+                    self._conflicts[(number, symbol_id)] = token_actions
+
+            self._set_default_reduction(number, actions)
+
+        self.action_base, self.action_check, self.action_next = _displace(
+            action_rows, n_states, n_terminals
+        )
+        self.goto_base, self.goto_check, self.goto_next = _displace(
+            goto_rows, n_states, self.n_non_terminals
+        )
+
+        self._states: dict[int, MappedState] = dict()
+        self._actions: dict[int, list[Action]] = dict()
+
+    @property
+    def initial_state(self) -> MappedState:
+        return self.state(1)
+
+    def state(self, number: int) -> MappedState:
+        """
+        Returns the state with the given number.
+        """
+        state = self._states.get(number)
+        if state is None:
+            state = MappedState(number, self.final[number] != 0)
+            self._states[number] = state
+
+        return state
+
+    def get_action(self, state: int, symbol_id: int) -> int:
+        """
+        Returns the action cell of the given state number with the given
+        terminal, or 0 if there is no action.
+        """
+        i = self.action_base[state] + symbol_id
+        if self.action_check[i] == state:
+            return self.action_next[i]
+
+        lookaheads = self.default_lookaheads[
+            state * self.lookahead_bytes + (symbol_id >> 3)
+        ]
+        if lookaheads >> (symbol_id & 7) & 1:
+            return self.default[state]
+
+        return 0
+
+    def get_goto(self, state: int, non_terminal: int) -> int:
+        """
+        Returns the target state of the given state number with the given
+        non-terminal, indexed from 0, or 0 if there is none.
+        """
+        i = self.goto_base[state] + non_terminal
+        if self.goto_check[i] == state:
+            return self.goto_next[i]
+
+        return 0
+
+    def get_actions(self, state: MappedState, token: Token) -> Optional[list[Action]]:
+        """
+        Get the actions from state with given number with `token`.
+        If there are no actions, returns None.
+        """
+        symbol_id = self.symbol_ids.get(token)
+        if symbol_id is None or not 1 <= state.number <= self.n_states:
+            return None
+
+        return self._get_actions(state.number, symbol_id)
+
+    def get(self, state: MappedState) -> Optional[Row]:
+        """
+        Get the mapping of tokens to actions for the given state number.
+        Returns None if the state is not found.
+        """
+        if not 1 <= state.number <= self.n_states:
+            return None
+
+        row = dict()
+        for symbol_id, symbol in enumerate(self.symbols):
+            actions = self._get_actions(state.number, symbol_id)
+            if actions is not None:
+                row[symbol] = actions
+
+        return row
+
+    def get_goto_state(self, state: MappedState, token: Token) -> Optional[MappedState]:
+        """
+        Get the target state of the goto from `state` with the non-terminal
+        `token`. If there is no goto, returns None.
+        """
+        symbol_id = self.symbol_ids.get(token)
+        if symbol_id is None or symbol_id < self.n_terminals:
+            return None
+
+        target = self.get_goto(state.number, symbol_id - self.n_terminals)
+        return None if target == 0 else self.state(target)
+
+    def expected_tokens(self, state: int) -> list[Token]:
+        """
+        Returns the tokens that the given state number has an action or a goto
+        with, ordered by symbol id.
+        """
+        expected = [
+            self.symbols[i]
+            for i in range(self.n_terminals)
+            if self.get_action(state, i)
+        ]
+        expected.extend(
+            self.symbols[self.n_terminals + i]
+            for i in range(self.n_non_terminals)
+            if self.get_goto(state, i)
+        )
+
+        return expected
+
+    def nbytes(self) -> int:
+        """
+        Returns the number of bytes of the arrays used for parsing.
+        """
+        arrays = (
+            self.action_base,
+            self.action_check,
+            self.action_next,
+            self.goto_base,
+            self.goto_check,
+            self.goto_next,
+            self.default,
+        )
+        return (
+            sum(a.itemsize * len(a) for a in arrays)
+            + len(self.default_lookaheads)
+            + len(self.final)
+        )
+
+    def dense_nbytes(self) -> int:
+        """
+        Returns the number of bytes of the arrays of the uncompressed table, as
+        laid out by `CompiledParsingTable`.
+        """
+        cells = self.n_states * (self.n_terminals + self.n_non_terminals)
+        return self.action_next.itemsize * cells + self.n_states
+
+    def compression_ratio(self) -> float:
+        """
+        Returns the size of the uncompressed arrays divided by the size of the
+        compressed arrays.
+        """
+        return self.dense_nbytes() / self.nbytes()
+
+    def _set_default_reduction(self, number: int, actions: dict[int, int]) -> None:
+        reduces = Counter(
+            cell
+            for symbol_id, cell in actions.items()
+            if cell < 0
+            and cell != ACCEPT
+            and (number, symbol_id) not in self._conflicts
+        )
+        if len(reduces) == 0:
+            return
+
+        default, _ = reduces.most_common(1)[0]
+        self.default[number] = default
+        for symbol_id in [s for s, cell in actions.items() if cell == default]:
+            if (number, symbol_id) in self._conflicts:
+                continue
+
+            del actions[symbol_id]
+            i = number * self.lookahead_bytes + (symbol_id >> 3)
+            self.default_lookaheads[i] |= 1 << (symbol_id & 7)
+
+    def _get_actions(self, number: int, symbol_id: int) -> Optional[list[Action]]:
+        if symbol_id >= self.n_terminals:
+            target = self.get_goto(number, symbol_id - self.n_terminals)
+            if target == 0:
+                return None
+
+            return [Action.shift(self.state(target))]
+
+        conflict = self._conflicts.get((number, symbol_id))
+        if conflict is not None:
+            return conflict
+
+        cell = self.get_action(number, symbol_id)
+        if cell == 0:
+            return None
+
+        actions = self._actions.get(cell)
+        if actions is None:
+            actions = [self._decode(cell)]
+            self._actions[cell] = actions
+
+        return actions
+
+    def _decode(self, cell: int) -> Action:
+        if cell > 0:
+            return Action.shift(self.state(cell))
+        if cell == ACCEPT:
+            return Action.accept()
+
+        return Action.reduce(self.rules[-cell - 1])
+
+
+def _displace(
+    rows: dict[int, dict[int, int]], n_states: int, n_columns: int
+) -> tuple[array, array, array]:
+    """
+    Overlaps the given sparse rows, i.e. maps of state numbers to maps of
+    columns to cells, with first-fit row displacement and returns the base,
+    check and next arrays. Denser rows are placed first. The arrays are padded
+    so that `base[s] + column` is in range for every state and column.
+    """
+    base = array("i", [0] * (n_states + 1))
+    occupied = 0  # bit i is set if slot i is taken
+    first_free = 0  # slots below are taken
+
+    for number, row in sorted(rows.items(), key=lambda r: (-len(r[1]), r[0])):
+        if len(row) == 0:
+            continue
+
+        columns = sum(1 << column for column in row)
+        offset = max(0, first_free - min(row))
+        while occupied & (columns << offset):
+            offset += 1
+
+        base[number] = offset
+        occupied |= columns << offset
+        while occupied >> first_free & 1:
+            first_free += 1
+
+    size = max(base) + n_columns
+    check = array("i", [0] * size)
+    next_ = array("i", [0] * size)
+    for number, row in rows.items():
+        for column, cell in row.items():
+            check[base[number] + column] = number
+            next_[base[number] + column] = cell
+
+    return base, check, next_
@@ -17,7 +17,6 @@ class Conflict:
         self.state = state
         self.token = token
         self.actions = actions
-        self._conflict_type = None
 
     def pretty_str(self) -> str:
         """
@@ -37,10 +36,9 @@ class Conflict:
 
     @property
     def conflict_type(self) -> ConflictType:
-        if self._conflict_type is None:
-            self._conflict_type = self._create_type()
-
-        return self._conflict_type
+        # computed on every access, since a table adds the actions of a cell to
+        # the list of its conflict after the conflict is created
+        return self._create_type()
 
     def _create_type(self) -> ConflictType:
         if not len(self.actions) > 1:
@@ -64,3 +62,19 @@ class Conflict:
 
     def __str__(self) -> str:
         return f"{self.state}, {self.token}, {self.actions}"
+
+
+class ConflictError(Exception):
+    """
+    A parsing table was generated with `fail_on_conflict` and a cell of the
+    table has more than one action.
+    """
+
+    def __init__(self, conflict: Conflict) -> None:
+        self.conflict = conflict
+        actions = ", ".join(map(str, conflict.actions))
+        msg = (
+            f"{conflict.conflict_type.value} conflict in state "
+            f"{conflict.state.number} with token '{conflict.token}': {actions}"
+        )
+        super().__init__(msg)
@@ -11,12 +11,24 @@ class Entry:
     """
     An entry of the parsing table. Holds the information of a transition from
     a state to another state via a symbol.
+
+    Entries are immutable; the hash is computed once on creation.
     """
 
+    __slots__ = ("from_state", "token", "action", "_hash")
+
     def __init__(self, from_state: LR0State, token: Token, action: Action) -> None:
-        self.from_state = from_state
-        self.token = token
-        self.action = action
+        _set = object.__setattr__
+        _set(self, "from_state", from_state)
+        _set(self, "token", token)
+        _set(self, "action", action)
+        _set(self, "_hash", hash((from_state, token, action)))
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __reduce__(self):
+        return (Entry, (self.from_state, self.token, self.action))
 
     def __repr__(self) -> str:
         return f"<Entry: {str(self)}>"
@@ -25,7 +37,7 @@ class Entry:
         return f"{self.from_state.number}, {self.action}, {self.token}"
 
     def __hash__(self) -> int:
-        return hash((self.from_state, self.token, self.action))
+        return self._hash
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, Entry):
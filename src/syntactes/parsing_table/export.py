@@ -0,0 +1,88 @@
+import csv
+from typing import TextIO
+
+from syntactes import Grammar, Token
+
+_NO_ACTION = "--"
+
+
+def write_text(table, grammar: Grammar, title: str, file: TextIO) -> None:
+    """
+    Writes the rules of the grammar and the given table to `file`, in the format
+    of `pretty_str`. The table is written a row at a time, in the order of the
+    state numbers.
+    """
+    rules = grammar.rules
+    rules_width = max(len(_rule_str(i, r)) for i, r in enumerate(rules))
+    file.write("GRAMMAR RULES\n" + "-" * rules_width + "\n")
+    for i, rule in enumerate(rules):
+        if i > 0:
+            file.write("\n")
+        file.write(_rule_str(i, rule))
+    file.write("\n" + "-" * rules_width + "\n\n")
+
+    tokens = sorted(grammar.tokens)
+    tokens_line = "|     |  " + "   |  ".join(map(str, tokens)) + "  |\n"
+    separator = "-" * len(tokens_line) + "\n"
+    file.write(title + "\n" + separator + tokens_line + separator)
+
+    for number, row in _numbered_rows(table):
+        cells = (_actions_str(row.get(token), _NO_ACTION) for token in tokens)
+        line = "|  " + str(number) + "  |  " + "  |  ".join(cells) + " |\n"
+        file.write(line + "-" * len(line) + "\n")
+
+
+def write_csv(table, grammar: Grammar, file: TextIO) -> None:
+    """
+    Writes the given table to `file` as CSV: a header with a `state` column and
+    a column per token, then a record per state in the order of the state
+    numbers. Actions of a cell are separated by commas and cells without actions
+    are empty.
+
+    `file` should be opened with `newline=""`, as for `csv.writer`.
+    """
+    tokens = sorted(grammar.tokens)
+    writer = csv.writer(file)
+    writer.writerow(["state"] + [str(token) for token in tokens])
+    for number, row in _numbered_rows(table):
+        writer.writerow(
+            [number] + [_actions_str(row.get(token), "") for token in tokens]
+        )
+
+
+def write_markdown(table, grammar: Grammar, file: TextIO) -> None:
+    """
+    Writes the given table to `file` as a Markdown table with a column per token
+    and a row per state, in the order of the state numbers. Cells without
+    actions are empty.
+    """
+    tokens = sorted(grammar.tokens)
+    file.write("| state | " + " | ".join(map(_markdown_token, tokens)) + " |\n")
+    file.write("|---:|" + ":---:|" * len(tokens) + "\n")
+    for number, row in _numbered_rows(table):
+        cells = (_actions_str(row.get(token), "") for token in tokens)
+        file.write("| " + str(number) + " | " + " | ".join(cells) + " |\n")
+
+
+def _numbered_rows(table):
+    """
+    Yields the state numbers and the rows of the table, ordered by number.
+    """
+    states = sorted(table.rows, key=lambda state: state.number)
+    for state in states:
+        yield state.number, table.rows[state]
+
+
+def _rule_str(number: int, rule) -> str:
+    return str(number) + ". " + str(rule)
+
+
+def _actions_str(actions, empty: str) -> str:
+    if not actions:
+        return empty
+
+    return ",".join(map(str, actions))
+
+
+def _markdown_token(token: Token) -> str:
+    return str(token).replace("|", "\\|")
@@ -0,0 +1,363 @@
+import mmap
+import struct
+import sys
+from array import array
+from os import PathLike
+from typing import Optional, Union
+
+from syntactes import Grammar, Rule, Token
+from syntactes._action import Action, ActionType
+from syntactes.parsing_table.entry import Row
+
+MAGIC = b"SYNT"
+VERSION = 1
+
+# magic, version, flags (reserved), states, terminals, non-terminals, rules, rhs
+# symbols, overflow cells, name bytes
+_HEADER = struct.Struct("<4sHHIIIIIII")
+
+# Kinds of action cells. A cell holds `(value << 2) | kind`; the value of a shift
+# is the number of the target state and the value of a reduce the id of the rule.
+# An OTHER cell with value 0 is the accept action; with value k > 0 it points to
+# the overflow section at offset k - 1, which holds the number of conflicting
+# actions followed by their cells.
+ERROR, SHIFT, REDUCE, OTHER = range(4)
+
+
+class MappedState:
+    """
+    Lightweight state of a memory-mapped parsing table. Holds only the number
+    of the state and whether it is final.
+    """
+
+    __slots__ = ("number", "is_final")
+
+    def __init__(self, number: int, is_final: bool) -> None:
+        self.number = number
+        self.is_final = is_final
+
+    def __repr__(self) -> str:
+        return f"<MappedState: {self.number}>"
+
+    def __str__(self) -> str:
+        return str(self.number)
+
+    def __hash__(self) -> int:
+        return self.number
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, MappedState):
+            return False
+
+        return self.number == other.number
+
+
+class MappedParsingTable:
+    """
+    Parsing table loaded from a file written by `LR0ParsingTable.dump`.
+
+    The file is memory-mapped and the action and goto arrays are read in place,
+    so loading does no work per table cell and processes that load the same
+    file share its pages. Only the symbols and the rules are created on load;
+    states and actions are created when they are first looked up.
+
+    The table implements the lookups the parser needs, i.e. `initial_state`,
+    `get_actions`, `get` and `get_goto_state`.
+    """
+
+    def __init__(self, path: Union[str, PathLike]) -> None:
+        with open(path, "rb") as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file
+                raise ValueError(f"Invalid parsing table file '{path}'.") from None
+
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError(f"Invalid parsing table file '{path}'.")
+
+        (
+            magic,
+            version,
+            _,
+            self.n_states,
+            self.n_terminals,
+            self.n_non_terminals,
+            n_rules,
+            n_rhs,
+            n_overflow,
+            n_name_bytes,
+        ) = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Invalid parsing table file '{path}'.")
+
+        n_symbols = self.n_terminals + self.n_non_terminals
+        sizes = (
+            n_symbols + 1,  # name offsets
+            n_rules,  # rule left-hand sides
+            n_rules,  # rule numbers
+            n_rules + 1,  # rule right-hand side offsets
+            n_rhs,  # rule right-hand sides
+            self.n_states,  # final flags
+            self.n_states * self.n_terminals,  # actions
+            self.n_states * self.n_non_terminals,  # gotos
+            n_overflow,  # conflicting actions
+        )
+        if _HEADER.size + 4 * sum(sizes) + n_name_bytes != len(self._mmap):
+            raise ValueError(f"Invalid parsing table file '{path}'.")
+
+        offset = _HEADER.size
+        sections = []
+        for size in sizes:
+            sections.append(self._ints(offset, size))
+            offset += 4 * size
+
+        (
+            name_offsets,
+            rule_lhs,
+            rule_numbers,
+            rhs_offsets,
+            rhs,
+            self.final,
+            self.action,
+            self.goto,
+            self.overflow,
+        ) = sections
+
+        names = bytes(self._mmap[offset : offset + n_name_bytes]).decode()
+        self.symbols = [
+            Token(names[name_offsets[i] : name_offsets[i + 1]], i < self.n_terminals)
+            for i in range(n_symbols)
+        ]
+        self.symbol_ids = {
+            (s.symbol, s.is_terminal): i for i, s in enumerate(self.symbols)
+        }
+
+        null = Token.null()
+        self.rules = [
+            Rule(
+                rule_numbers[i],
+                self.symbols[rule_lhs[i]],
+                *(
+                    null if s < 0 else self.symbols[s]
+                    for s in rhs[rhs_offsets[i] : rhs_offsets[i + 1]]
+                ),
+            )
+            for i in range(n_rules)
+        ]
+        # tables with origins are not dumped
+        self.origins: dict[Rule, Rule] = dict()
+
+        self._states: dict[int, MappedState] = dict()
+        self._actions: dict[int, list[Action]] = dict()
+
+    @property
+    def initial_state(self) -> MappedState:
+        return self.state(1)
+
+    def state(self, number: int) -> MappedState:
+        """
+        Returns the state with the given number.
+        """
+        state = self._states.get(number)
+        if state is None:
+            state = MappedState(number, self.final[number - 1] != 0)
+            self._states[number] = state
+
+        return state
+
+    def get_actions(self, state: MappedState, token: Token) -> Optional[list[Action]]:
+        """
+        Get the actions from state with given number with `token`.
+        If there are no actions, returns None.
+        """
+        symbol_id = self.symbol_ids.get((token.symbol, token.is_terminal))
+        if symbol_id is None:
+            return None
+
+        return self._get_actions(state.number, symbol_id)
+
+    def get(self, state: MappedState) -> Optional[Row]:
+        """
+        Get the mapping of tokens to actions for the given state number.
+        Returns None if the state is not found.
+        """
+        if not 1 <= state.number <= self.n_states:
+            return None
+
+        row = dict()
+        for symbol_id, symbol in enumerate(self.symbols):
+            actions = self._get_actions(state.number, symbol_id)
+            if actions is not None:
+                row[symbol] = actions
+
+        return row
+
+    def get_goto_state(self, state: MappedState, token: Token) -> Optional[MappedState]:
+        """
+        Get the target state of the goto from `state` with the non-terminal
+        `token`. If there is no goto, returns None.
+        """
+        symbol_id = self.symbol_ids.get((token.symbol, token.is_terminal))
+        if symbol_id is None or symbol_id < self.n_terminals:
+            return None
+
+        target = self.goto[
+            (state.number - 1) * self.n_non_terminals + symbol_id - self.n_terminals
+        ]
+        return None if target == 0 else self.state(target)
+
+    def close(self) -> None:
+        """
+        Releases the memory map. The table cannot be used afterwards.
+        """
+        self.final = self.action = self.goto = self.overflow = None
+        self._mmap.close()
+
+    def _get_actions(self, number: int, symbol_id: int) -> Optional[list[Action]]:
+        if symbol_id >= self.n_terminals:
+            target = self.goto[
+                (number - 1) * self.n_non_terminals + symbol_id - self.n_terminals
+            ]
+            if target == 0:
+                return None
+
+            return [Action.shift(self.state(target))]
+
+        cell = self.action[(number - 1) * self.n_terminals + symbol_id]
+        if cell == 0:
+            return None
+
+        actions = self._actions.get(cell)
+        if actions is None:
+            actions = self._decode(cell)
+            self._actions[cell] = actions
+
+        return actions
+
+    def _decode(self, cell: int) -> list[Action]:
+        kind, value = cell & 3, cell >> 2
+
+        if kind == SHIFT:
+            return [Action.shift(self.state(value))]
+        if kind == REDUCE:
+            return [Action.reduce(self.rules[value])]
+        if value == 0:
+            return [Action.accept()]
+
+        count = self.overflow[value - 1]
+        cells = self.overflow[value : value + count]
+        return [action for c in cells for action in self._decode(c)]
+
+    def _ints(self, offset: int, size: int):
+        view = memoryview(self._mmap)[offset : offset + 4 * size]
+        if sys.byteorder == "little":
+            return view.cast("i")
+
+        swapped = array("i", view)
+        swapped.byteswap()
+        return swapped
+
+
+def dump_table(table, grammar: Grammar, path: Union[str, PathLike]) -> None:
+    """
+    Writes the given table in the binary format read by `MappedParsingTable`.
+
+    The layout is a little-endian header followed by int32 sections: symbol name
+    offsets, rule left-hand sides, numbers and right-hand sides, final state
+    flags, the action array of states x terminals, the goto array of states x
+    non-terminals and the overflow cells of conflicting actions, and finally the
+    UTF-8 symbol names.
+    """
+    grammar = grammar.compile()
+    symbols = grammar.symbols
+    n_terminals = len(grammar.terminals)
+    n_non_terminals = len(grammar.non_terminals)
+    rules = grammar.rules
+    n_states = max((s.number for s in table.rows), default=0)
+
+    # offsets are counted in characters of the decoded names
+    names = "".join(symbol.symbol for symbol in symbols).encode()
+    name_offsets = array("i", [0])
+    for symbol in symbols:
+        name_offsets.append(name_offsets[-1] + len(symbol.symbol))
+
+    rule_lhs = array("i", (grammar.symbol_id(r.lhs) for r in rules))
+    rule_numbers = array("i", (r.number for r in rules))
+    rhs_offsets = array("i", [0])
+    rhs = array("i")
+    for rule in rules:
+        rhs.extend(-1 if s == Token.null() else grammar.symbol_id(s) for s in rule.rhs)
+        rhs_offsets.append(len(rhs))
+
+    final = array("i", [0] * n_states)
+    action = array("i", [0] * (n_states * n_terminals))
+    goto = array("i", [0] * (n_states * n_non_terminals))
+    overflow = array("i")
+
+    def encode(a: Action) -> int:
+        if a.action_type == ActionType.SHIFT:
+            return (a.actionable.number << 2) | SHIFT
+        if a.action_type == ActionType.REDUCE:
+            return (grammar.rule_id(a.actionable) << 2) | REDUCE
+        if a.action_type == ActionType.ACCEPT:
+            return OTHER
+
+        raise ValueError(f"Cannot encode action '{a}'.")
+
+    for state, row in table.rows.items():
+        final[state.number - 1] = int(state.is_final)
+
+        for token, actions in row.items():
+            symbol_id = grammar.symbol_id(token)
+
+            if not token.is_terminal:
+                if len(actions) > 1:
+                    raise ValueError(
+                        f"Cannot encode conflicting gotos of state {state.number}"
+                        f" on '{token}'."
+                    )
+                index = (state.number - 1) * n_non_terminals + symbol_id - n_terminals
+                goto[index] = actions[0].actionable.number
+                continue
+
+            if len(actions) == 1:
+                cell = encode(actions[0])
+            else:
+                cell = ((len(overflow) + 1) << 2) | OTHER
+                overflow.append(len(actions))
+                overflow.extend(encode(a) for a in actions)
+
+            action[(state.number - 1) * n_terminals + symbol_id] = cell
+
+    sections = (
+        name_offsets,
+        rule_lhs,
+        rule_numbers,
+        rhs_offsets,
+        rhs,
+        final,
+        action,
+        goto,
+        overflow,
+    )
+    header = _HEADER.pack(
+        MAGIC,
+        VERSION,
+        0,
+        n_states,
+        n_terminals,
+        n_non_terminals,
+        len(rules),
+        len(rhs),
+        len(overflow),
+        len(names),
+    )
+
+    with open(path, "wb") as f:
+        f.write(header)
+        for section in sections:
+            if sys.byteorder != "little":
+                section = array("i", section)
+                section.byteswap()
+            f.write(section.tobytes())
+        f.write(names)
@@ -1,15 +1,25 @@
-from typing import Iterable, Optional, Protocol, TypeAlias
+from io import StringIO
+from os import PathLike
+from typing import Iterable, Optional, Protocol, TextIO, TypeAlias, Union
 
-from syntactes import Grammar, Token
-from syntactes._action import Action
+from syntactes import Grammar, Rule, Token
+from syntactes._action import Action, ActionType
 from syntactes._state import LR0State, LR1State, State
 from syntactes.parsing_table import Conflict, Entry
+from syntactes.parsing_table.compiled import CompiledParsingTable
+from syntactes.parsing_table.compressed import CompressedParsingTable
+from syntactes.parsing_table.export import write_csv, write_markdown, write_text
+from syntactes.parsing_table.mapped import MappedParsingTable, dump_table
+from syntactes.stats import MinimizationStats
 
 Row: TypeAlias = dict[Token, list[Action]]
 
 
 class ParsingTable(Protocol):
+    origins: dict[Rule, Rule]
     rows: dict[State, Row]
+    actions: dict[State, Row]
+    gotos: dict[State, dict[Token, State]]
     initial_state: State
 
     @staticmethod
@@ -19,13 +29,31 @@ class ParsingTable(Protocol):
 
     def get_actions(self, state: State, token: Token) -> Optional[list[Action]]: ...
 
+    def get_goto_state(self, state: State, token: Token) -> Optional[State]: ...
+
 class LR0ParsingTable:
     """
     Table that contains all the transitions from state to state with a symbol.
+
+    `rows` maps every state to its actions with terminals and non-terminals.
+    The same cells are split in the ACTION table `actions`, with the actions of
+    every state with terminals, and the GOTO table `gotos`, with the target
+    state of every state with non-terminals.
+
+    The cells with more than one action are indexed as entries are added, so
+    conflicts are queried without scanning the table.
+
+    `origins` maps the rules derived by the simplification of the grammar to
+    the rules whose executables they run, see `Generator`. Parsers run the
+    executable of the origin of a rule, if it has one.
     """
 
     def __init__(self, grammar: Grammar) -> None:
+        self.origins: dict[Rule, Rule] = dict()
         self.rows: dict[LR0State, Row] = dict()
+        self.actions: dict[LR0State, Row] = dict()
+        self.gotos: dict[LR0State, dict[Token, LR0State]] = dict()
+        self._conflicts: dict[tuple[LR0State, Token], Conflict] = dict()
         self._grammar = grammar
         self._initial_state = None
 
@@ -42,6 +70,10 @@ class LR0ParsingTable:
     def initial_state(self) -> LR0State:
         return self._initial_state
 
+    @property
+    def grammar(self) -> Grammar:
+        return self._grammar
+
     def get_actions(self, state: LR0State, token: Token) -> Optional[list[Action]]:
         """
         Get the actions from state with given number with `token`.
@@ -56,6 +88,13 @@ class LR0ParsingTable:
         """
         return self.rows.get(state, None)
 
+    def get_goto_state(self, state: LR0State, token: Token) -> Optional[LR0State]:
+        """
+        Get the target state of the goto from `state` with the non-terminal
+        `token`. If there is no goto, returns None.
+        """
+        return self.gotos.get(state, {}).get(token, None)
+
     def add_entry(self, entry: Entry) -> None:
         """
         Adds an entry to the parsing table.
@@ -67,67 +106,205 @@ class LR0ParsingTable:
         actions = row.setdefault(entry.token, list())
         actions.append(entry.action)
 
-    def pretty_str(self) -> str:
+        if len(actions) == 2:
+            # the conflict holds the list of the cell, so it sees later actions
+            conflict = Conflict(entry.from_state, entry.token, actions)
+            self._conflicts[(entry.from_state, entry.token)] = conflict
+
+        if entry.token.is_terminal:
+            self.actions.setdefault(entry.from_state, {})[entry.token] = actions
+        else:
+            gotos = self.gotos.setdefault(entry.from_state, {})
+            gotos.setdefault(entry.token, entry.action.actionable)
+
+    def dump(self, path: Union[str, PathLike]) -> None:
         """
-        Returns a pretty-formatted string representation of the table.
+        Writes the table to the given path in a compact binary format: a header,
+        the symbols and the rules, and flat integer action and goto arrays.
+
+        Raises ValueError if the table has `origins`, since the format does not
+        hold the rules whose executables the derived rules run.
         """
-        return self._rules_pretty_str() + "\n\n" + self._table_pretty_str()
+        if len(self.origins) > 0:
+            raise ValueError(
+                "Cannot dump a table with derived rules; generate it without "
+                "`simplify`."
+            )
 
-    def conflicts(self) -> list[Conflict]:
+        dump_table(self, self._grammar, path)
+
+    @staticmethod
+    def load(path: Union[str, PathLike]) -> MappedParsingTable:
         """
-        Retuns a list with all the conflicts in the parsing table.
+        Loads a table written with `dump`. The file is memory-mapped, so loading
+        does not create objects per table cell and processes that load the same
+        file share its pages.
         """
-        conflicts = []
-        for state, row in self.rows.items():
-            for token, actions in row.items():
-                if len(actions) > 1:
-                    conflicts.append(Conflict(state, token, actions))
+        return MappedParsingTable(path)
 
-        return conflicts
+    def compile(self) -> CompiledParsingTable:
+        """
+        Returns the table with states and symbols numbered by ints and the actions
+        encoded in flat int arrays, for `syntactes.parser.CompiledParser`.
+        """
+        return CompiledParsingTable(self)
 
-    def _rules_pretty_str(self) -> str:
-        rules = [str(i) + ". " + str(r) for i, r in enumerate(self._grammar.rules)]
-        rules_str = "\n".join(rules)
-        rules_str = "GRAMMAR RULES\n" + "-" * max(map(len, rules)) + "\n" + rules_str
-        rules_str += "\n" + "-" * max(map(len, rules))
+    def compress(self) -> CompressedParsingTable:
+        """
+        Returns the table compressed with row displacement and default
+        reductions, for `syntactes.parser.CompressedParser`.
+        """
+        return CompressedParsingTable(self)
 
-        return rules_str
+    def minimize(self, stats: Optional[MinimizationStats] = None) -> "LR0ParsingTable":
+        """
+        Returns a table of the same type with equivalent states merged.
+
+        Two states are equivalent if they are both final or both not final and
+        have the same actions with the same tokens, in the same order, where
+        shifts and gotos lead to equivalent states. States are partitioned by
+        Moore's refinement: starting from the states grouped by their final flag
+        and their reduce and accept actions, groups are split by the groups of
+        their shift targets until no group splits.
+
+        Merged states accept the same streams, detect errors on the same tokens
+        and keep the same conflicts, so the parser behaves the same with both
+        tables. Every group is represented by its lowest numbered state, the
+        groups are numbered densely in the order of their representatives and
+        shifts and gotos are redirected to the representatives. The states of
+        this table are not modified.
+
+        If `stats` is given, it is filled in with the number of states and the
+        memory of the compiled table before and after minimization.
+        """
+        targets = {
+            action.actionable
+            for row in self.rows.values()
+            for actions in row.values()
+            for action in actions
+            if action.action_type == ActionType.SHIFT
+        }
+        states = sorted(targets.union(self.rows), key=lambda s: s.number)
+        blocks = _partition_states(states, self.rows)
+
+        representatives: dict[int, State] = dict()
+        for state in states:
+            if blocks[state] not in representatives:
+                representative = type(state).from_kernel(state.kernel, state.items)
+                representative.set_number(blocks[state] + 1)
+                if state.is_final:
+                    representative.set_final()
+                representatives[blocks[state]] = representative
+
+        def translate(action: Action) -> Action:
+            if action.action_type != ActionType.SHIFT:
+                return action
+
+            return Action.shift(representatives[blocks[action.actionable]])
+
+        table = type(self)(self._grammar)
+        table.origins = dict(self.origins)
+        for state in states:
+            representative = representatives[blocks[state]]
+            if representative in table.rows:
+                continue
+
+            for token, actions in self.rows.get(state, {}).items():
+                for action in actions:
+                    table.add_entry(Entry(representative, token, translate(action)))
+
+        if stats is not None:
+            stats.states_before = len(self.rows)
+            stats.states_after = len(table.rows)
+            stats.nbytes_before = self.compile().nbytes()
+            stats.nbytes_after = table.compile().nbytes()
 
-    def _table_pretty_str(self) -> str:
-        rows = []
-        tokens = sorted(self._grammar.tokens)
-        for number, row in sorted(
-            map(lambda tpl: (tpl[0].number, tpl[1]), self.rows.items())
-        ):
-            r = [str(number)]
-            for token in sorted(tokens):
-                actions = row.get(token, [])
-                if len(actions) >= 1:
-                    actions_str = ",".join(map(str, actions))
-                else:
-                    actions_str = "--"
+        return table
 
-                r.append(actions_str)
+    def pretty_str(self) -> str:
+        """
+        Returns a pretty-formatted string representation of the table.
+        """
+        buffer = StringIO()
+        self.write_text(buffer)
+        return buffer.getvalue()
 
-            rows.append(r)
+    def write_text(self, file: TextIO) -> None:
+        """
+        Writes the pretty-formatted representation of the table, as returned by
+        `pretty_str`, to the given file-like object a row at a time.
+        """
+        write_text(self, self._grammar, self.header_str(), file)
 
-        table = "|     |  "
-        table += "   |  ".join(str(token) for token in tokens) + "  |\n"
+    def write_csv(self, file: TextIO) -> None:
+        """
+        Writes the table as CSV to the given file-like object a row at a time,
+        with a record per state and a column per token.
+        """
+        write_csv(self, self._grammar, file)
 
-        header = self._header_str() + "\n" + "-" * len(table) + "\n"
-        table += "-" * len(table) + "\n"
+    def write_markdown(self, file: TextIO) -> None:
+        """
+        Writes the table as a Markdown table to the given file-like object a row
+        at a time, with a row per state and a column per token.
+        """
+        write_markdown(self, self._grammar, file)
 
-        for row in rows:
-            new_row = "|  " + "  |  ".join(row) + " |" + "\n"
-            table += new_row
-            table += "-" * len(new_row) + "\n"
+    def conflicts(self) -> list[Conflict]:
+        """
+        Retuns a list with all the conflicts in the parsing table, in the order
+        they were created.
+        """
+        return list(self._conflicts.values())
 
-        return header + table
+    def has_conflicts(self) -> bool:
+        """
+        Returns True if some cell of the parsing table has more than one action.
+        """
+        return len(self._conflicts) > 0
 
-    def _header_str(self) -> str:
+    def header_str(self) -> str:
+        """
+        Returns the title of the table, as written by `pretty_str`, e.g.
+        "LR0 PARSING TABLE".
+        """
         return "LR0 PARSING TABLE"
 
 
+def _partition_states(states: list[State], rows: dict[State, Row]) -> dict[State, int]:
+    """
+    Returns the group of every given state in the coarsest partition of
+    equivalent states, with groups numbered from 0 in the order of the states.
+    """
+    blocks = {state: 0 for state in states}
+    n_blocks = 1
+    while True:
+        signatures: dict[tuple, int] = dict()
+        refined: dict[State, int] = dict()
+        for state in states:
+            signature = (
+                blocks[state],
+                state.is_final,
+                frozenset(
+                    (token, tuple(_action_key(a, blocks) for a in actions))
+                    for token, actions in rows.get(state, {}).items()
+                ),
+            )
+            refined[state] = signatures.setdefault(signature, len(signatures))
+
+        blocks = refined
+        if len(signatures) == n_blocks:
+            return blocks
+        n_blocks = len(signatures)
+
+
+def _action_key(action: Action, blocks: dict[State, int]) -> tuple:
+    if action.action_type == ActionType.SHIFT:
+        return (ActionType.SHIFT, blocks[action.actionable])
+
+    return (action.action_type, action.actionable)
+
+
 class SLRParsingTable(LR0ParsingTable):
     @staticmethod
     def from_entries(
@@ -140,17 +317,37 @@ class SLRParsingTable(LR0ParsingTable):
         {table.add_entry(entry) for entry in entries}
         return table
 
-    def _header_str(self) -> str:
+    def header_str(self) -> str:
         return "SLR PARSING TABLE"
 
 
+class LALR1ParsingTable(LR0ParsingTable):
+    @staticmethod
+    def from_entries(
+        entries: Iterable[Entry], tokens: Iterable[Token]
+    ) -> "LALR1ParsingTable":
+        """
+        Create a parsing table from the given entries.
+        """
+        table = LALR1ParsingTable(tokens)
+        {table.add_entry(entry) for entry in entries}
+        return table
+
+    def header_str(self) -> str:
+        return "LALR1 PARSING TABLE"
+
+
 class LR1ParsingTable(LR0ParsingTable):
     """
     Table that contains all the transitions from state to state with a symbol.
     """
 
     def __init__(self, grammar: Grammar) -> None:
+        self.origins: dict[Rule, Rule] = dict()
         self.rows: dict[LR1State, Row] = dict()
+        self.actions: dict[LR1State, Row] = dict()
+        self.gotos: dict[LR1State, dict[Token, LR1State]] = dict()
+        self._conflicts: dict[tuple[LR1State, Token], Conflict] = dict()
         self._grammar = grammar
         self._initial_state = None
 
@@ -183,5 +380,12 @@ class LR1ParsingTable(LR0ParsingTable):
         """
         return self.rows.get(state, None)
 
-    def _header_str(self) -> str:
+    def get_goto_state(self, state: LR1State, token: Token) -> Optional[LR1State]:
+        """
+        Get the target state of the goto from `state` with the non-terminal
+        `token`. If there is no goto, returns None.
+        """
+        return self.gotos.get(state, {}).get(token, None)
+
+    def header_str(self) -> str:
         return "LR1 PARSING TABLE"
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from syntactes.token import Token
 
 
@@ -7,16 +9,52 @@ class Rule:
     other symbols.
 
     LHS -> RHS1 RHS2...
+
+    A rule takes the precedence of the given `precedence` terminal, like `%prec`
+    in yacc, or else of the last terminal of its right-hand side that has a
+    precedence in the grammar. The precedence terminal is not part of the
+    identity of the rule.
+
+    Rules are immutable; the hash is computed once on creation.
     """
 
-    def __init__(self, number: int, lhs: Token, *args: tuple[Token]) -> None:
-        self.number = number
-        self.lhs = lhs
-        self.rhs = args
-        self.rhs_len = len(args)
+    __slots__ = (
+        "number",
+        "lhs",
+        "rhs",
+        "rhs_len",
+        "precedence",
+        "_has_null_rhs",
+        "_hash",
+    )
+
+    def __init__(
+        self,
+        number: int,
+        lhs: Token,
+        *args: tuple[Token],
+        precedence: Optional[Token] = None,
+    ) -> None:
+        _set = object.__setattr__
+        _set(self, "number", number)
+        _set(self, "lhs", lhs)
+        _set(self, "rhs", args)
+        _set(self, "rhs_len", len(args))
+        _set(self, "precedence", precedence)
+        _set(self, "_has_null_rhs", len(args) == 1 and args[0] == Token.null())
+        _set(self, "_hash", hash((lhs, args)))
 
     def has_null_rhs(self) -> bool:
-        return self.rhs_len == 1 and self.rhs[0] == Token.null()
+        return self._has_null_rhs
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __reduce__(self):
+        if self.precedence is None:
+            return (Rule, (self.number, self.lhs, *self.rhs))
+
+        return (_rule, (self.number, self.lhs, self.rhs, self.precedence))
 
     def __repr__(self) -> str:
         return f"<Rule: {self}>"
@@ -25,10 +63,21 @@ class Rule:
         return f"{self.lhs} -> " + " ".join(map(str, self.rhs))
 
     def __hash__(self) -> int:
-        return hash((self.lhs, self.rhs))
+        return self._hash
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, Rule):
             return False
 
-        return self.lhs == other.lhs and self.rhs == other.rhs
+        return (
+            self._hash == other._hash
+            and self.lhs == other.lhs
+            and self.rhs == other.rhs
+        )
+
+
+def _rule(number: int, lhs: Token, rhs: tuple[Token, ...], precedence: Token) -> Rule:
+    return Rule(number, lhs, *rhs, precedence=precedence)
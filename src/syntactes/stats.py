@@ -0,0 +1,108 @@
+class GenerationStats:
+    """
+    Statistics of a parsing table generation, filled in by `Generator.generate`.
+
+    Phase times are wall times in seconds, keyed by phase:
+    - "states": construction of the automaton and the shift entries
+    - "reduce_entries": creation of the reduce and accept entries
+    - "table": creation of the parsing table from the entries
+
+    `goto_calls` counts the GOTO kernels computed, i.e. one per state and
+    symbol after the dot.
+    """
+
+    def __init__(self) -> None:
+        self.phase_times: dict[str, float] = dict()
+        self.closure_calls = 0
+        self.goto_calls = 0
+        self.items = 0
+        self.states = 0
+        self.entries = 0
+        self.conflicts = 0
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.phase_times.values())
+
+    def as_dict(self) -> dict:
+        """
+        Returns the statistics as a dictionary of plain values, e.g. for logging.
+        """
+        return {
+            "phase_times": dict(self.phase_times),
+            "total_time": self.total_time,
+            "closure_calls": self.closure_calls,
+            "goto_calls": self.goto_calls,
+            "items": self.items,
+            "states": self.states,
+            "entries": self.entries,
+            "conflicts": self.conflicts,
+        }
+
+    def pretty_str(self) -> str:
+        """
+        Returns a pretty-formatted string with the statistics.
+        """
+        string = "GENERATION STATISTICS\n"
+        for phase, seconds in self.phase_times.items():
+            string += f"{phase}: {seconds:.3f} s\n"
+        string += f"total: {self.total_time:.3f} s\n"
+        string += f"closure calls: {self.closure_calls}\n"
+        string += f"goto calls: {self.goto_calls}\n"
+        string += f"items: {self.items}\n"
+        string += f"states: {self.states}\n"
+        string += f"entries: {self.entries}\n"
+        string += f"conflicts: {self.conflicts}\n"
+
+        return string
+
+    def __repr__(self) -> str:
+        return f"<GenerationStats: {self.states} states, {self.total_time:.3f} s>"
+
+
+class MinimizationStats:
+    """
+    Statistics of a parsing table minimization, filled in by
+    `LR0ParsingTable.minimize`.
+
+    Memory is the number of bytes of the arrays of the compiled table, see
+    `syntactes.parsing_table.CompiledParsingTable.nbytes`, before and after
+    merging the equivalent states.
+    """
+
+    def __init__(self) -> None:
+        self.states_before = 0
+        self.states_after = 0
+        self.nbytes_before = 0
+        self.nbytes_after = 0
+
+    @property
+    def merged_states(self) -> int:
+        return self.states_before - self.states_after
+
+    def as_dict(self) -> dict:
+        """
+        Returns the statistics as a dictionary of plain values, e.g. for logging.
+        """
+        return {
+            "states_before": self.states_before,
+            "states_after": self.states_after,
+            "merged_states": self.merged_states,
+            "nbytes_before": self.nbytes_before,
+            "nbytes_after": self.nbytes_after,
+        }
+
+    def pretty_str(self) -> str:
+        """
+        Returns a pretty-formatted string with the statistics.
+        """
+        string = "MINIMIZATION STATISTICS\n"
+        string += f"states: {self.states_before} -> {self.states_after}\n"
+        string += f"memory: {self.nbytes_before} -> {self.nbytes_after} bytes\n"
+
+        return string
+
+    def __repr__(self) -> str:
+        return (
+            f"<MinimizationStats: {self.states_before} -> {self.states_after} states>"
+        )
@@ -1,4 +1,4 @@
-from syntactes import Grammar, Rule, Token
+from syntactes import Associativity, Grammar, Rule, Token
 from syntactes._action import Action
 from syntactes._item import LR0Item, LR1Item
 from syntactes._state import LR0State, LR1State
@@ -14,6 +14,24 @@ x = Token("x", True)
 PLUS = Token("+", True)
 LPAREN = Token("(", True)
 RPAREN = Token(")", True)
+A = Token("A", False)
+B = Token("B", False)
+y = Token("y", True)
+z = Token("z", True)
+NULL = Token.null()
+R = Token("R", False)
+EQUALS = Token("=", True)
+STAR = Token("*", True)
+ID = Token("id", True)
+a = Token("a", True)
+b = Token("b", True)
+c = Token("c", True)
+d = Token("d", True)
+e = Token("e", True)
+MINUS = Token("-", True)
+CARET = Token("^", True)
+LESS = Token("<", True)
+UMINUS = Token("UMINUS", True)
 
 tokens_1 = {EOF, S, E, T, x, PLUS}
 tokens_2 = {EOF, S, L, C, LPAREN, RPAREN}
@@ -45,6 +63,143 @@ rule_5_2 = Rule(4, C, LPAREN, RPAREN)
 rules_2 = (rule_1_2, rule_2_2, rule_3_2, rule_4_2, rule_5_2)
 
 grammar_2 = Grammar(rule_1_2, rules_2, tokens_2)
+terminal_set_2 = grammar_2.compile().terminal_set
+
+tokens_3 = {EOF, S, A, B, x, y, z}
+
+# 1. S -> A $
+# 2. A -> x B
+# 3. A -> ε
+# 4. B -> y A
+# 5. B -> A z
+rule_1_3 = Rule(0, S, A, EOF)
+rule_2_3 = Rule(1, A, x, B)
+rule_3_3 = Rule(2, A, NULL)
+rule_4_3 = Rule(3, B, y, A)
+rule_5_3 = Rule(4, B, A, z)
+
+rules_3 = (rule_1_3, rule_2_3, rule_3_3, rule_4_3, rule_5_3)
+
+grammar_3 = Grammar(rule_1_3, rules_3, tokens_3)
+
+tokens_4 = {EOF, S, E, L, R, EQUALS, STAR, ID}
+
+# LALR1 but not SLR.
+# 1. S -> E $
+# 2. E -> L = R
+# 3. E -> R
+# 4. L -> * R
+# 5. L -> id
+# 6. R -> L
+rule_1_4 = Rule(0, S, E, EOF)
+rule_2_4 = Rule(1, E, L, EQUALS, R)
+rule_3_4 = Rule(2, E, R)
+rule_4_4 = Rule(3, L, STAR, R)
+rule_5_4 = Rule(4, L, ID)
+rule_6_4 = Rule(5, R, L)
+
+rules_4 = (rule_1_4, rule_2_4, rule_3_4, rule_4_4, rule_5_4, rule_6_4)
+
+grammar_4 = Grammar(rule_1_4, rules_4, tokens_4)
+
+tokens_5 = {EOF, S, E, A, B, a, b, c, d, e}
+
+# LR1 but not LALR1.
+# 1. S -> E $
+# 2. E -> a A d
+# 3. E -> b B d
+# 4. E -> a B e
+# 5. E -> b A e
+# 6. A -> c
+# 7. B -> c
+rule_1_5 = Rule(0, S, E, EOF)
+rule_2_5 = Rule(1, E, a, A, d)
+rule_3_5 = Rule(2, E, b, B, d)
+rule_4_5 = Rule(3, E, a, B, e)
+rule_5_5 = Rule(4, E, b, A, e)
+rule_6_5 = Rule(5, A, c)
+rule_7_5 = Rule(6, B, c)
+
+rules_5 = (rule_1_5, rule_2_5, rule_3_5, rule_4_5, rule_5_5, rule_6_5, rule_7_5)
+
+grammar_5 = Grammar(rule_1_5, rules_5, tokens_5)
+
+tokens_6 = {EOF, S, E, x, PLUS, MINUS, STAR, CARET, LESS}
+
+# Ambiguous, with precedence declarations.
+# 1. S -> E $
+# 2. E -> E + E
+# 3. E -> E - E
+# 4. E -> E * E
+# 5. E -> E ^ E
+# 6. E -> E < E
+# 7. E -> - E  (with the precedence of UMINUS)
+# 8. E -> x
+rule_1_6 = Rule(0, S, E, EOF)
+rule_2_6 = Rule(1, E, E, PLUS, E)
+rule_3_6 = Rule(2, E, E, MINUS, E)
+rule_4_6 = Rule(3, E, E, STAR, E)
+rule_5_6 = Rule(4, E, E, CARET, E)
+rule_6_6 = Rule(5, E, E, LESS, E)
+rule_7_6 = Rule(6, E, MINUS, E, precedence=UMINUS)
+rule_8_6 = Rule(7, E, x)
+
+rules_6 = (
+    rule_1_6,
+    rule_2_6,
+    rule_3_6,
+    rule_4_6,
+    rule_5_6,
+    rule_6_6,
+    rule_7_6,
+    rule_8_6,
+)
+
+# lowest first
+precedence_6 = (
+    (Associativity.NONASSOC, (LESS,)),
+    (Associativity.LEFT, (PLUS, MINUS)),
+    (Associativity.LEFT, (STAR,)),
+    (Associativity.RIGHT, (CARET,)),
+    (Associativity.RIGHT, (UMINUS,)),
+)
+
+grammar_6 = Grammar(rule_1_6, rules_6, tokens_6, precedence_6)
+
+tokens_7 = {EOF, S, E, T, A, B, C, x, y, z, PLUS, LPAREN}
+
+# Grammar 1 with useless rules and an unused token '('.
+# 1. S -> E $
+# 2. E -> T + E
+# 3. E -> T
+# 4. T -> x
+# 5. T -> A y  (A is unproductive)
+# 6. A -> A z
+# 7. B -> y  (B is unreachable)
+# 8. C -> B z  (C is unreachable)
+rule_5_7 = Rule(4, T, A, y)
+rule_6_7 = Rule(5, A, A, z)
+rule_7_7 = Rule(6, B, y)
+rule_8_7 = Rule(7, C, B, z)
+
+rules_7 = rules_1 + (rule_5_7, rule_6_7, rule_7_7, rule_8_7)
+
+grammar_7 = Grammar(rule_1_1, rules_7, tokens_7)
+
+tokens_8 = {EOF, S, E, T, x, y}
+
+# T is inlined into E -> T by simplification, giving E -> x and E -> y.
+# 1. S -> E $
+# 2. E -> T
+# 3. T -> x
+# 4. T -> y
+rule_2_8 = Rule(1, E, T)
+rule_3_8 = Rule(2, T, x)
+rule_4_8 = Rule(3, T, y)
+
+rules_8 = (rule_1_1, rule_2_8, rule_3_8, rule_4_8)
+
+grammar_8 = Grammar(rule_1_1, rules_8, tokens_8)
 
 
 def lr0_state_1():
@@ -137,116 +292,98 @@ def slr_parsing_table():
 
 
 def lr1_state_1():
-    item_1 = LR1Item(rule_1_2, 0, EOF)  # S -> . L $, $
-    item_2 = LR1Item(rule_2_2, 0, EOF)  # L -> . L C, $
-    item_3 = LR1Item(rule_2_2, 0, LPAREN)  # L -> . L C, (
-    item_4 = LR1Item(rule_3_2, 0, EOF)  # L -> . C, $
-    item_5 = LR1Item(rule_3_2, 0, LPAREN)  # L -> . C, (
-    item_6 = LR1Item(rule_4_2, 0, EOF)  # C -> . ( C ), $
-    item_7 = LR1Item(rule_4_2, 0, LPAREN)  # C -> . ( C ), (
-    item_8 = LR1Item(rule_5_2, 0, EOF)  # C -> . (), $
-    item_9 = LR1Item(rule_5_2, 0, LPAREN)  # C -> . (), (
-    state = LR1State.from_items(
-        {item_1, item_2, item_3, item_4, item_5, item_6, item_7, item_8, item_9}
-    )
+    item_1 = LR1Item(rule_1_2, 0, terminal_set_2({EOF}))  # S -> . L $, $
+    item_2 = LR1Item(rule_2_2, 0, terminal_set_2({EOF, LPAREN}))  # L -> . L C, $/(
+    item_3 = LR1Item(rule_3_2, 0, terminal_set_2({EOF, LPAREN}))  # L -> . C, $/(
+    item_4 = LR1Item(rule_4_2, 0, terminal_set_2({EOF, LPAREN}))  # C -> . ( C ), $/(
+    item_5 = LR1Item(rule_5_2, 0, terminal_set_2({EOF, LPAREN}))  # C -> . ( ), $/(
+    state = LR1State.from_items({item_1, item_2, item_3, item_4, item_5})
     state.set_number(1)
     return state
 
 
 def lr1_state_2():
-    item_1 = LR1Item(rule_1_2, 1, EOF)  # S -> L . $, $
-    item_2 = LR1Item(rule_2_2, 1, EOF)  # L -> L . C, $
-    item_3 = LR1Item(rule_2_2, 1, LPAREN)  # L -> L . C, (
-    item_4 = LR1Item(rule_4_2, 0, EOF)  # C -> . ( C ), $
-    item_5 = LR1Item(rule_4_2, 0, LPAREN)  # C -> . ( C ), (
-    item_6 = LR1Item(rule_5_2, 0, EOF)  # C -> . ( ), $
-    item_7 = LR1Item(rule_5_2, 0, LPAREN)  # C -> . ( ), (
-    state = LR1State.from_items(
-        {item_1, item_2, item_3, item_4, item_5, item_6, item_7}
-    )
+    item_1 = LR1Item(rule_1_2, 1, terminal_set_2({EOF}))  # S -> L . $, $
+    item_2 = LR1Item(rule_2_2, 1, terminal_set_2({EOF, LPAREN}))  # L -> L . C, $/(
+    item_3 = LR1Item(rule_4_2, 0, terminal_set_2({EOF, LPAREN}))  # C -> . ( C ), $/(
+    item_4 = LR1Item(rule_5_2, 0, terminal_set_2({EOF, LPAREN}))  # C -> . ( ), $/(
+    state = LR1State.from_items({item_1, item_2, item_3, item_4})
     state.set_number(2)
     state.set_final()
     return state
 
 
 def lr1_state_3():
-    item_1 = LR1Item(rule_3_2, 1, EOF)  # L -> C ., $
-    item_2 = LR1Item(rule_3_2, 1, LPAREN)  # L -> C ., (
-    state = LR1State.from_items({item_1, item_2})
+    item_1 = LR1Item(rule_3_2, 1, terminal_set_2({EOF, LPAREN}))  # L -> C ., $/(
+    state = LR1State.from_items({item_1})
     state.set_number(3)
     return state
 
 
 def lr1_state_4():
-    item_1 = LR1Item(rule_4_2, 0, RPAREN)  # C -> . ( C ), )
-    item_2 = LR1Item(rule_4_2, 1, EOF)  # C -> ( . C ), $
-    item_3 = LR1Item(rule_4_2, 1, LPAREN)  # C -> ( . C ), (
-    item_4 = LR1Item(rule_5_2, 0, RPAREN)  # C -> . ( ), )
-    item_5 = LR1Item(rule_5_2, 1, EOF)  # C -> ( . ), $
-    item_6 = LR1Item(rule_5_2, 1, LPAREN)  # C -> ( . ), (
-    state = LR1State.from_items({item_1, item_2, item_3, item_4, item_5, item_6})
+    item_1 = LR1Item(rule_4_2, 0, terminal_set_2({RPAREN}))  # C -> . ( C ), )
+    item_2 = LR1Item(rule_4_2, 1, terminal_set_2({EOF, LPAREN}))  # C -> ( . C ), $/(
+    item_3 = LR1Item(rule_5_2, 0, terminal_set_2({RPAREN}))  # C -> . ( ), )
+    item_4 = LR1Item(rule_5_2, 1, terminal_set_2({EOF, LPAREN}))  # C -> ( . ), $/(
+    state = LR1State.from_items({item_1, item_2, item_3, item_4})
     state.set_number(4)
     return state
 
 
 def lr1_state_5():
-    item_1 = LR1Item(rule_2_2, 2, EOF)  # L -> L C ., $
-    item_2 = LR1Item(rule_2_2, 2, LPAREN)  # L -> L C ., (
-    state = LR1State.from_items({item_1, item_2})
+    item_1 = LR1Item(rule_2_2, 2, terminal_set_2({EOF, LPAREN}))  # L -> L C ., $/(
+    state = LR1State.from_items({item_1})
     state.set_number(5)
     return state
 
 
 def lr1_state_6():
-    item_1 = LR1Item(rule_4_2, 2, EOF)  # C -> ( C . ), $
-    item_2 = LR1Item(rule_4_2, 2, LPAREN)  # C -> ( C . ), (
-    state = LR1State.from_items({item_1, item_2})
+    item_1 = LR1Item(rule_4_2, 2, terminal_set_2({EOF, LPAREN}))  # C -> ( C . ), $/(
+    state = LR1State.from_items({item_1})
     state.set_number(6)
     return state
 
 
 def lr1_state_7():
-    item_1 = LR1Item(rule_4_2, 0, RPAREN)  # C -> . ( C ), )
-    item_2 = LR1Item(rule_4_2, 1, RPAREN)  # C -> ( . C ), )
-    item_3 = LR1Item(rule_5_2, 0, RPAREN)  # C -> . ( ), )
-    item_4 = LR1Item(rule_5_2, 1, RPAREN)  # C -> ( . ), )
+    item_1 = LR1Item(rule_4_2, 0, terminal_set_2({RPAREN}))  # C -> . ( C ), )
+    item_2 = LR1Item(rule_4_2, 1, terminal_set_2({RPAREN}))  # C -> ( . C ), )
+    item_3 = LR1Item(rule_5_2, 0, terminal_set_2({RPAREN}))  # C -> . ( ), )
+    item_4 = LR1Item(rule_5_2, 1, terminal_set_2({RPAREN}))  # C -> ( . ), )
     state = LR1State.from_items({item_1, item_2, item_3, item_4})
     state.set_number(7)
     return state
 
 
 def lr1_state_8():
-    item_1 = LR1Item(rule_5_2, 2, EOF)  # C -> ( ) ., $
-    item_2 = LR1Item(rule_5_2, 2, LPAREN)  # C -> ( ) ., (
-    state = LR1State.from_items({item_1, item_2})
+    item_1 = LR1Item(rule_5_2, 2, terminal_set_2({EOF, LPAREN}))  # C -> ( ) ., $/(
+    state = LR1State.from_items({item_1})
     state.set_number(8)
     return state
 
 
 def lr1_state_9():
-    item_1 = LR1Item(rule_4_2, 3, EOF)  # C -> ( C ) ., $
-    item_2 = LR1Item(rule_4_2, 3, LPAREN)  # C -> ( C ) ., (
-    state = LR1State.from_items({item_1, item_2})
+    item_1 = LR1Item(rule_4_2, 3, terminal_set_2({EOF, LPAREN}))  # C -> ( C ) ., $/(
+    state = LR1State.from_items({item_1})
     state.set_number(9)
     return state
 
 
 def lr1_state_10():
-    item_1 = LR1Item(rule_4_2, 2, RPAREN)  # C -> ( C . ), )
+    item_1 = LR1Item(rule_4_2, 2, terminal_set_2({RPAREN}))  # C -> ( C . ), )
     state = LR1State.from_items({item_1})
     state.set_number(10)
     return state
 
 
 def lr1_state_11():
-    item_1 = LR1Item(rule_5_2, 2, RPAREN)  # C -> ( ) ., )
+    item_1 = LR1Item(rule_5_2, 2, terminal_set_2({RPAREN}))  # C -> ( ) ., )
     state = LR1State.from_items({item_1})
     state.set_number(11)
     return state
 
 
 def lr1_state_12():
-    item_1 = LR1Item(rule_4_2, 3, RPAREN)  # C -> ( C ) ., )
+    item_1 = LR1Item(rule_4_2, 3, terminal_set_2({RPAREN}))  # C -> ( C ) ., )
     state = LR1State.from_items({item_1})
     state.set_number(12)
     return state
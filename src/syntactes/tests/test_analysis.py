@@ -0,0 +1,153 @@
+from unittest_extensions import TestCase, args
+
+from syntactes._analysis import GrammarAnalysis
+from syntactes.tests.data import (
+    EOF,
+    LPAREN,
+    PLUS,
+    RPAREN,
+    A,
+    B,
+    C,
+    E,
+    L,
+    S,
+    T,
+    grammar_1,
+    grammar_2,
+    grammar_3,
+    x,
+    y,
+    z,
+)
+
+
+class TestGrammarAnalysis(TestCase):
+    def analysis(self):
+        return GrammarAnalysis(self.grammar)
+
+
+class TestGrammarAnalysisFirst(TestGrammarAnalysis):
+    grammar = grammar_1
+
+    def subject(self, *symbols):
+        return set(self.analysis().first(*symbols))
+
+    @args(x)
+    def test_terminal(self):
+        self.assertResult({x})
+
+    @args(T)
+    def test_non_terminal(self):
+        self.assertResult({x})
+
+    @args(S)
+    def test_starting_symbol(self):
+        self.assertResult({x})
+
+    @args(PLUS, E)
+    def test_sequence(self):
+        self.assertResult({PLUS})
+
+    @args()
+    def test_empty_sequence(self):
+        self.assertResult(set())
+
+
+class TestGrammarAnalysisFirstLeftRecursive(TestGrammarAnalysis):
+    grammar = grammar_2
+
+    def subject(self, *symbols):
+        return set(self.analysis().first(*symbols))
+
+    @args(L)
+    def test_left_recursive_non_terminal(self):
+        self.assertResult({LPAREN})
+
+    @args(C, RPAREN)
+    def test_sequence(self):
+        self.assertResult({LPAREN})
+
+
+class TestGrammarAnalysisFirstNullable(TestGrammarAnalysis):
+    grammar = grammar_3
+
+    def subject(self, *symbols):
+        return set(self.analysis().first(*symbols))
+
+    @args(A)
+    def test_nullable_non_terminal(self):
+        self.assertResult({x})
+
+    @args(B)
+    def test_non_terminal_starting_with_nullable(self):
+        self.assertResult({x, y, z})
+
+    @args(A, z)
+    def test_sequence_starting_with_nullable(self):
+        self.assertResult({x, z})
+
+    @args(A, A, EOF)
+    def test_sequence_of_nullables(self):
+        self.assertResult({x, EOF})
+
+
+class TestGrammarAnalysisNullable(TestGrammarAnalysis):
+    grammar = grammar_3
+
+    def subject(self, *symbols):
+        return self.analysis().nullable(*symbols)
+
+    @args(A)
+    def test_nullable_non_terminal(self):
+        self.assertResult(True)
+
+    @args(B)
+    def test_non_nullable_non_terminal(self):
+        self.assertResult(False)
+
+    @args(A, A)
+    def test_nullable_sequence(self):
+        self.assertResult(True)
+
+    @args(A, z)
+    def test_sequence_with_terminal(self):
+        self.assertResult(False)
+
+
+class TestGrammarAnalysisFollow(TestGrammarAnalysis):
+    grammar = grammar_1
+
+    def subject(self, symbol):
+        return set(self.analysis().follow(symbol))
+
+    @args(E)
+    def test_last_in_rhs(self):
+        self.assertResult({EOF})
+
+    @args(T)
+    def test_followed_by_terminal_and_last_in_rhs(self):
+        self.assertResult({PLUS, EOF})
+
+    @args(S)
+    def test_starting_symbol(self):
+        self.assertResult(set())
+
+    @args(x)
+    def test_terminal(self):
+        self.assertResult(set())
+
+
+class TestGrammarAnalysisFollowMutuallyRecursive(TestGrammarAnalysis):
+    grammar = grammar_3
+
+    def subject(self, symbol):
+        return set(self.analysis().follow(symbol))
+
+    @args(A)
+    def test_mutually_recursive_non_terminal(self):
+        self.assertResult({EOF, z})
+
+    @args(B)
+    def test_other_mutually_recursive_non_terminal(self):
+        self.assertResult({EOF, z})
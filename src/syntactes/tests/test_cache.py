@@ -0,0 +1,175 @@
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from unittest_extensions import TestCase, args
+
+from syntactes import (
+    Associativity,
+    Grammar,
+    LALR1Generator,
+    LR0Generator,
+    LR1Generator,
+    Rule,
+    SLRGenerator,
+    TableCache,
+)
+from syntactes.cache import dumps, fingerprint, loads
+from syntactes.parser import LR1Parser
+from syntactes.tests.data import (
+    EOF,
+    LPAREN,
+    RPAREN,
+    C,
+    grammar_1,
+    grammar_2,
+    grammar_3,
+    grammar_4,
+    grammar_6,
+    rule_1_2,
+    rule_1_6,
+    rules_6,
+    tokens_6,
+    rules_2,
+    tokens_2,
+)
+
+
+class TestFingerprint(TestCase):
+    def subject(self, grammar, generator_cls):
+        return fingerprint(grammar, generator_cls)
+
+    @args(Grammar(rule_1_2, tuple(reversed(rules_2)), tokens_2), LR1Generator)
+    def test_does_not_depend_on_rule_order(self):
+        self.assertResult(fingerprint(grammar_2, LR1Generator))
+
+    @args(grammar_2, LALR1Generator)
+    def test_depends_on_generator_class(self):
+        self.assertResultNot(fingerprint(grammar_2, LR1Generator))
+
+    @args(Grammar(rule_1_2, rules_2 + (Rule(5, C, RPAREN),), tokens_2), LR1Generator)
+    def test_depends_on_rules(self):
+        self.assertResultNot(fingerprint(grammar_2, LR1Generator))
+
+    @args(Grammar(rule_1_6, rules_6, tokens_6), LR1Generator)
+    def test_depends_on_precedence(self):
+        self.assertResultNot(fingerprint(grammar_6, LR1Generator))
+
+    @args(
+        Grammar(
+            rule_1_6,
+            rules_6,
+            tokens_6,
+            [(Associativity.RIGHT, t) for _, t in grammar_6.precedence],
+        ),
+        LR1Generator,
+    )
+    def test_depends_on_associativity(self):
+        self.assertResultNot(fingerprint(grammar_6, LR1Generator))
+
+
+class TestDumpsLoads(TestCase):
+    def subject(self, generator_cls, grammar):
+        table = generator_cls(grammar).generate()
+        self.dumped = dumps(table, grammar, generator_cls)
+        return table, loads(self.dumped, grammar, generator_cls)
+
+    def assert_round_trip(self):
+        generator_cls, grammar = self.subjectArgs()
+        table, loaded = self.result()
+
+        self.assertEqual(loaded.pretty_str(), table.pretty_str())
+        self.assertEqual(loaded.initial_state, table.initial_state)
+        self.assertEqual(dumps(loaded, grammar, generator_cls), self.dumped)
+
+    @args(LR0Generator, grammar_1)
+    def test_lr0(self):
+        self.assert_round_trip()
+
+    @args(SLRGenerator, grammar_4)
+    def test_slr(self):
+        self.assert_round_trip()
+
+    @args(LALR1Generator, grammar_3)
+    def test_lalr1(self):
+        self.assert_round_trip()
+
+    @args(LALR1Generator, grammar_6)
+    def test_with_precedence(self):
+        self.assert_round_trip()
+
+    @args(LR1Generator, grammar_2)
+    def test_lr1(self):
+        self.assert_round_trip()
+
+
+class TestLoads(TestCase):
+    def subject(self, data, grammar):
+        return loads(data, grammar, LR1Generator)
+
+    @args(b"not a table", grammar_2)
+    def test_invalid_data(self):
+        self.assertResultRaises(ValueError)
+
+    def test_other_grammar(self):
+        data = dumps(LR1Generator(grammar_2).generate(), grammar_2, LR1Generator)
+        with self.assertRaises(ValueError):
+            loads(data, grammar_3, LR1Generator)
+
+
+class TestTableCache(TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = Path(self._directory.name)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def cache(self, **kwargs):
+        return TableCache(directory=self.directory, **kwargs)
+
+
+class TestTableCacheGetOrGenerate(TestTableCache):
+    def subject(self):
+        return self.cache().get_or_generate(grammar_2, LR1Generator)
+
+    def test_memory_hit(self):
+        cache = self.cache()
+        table = cache.get_or_generate(grammar_2, LR1Generator)
+        self.assertIs(cache.get_or_generate(grammar_2, LR1Generator), table)
+
+    def test_disk_hit(self):
+        expected = self.cache().get_or_generate(grammar_2, LR1Generator)
+
+        with patch.object(LR1Generator, "generate") as generate:
+            table = self.result()
+
+        generate.assert_not_called()
+        self.assertEqual(table.pretty_str(), expected.pretty_str())
+
+    def test_corrupt_file_is_regenerated(self):
+        expected = self.cache().get_or_generate(grammar_2, LR1Generator)
+        path = next(self.directory.glob("*.json"))
+        path.write_bytes(b"{")
+
+        self.assertEqual(self.result().pretty_str(), expected.pretty_str())
+        self.assertEqual(path.read_bytes(), dumps(expected, grammar_2, LR1Generator))
+
+    def test_least_recently_used_is_evicted(self):
+        cache = TableCache(maxsize=1)
+        cache.get_or_generate(grammar_2, LR1Generator)
+        cache.get_or_generate(grammar_3, LR1Generator)
+
+        self.assertEqual(len(cache), 1)
+        self.assertIsNone(cache.get(grammar_2, LR1Generator))
+
+
+class TestParserFromGrammarWithCache(TestTableCache):
+    def subject(self, *stream):
+        parser = LR1Parser.from_grammar(grammar_2, cache=self.cache())
+        return parser.parse(stream)
+
+    @args(LPAREN, RPAREN, LPAREN, LPAREN, RPAREN, RPAREN, EOF)
+    def test_parses_with_cached_table(self):
+        self.cache().get_or_generate(grammar_2, LR1Generator)
+        self.result()
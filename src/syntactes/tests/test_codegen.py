@@ -0,0 +1,152 @@
+import ast
+import importlib.util
+import os
+import tempfile
+import warnings
+
+from unittest_extensions import TestCase, args
+
+from syntactes import Grammar, LR1Generator, Rule, SLRGenerator, Token
+from syntactes.codegen import generate_module, write_module
+from syntactes.tests.data import (
+    EOF,
+    LPAREN,
+    PLUS,
+    RPAREN,
+    S,
+    grammar_1,
+    grammar_2,
+    grammar_8,
+    rule_3_8,
+    rule_4_1,
+    x,
+    y,
+)
+
+
+class TestGeneratedModule(TestCase):
+    simplify = False
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        path = os.path.join(directory.name, "generated_parser.py")
+        table = self.generator_cls(self.grammar, simplify=self.simplify).generate()
+        write_module(table, path)
+
+        spec = importlib.util.spec_from_file_location("generated_parser", path)
+        self.generated = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(self.generated)
+
+
+class TestGeneratedModuleSource(TestCase):
+    def subject(self):
+        return generate_module(SLRGenerator(grammar_1).generate())
+
+    def test_does_not_import_syntactes(self):
+        self.assertNotRegex(self.result(), r"(?m)^\s*(from|import) syntactes")
+
+    def test_lists_rules(self):
+        self.assertIn("1. E -> T + E", self.result())
+
+    def test_names_table_type(self):
+        self.assertIn("\n\nSLR PARSING TABLE\n\n0. S -> E $", self.result())
+
+
+class TestGeneratedModuleDocstring(TestCase):
+    def subject(self, name):
+        token = Token(name, True)
+        rule = Rule(0, S, token, EOF)
+        source = generate_module(
+            SLRGenerator(Grammar(rule, [rule], {S, token, EOF})).generate()
+        )
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            return ast.get_docstring(ast.parse(source))
+
+    @args("\\x")
+    def test_backslash(self):
+        self.assertIn("0. S -> \\x $", self.result())
+
+    @args("\\d")
+    def test_invalid_escape_sequence(self):
+        self.assertIn("0. S -> \\d $", self.result())
+
+    @args('"""')
+    def test_triple_quotes(self):
+        self.assertIn('0. S -> """ $', self.result())
+
+    @args('"')
+    def test_quote_before_end_of_line(self):
+        self.assertIn('0. S -> " $', self.result())
+
+
+class TestGeneratedSLRParser(TestGeneratedModule):
+    generator_cls = SLRGenerator
+    grammar = grammar_1
+
+    def subject(self, *stream):
+        self.reduced = []
+
+        def handler(*args):
+            self.reduced.append(list(map(str, args)))
+
+        parser = self.generated.Parser({str(rule_4_1): handler, 1: handler})
+        return parser.parse(stream)
+
+    @args(x, PLUS, x, EOF)
+    def test_calls_handlers_with_popped_symbols(self):
+        # rule 1 is E -> T + E
+        self.result()
+        self.assertListEqual(self.reduced, [["x"], ["x"], ["E", "+", "T"]])
+
+    @args(x, PLUS, EOF)
+    def test_unexpected_token(self):
+        self.assertResultRaisesRegex(
+            self.generated.UnexpectedTokenError,
+            r"Received token: \$; expected one of: \['x', 'E', 'T'\]",
+        )
+
+    @args(x)
+    def test_not_accepted(self):
+        self.assertResultRaises(self.generated.NotAcceptedError)
+
+
+class TestGeneratedLR1Parser(TestGeneratedModule):
+    generator_cls = LR1Generator
+    grammar = grammar_2
+
+    def subject(self, *stream):
+        return self.generated.Parser().parse(stream)
+
+    @args(LPAREN, RPAREN, LPAREN, LPAREN, RPAREN, RPAREN, EOF)
+    def test_accepts(self):
+        self.result()
+
+    @args(LPAREN, LPAREN, RPAREN, EOF)
+    def test_rejects(self):
+        self.assertResultRaises(self.generated.ParserError)
+
+
+class TestGeneratedSimplifiedParser(TestGeneratedModule):
+    # the table reduces E -> x instead of T -> x
+    generator_cls = LR1Generator
+    grammar = grammar_8
+    simplify = True
+
+    def subject(self, *stream):
+        self.reduced = []
+        parser = self.generated.Parser({str(rule_3_8): self.reduced.append})
+        return parser.parse(stream)
+
+    @args(x, EOF)
+    def test_runs_handler_of_origin(self):
+        self.result()
+        self.assertEqual(self.reduced, [x])
+
+    @args(y, EOF)
+    def test_runs_only_handlers_of_origin(self):
+        self.result()
+        self.assertEqual(self.reduced, [])
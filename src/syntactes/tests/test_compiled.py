@@ -0,0 +1,129 @@
+from unittest_extensions import TestCase, args
+
+from syntactes import LALR1Generator, LR1Generator, SLRGenerator
+from syntactes._action import Action
+from syntactes.parser import (
+    CompiledParser,
+    ExecutablesRegistry,
+    NotAcceptedError,
+    UnexpectedTokenError,
+    execute_on,
+)
+from syntactes.parsing_table.compiled import ACCEPT
+from syntactes.tests.data import (
+    EOF,
+    LPAREN,
+    PLUS,
+    RPAREN,
+    grammar_1,
+    grammar_2,
+    grammar_3,
+    rule_2_1,
+    x,
+    y,
+    z,
+)
+
+
+class TestCompiledParsingTable(TestCase):
+    def subject(self, generator_cls, grammar):
+        self.table = generator_cls(grammar).generate()
+        return self.table.compile()
+
+    def assert_same_rows(self):
+        compiled = self.result()
+        rules = list(compiled.rules)
+
+        self.assertEqual(compiled.n_states, len(self.table.rows))
+        for state, row in self.table.rows.items():
+            self.assertEqual(bool(compiled.final[state.number - 1]), state.is_final)
+            self.assertListEqual(compiled.expected_tokens(state.number), list(row))
+
+            for token, actions in row.items():
+                symbol_id = compiled.symbol_ids[token]
+                if not token.is_terminal:
+                    target = compiled.get_goto(
+                        state.number, symbol_id - compiled.n_terminals
+                    )
+                    self.assertEqual(target, actions[0].actionable.number)
+                    continue
+
+                cell = compiled.get_action(state.number, symbol_id)
+                if cell > 0:
+                    self.assertEqual(cell, actions[0].actionable.number)
+                elif cell == ACCEPT:
+                    self.assertEqual(actions[0], Action.accept())
+                else:
+                    self.assertEqual(rules[-cell - 1], actions[0].actionable)
+
+    @args(SLRGenerator, grammar_1)
+    def test_slr(self):
+        self.assert_same_rows()
+
+    @args(LALR1Generator, grammar_3)
+    def test_lalr1_with_null_rule(self):
+        self.assert_same_rows()
+
+    @args(LR1Generator, grammar_2)
+    def test_lr1(self):
+        self.assert_same_rows()
+
+
+class TestCompiledParserParse(TestCase):
+    def subject(self, *stream):
+        return CompiledParser.from_grammar(grammar_2).parse(stream)
+
+    @args(LPAREN, RPAREN, LPAREN, LPAREN, RPAREN, RPAREN, EOF)
+    def test_accepts(self):
+        self.result()
+
+    @args(LPAREN, LPAREN, RPAREN, EOF)
+    def test_rejects(self):
+        self.assertResultRaises(UnexpectedTokenError)
+
+    @args(LPAREN, RPAREN)
+    def test_no_eof_raises(self):
+        self.assertResultRaises(NotAcceptedError)
+
+    @args()
+    def test_empty_stream_raises(self):
+        self.assertResultRaises(NotAcceptedError)
+
+
+class TestCompiledParserParseNullable(TestCase):
+    def subject(self, *stream):
+        table = LALR1Generator(grammar_3).generate().compile()
+        return CompiledParser(table).parse(stream)
+
+    @args(EOF)
+    def test_empty_input(self):
+        self.result()
+
+    @args(x, y, x, z, EOF)
+    def test_nested(self):
+        self.result()
+
+
+class TestCompiledParserParseExecutables(TestCase):
+    def subject(self, *stream):
+        table = SLRGenerator(grammar_1).generate().compile()
+        CompiledParser(table).parse(stream)
+        return self.reduced
+
+    def setUp(self):
+        self.reduced = []
+        execute_on(rule_2_1)(lambda *a: self.reduced.append(list(map(str, a))))
+
+    def tearDown(self):
+        ExecutablesRegistry.clear()
+
+    @args(x, PLUS, x, EOF)
+    def test_calls_executables_with_popped_symbols(self):
+        self.assertResult([["E", "+", "T"]])
+
+    @args(x, PLUS, EOF)
+    def test_unexpected_token(self):
+        self.assertResultRaisesRegex(
+            UnexpectedTokenError,
+            r"Received token: \$; expected one of: \['x', 'E', 'T'\]",
+        )
@@ -0,0 +1,152 @@
+from unittest_extensions import TestCase, args
+
+from syntactes import LALR1Generator, LR0Generator, LR1Generator, SLRGenerator
+from syntactes.parser import (
+    CompressedParser,
+    ExecutablesRegistry,
+    LR1Parser,
+    NotAcceptedError,
+    UnexpectedTokenError,
+    execute_on,
+)
+from syntactes.parsing_table import MappedState
+from syntactes.tests.data import (
+    EOF,
+    LPAREN,
+    PLUS,
+    RPAREN,
+    grammar_1,
+    grammar_2,
+    grammar_3,
+    grammar_4,
+    rule_2_1,
+    x,
+    y,
+    z,
+)
+
+
+class TestCompressedParsingTable(TestCase):
+    def subject(self, generator_cls, grammar):
+        self.table = generator_cls(grammar).generate()
+        return self.table.compress()
+
+    def assert_same_rows(self):
+        compressed = self.result()
+
+        self.assertEqual(compressed.n_states, len(self.table.rows))
+        for state, row in self.table.rows.items():
+            compressed_state = compressed.state(state.number)
+            self.assertEqual(compressed_state.is_final, state.is_final)
+            self.assertDictEqual(
+                {
+                    t: list(map(str, a))
+                    for t, a in compressed.get(compressed_state).items()
+                },
+                {t: list(map(str, a)) for t, a in row.items()},
+            )
+            for token in row:
+                target = self.table.get_goto_state(state, token)
+                self.assertEqual(
+                    compressed.get_goto_state(compressed_state, token),
+                    None if target is None else compressed.state(target.number),
+                )
+
+    @args(LR0Generator, grammar_1)
+    def test_lr0_with_conflict(self):
+        self.assert_same_rows()
+
+    @args(SLRGenerator, grammar_4)
+    def test_slr(self):
+        self.assert_same_rows()
+
+    @args(LALR1Generator, grammar_3)
+    def test_lalr1_with_null_rule(self):
+        self.assert_same_rows()
+
+    @args(LR1Generator, grammar_2)
+    def test_lr1(self):
+        self.assert_same_rows()
+
+    @args(LR1Generator, grammar_4)
+    def test_compression_ratio(self):
+        compressed = self.result()
+        self.assertLess(compressed.nbytes(), compressed.dense_nbytes())
+        self.assertGreater(compressed.compression_ratio(), 1)
+
+    @args(LR1Generator, grammar_2)
+    def test_get_actions_of_unknown_state(self):
+        self.assertIsNone(self.result().get_actions(MappedState(100, False), EOF))
+
+
+class TestCompressedParsingTableParse(TestCase):
+    def subject(self, *stream):
+        return LR1Parser(LR1Generator(grammar_2).generate().compress()).parse(stream)
+
+    @args(LPAREN, RPAREN, LPAREN, LPAREN, RPAREN, RPAREN, EOF)
+    def test_accepts(self):
+        self.result()
+
+    @args(LPAREN, LPAREN, RPAREN, EOF)
+    def test_rejects(self):
+        self.assertResultRaises(UnexpectedTokenError)
+
+
+class TestCompressedParserParse(TestCase):
+    def subject(self, *stream):
+        return CompressedParser.from_grammar(grammar_2).parse(stream)
+
+    @args(LPAREN, RPAREN, LPAREN, LPAREN, RPAREN, RPAREN, EOF)
+    def test_accepts(self):
+        self.result()
+
+    @args(LPAREN, LPAREN, RPAREN, EOF)
+    def test_rejects(self):
+        self.assertResultRaises(UnexpectedTokenError)
+
+    @args(LPAREN, RPAREN)
+    def test_no_eof_raises(self):
+        self.assertResultRaises(NotAcceptedError)
+
+
+class TestCompressedParserParseNullable(TestCase):
+    def subject(self, *stream):
+        table = LALR1Generator(grammar_3).generate().compress()
+        return CompressedParser(table).parse(stream)
+
+    @args(EOF)
+    def test_empty_input(self):
+        self.result()
+
+    @args(x, y, x, z, EOF)
+    def test_nested(self):
+        self.result()
+
+    @args(x, EOF)
+    def test_incomplete_raises(self):
+        self.assertResultRaises(UnexpectedTokenError)
+
+
+class TestCompressedParserParseExecutables(TestCase):
+    def subject(self, *stream):
+        table = SLRGenerator(grammar_1).generate().compress()
+        CompressedParser(table).parse(stream)
+        return self.reduced
+
+    def setUp(self):
+        self.reduced = []
+        execute_on(rule_2_1)(lambda *a: self.reduced.append(list(map(str, a))))
+
+    def tearDown(self):
+        ExecutablesRegistry.clear()
+
+    @args(x, PLUS, x, EOF)
+    def test_calls_executables_with_popped_symbols(self):
+        self.assertResult([["E", "+", "T"]])
+
+    @args(x, PLUS, EOF)
+    def test_unexpected_token(self):
+        self.assertResultRaisesRegex(
+            UnexpectedTokenError,
+            r"Received token: \$; expected one of: \['x', 'E', 'T'\]",
+        )
@@ -0,0 +1,94 @@
+import csv
+import io
+
+from unittest_extensions import TestCase, args
+
+from syntactes import Grammar, LR0Generator, LR1Generator, Rule, Token
+from syntactes.tests.data import grammar_1, grammar_5, slr_parsing_table
+
+SLR_CSV = (
+    "state,$,+,E,S,T,x\r\n"
+    "1,,,s2,,s3,s5\r\n"
+    "2,a,,,,,\r\n"
+    "3,r2,s4,,,,\r\n"
+    "4,,,s6,,s3,s5\r\n"
+    "5,r3,r3,,,,\r\n"
+    "6,r1,,,,,\r\n"
+)
+
+SLR_MARKDOWN = (
+    "| state | $ | + | E | S | T | x |\n"
+    "|---:|:---:|:---:|:---:|:---:|:---:|:---:|\n"
+    "| 1 |  |  | s2 |  | s3 | s5 |\n"
+    "| 2 | a |  |  |  |  |  |\n"
+    "| 3 | r2 | s4 |  |  |  |  |\n"
+    "| 4 |  |  | s6 |  | s3 | s5 |\n"
+    "| 5 | r3 | r3 |  |  |  |  |\n"
+    "| 6 | r1 |  |  |  |  |  |\n"
+)
+
+
+class TestWriteText(TestCase):
+    def subject(self, table):
+        file = io.StringIO()
+        table.write_text(file)
+        return file.getvalue()
+
+    @args(slr_parsing_table())
+    def test_writes_pretty_str(self):
+        self.assertResult(slr_parsing_table().pretty_str())
+
+    @args(slr_parsing_table())
+    def test_rows_in_state_order(self):
+        cells = [line[3:].split(" ")[0] for line in self.result().splitlines()]
+        numbers = [cell for cell in cells if cell.isdigit()]
+        self.assertEqual(numbers, ["1", "2", "3", "4", "5", "6"])
+
+    @args(slr_parsing_table())
+    def test_writes_rules_and_header(self):
+        self.assertTrue(self.result().startswith("GRAMMAR RULES\n-------------\n"))
+        self.assertIn(
+            "\n3. T -> x\n-------------\n\nSLR PARSING TABLE\n", self.result()
+        )
+
+    @args(LR1Generator(grammar_5).generate())
+    def test_lr1_header(self):
+        self.assertIn("\nLR1 PARSING TABLE\n", self.result())
+
+
+class TestWriteCSV(TestCase):
+    def subject(self, table):
+        file = io.StringIO(newline="")
+        table.write_csv(file)
+        return file.getvalue()
+
+    @args(slr_parsing_table())
+    def test_writes_csv(self):
+        self.assertResult(SLR_CSV)
+
+    @args(LR0Generator(grammar_1).generate())
+    def test_conflicting_actions_in_one_field(self):
+        records = list(csv.reader(io.StringIO(self.result(), newline="")))
+        header = records[0]
+        state_4 = next(r for r in records if r[0] == "4")
+        self.assertEqual(state_4[header.index("+")], "s5,r2")
+
+
+class TestWriteMarkdown(TestCase):
+    def subject(self, table):
+        file = io.StringIO()
+        table.write_markdown(file)
+        return file.getvalue()
+
+    @args(slr_parsing_table())
+    def test_writes_markdown(self):
+        self.assertResult(SLR_MARKDOWN)
+
+    def test_escapes_pipes_in_tokens(self):
+        S = Token("S", False)
+        PIPE = Token("|", True)
+        rule = Rule(0, S, PIPE, Token.eof())
+        table = LR0Generator(Grammar(rule, [rule], {S, PIPE, Token.eof()})).generate()
+
+        header = self.subject(table).splitlines()[0]
+        self.assertEqual(header, "| state | $ | S | \\| |")
@@ -1,19 +1,57 @@
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+import warnings
+
 from unittest_extensions import TestCase, args
 
+from syntactes import GenerationStats, Grammar, GrammarDiff, Rule
 from syntactes._action import Action, ActionType
 from syntactes._item import LR0Item, LR1Item
-from syntactes.generator import LR0Generator, LR1Generator, SLRGenerator
+from syntactes._state import LR0State
+from syntactes.generator import (
+    LALR1Generator,
+    LR0Generator,
+    LR1Generator,
+    SLRGenerator,
+)
+from syntactes.parser import (
+    CompiledParser,
+    ExecutablesRegistry,
+    LR1Parser,
+    ParserError,
+    execute_on,
+)
+from syntactes.parsing_table import (
+    ConflictError,
+    ConflictType,
+    Entry,
+    LR0ParsingTable,
+)
 from syntactes.tests.data import (
     EOF,
+    EQUALS,
+    ID,
+    STAR,
+    LESS,
     LPAREN,
     PLUS,
     RPAREN,
+    A,
+    B,
     C,
     E,
     L,
+    S,
     T,
+    a,
+    b,
     grammar_1,
     grammar_2,
+    grammar_3,
+    grammar_4,
+    grammar_5,
+    grammar_6,
+    grammar_7,
     lr0_state_1,
     lr0_state_2,
     lr0_state_3,
@@ -34,12 +72,27 @@ from syntactes.tests.data import (
     lr1_state_12,
     rule_2_1,
     rule_2_2,
+    rule_2_3,
+    rule_2_4,
     rule_3_1,
     rule_3_2,
+    rule_3_3,
+    rule_3_4,
+    rule_4_3,
+    rule_4_4,
+    rule_5_4,
+    rule_6_4,
     rule_4_1,
     rule_4_2,
     rule_5_2,
+    rule_1_6,
+    rule_6_6,
+    rules_6,
+    terminal_set_2,
+    tokens_6,
     x,
+    y,
+    z,
 )
 
 
@@ -250,6 +303,38 @@ class TestLR0GeneratorGenerateActions(TestLR0Generator):
         self.assert_state_actions(reduce(rule_2_1))
 
 
+class TestLR0GeneratorGenerateActionAndGotoTables(TestLR0Generator):
+    def subject(self):
+        return self.generator().generate()
+
+    def test_action_table_has_terminals(self):
+        table = self.result()
+        self.assertEqual(
+            {t for row in table.actions.values() for t in row}, {x, PLUS, EOF}
+        )
+
+    def test_action_table_has_actions_of_rows(self):
+        table = self.result()
+        for state, row in table.actions.items():
+            for token, actions in row.items():
+                self.assertEqual(actions, table.get(state)[token])
+
+    def test_goto_table(self):
+        self.assertEqual(
+            self.result().gotos,
+            {
+                lr0_state_1(): {E: lr0_state_2(), T: lr0_state_3()},
+                lr0_state_4(): {E: lr0_state_6(), T: lr0_state_3()},
+            },
+        )
+
+    def test_get_goto_state(self):
+        self.assertEqual(self.result().get_goto_state(lr0_state_4(), E), lr0_state_6())
+
+    def test_get_goto_state_without_goto(self):
+        self.assertIsNone(self.result().get_goto_state(lr0_state_2(), E))
+
+
 class TestLR0GeneratorGenerateInitialState(TestLR0Generator):
     def subject(self):
         return self.generator().generate().initial_state
@@ -258,6 +343,97 @@ class TestLR0GeneratorGenerateInitialState(TestLR0Generator):
         self.assertResult(lr0_state_1())
 
 
+class TestLR0GeneratorGenerateCallCounts(TestLR0Generator):
+    def subject(self):
+        generator = self.generator()
+        with (
+            patch.object(
+                generator, "_successor_kernels", wraps=generator._successor_kernels
+            ) as successors,
+            patch.object(generator, "closure", wraps=generator.closure) as closure,
+        ):
+            generator.generate()
+
+        return successors.call_count, closure.call_count
+
+    def test_every_state_is_expanded_once(self):
+        # one grouping of successor kernels and one closure per state.
+        self.assertResult((6, 6))
+
+
+class TestLR0GeneratorGenerateStats(TestLR0Generator):
+    def subject(self):
+        self.stats = GenerationStats()
+        self.progress = []
+        return self.generator().generate(
+            stats=self.stats, progress=self.progress.append
+        )
+
+    def test_counts(self):
+        self.result()
+        self.assertEqual(self.stats.states, 6)
+        self.assertEqual(self.stats.closure_calls, 6)
+        self.assertEqual(self.stats.goto_calls, 7)
+        self.assertEqual(self.stats.items, 13)
+        self.assertEqual(self.stats.entries, 17)
+        self.assertEqual(self.stats.conflicts, len(self.result().conflicts()))
+
+    def test_phase_times(self):
+        self.result()
+        self.assertListEqual(
+            list(self.stats.phase_times), ["states", "reduce_entries", "table"]
+        )
+
+    def test_progress_is_called_for_every_state(self):
+        self.result()
+        self.assertListEqual(self.progress, [1, 2, 3, 4, 5, 6])
+
+    def test_later_generation_is_not_counted(self):
+        self.result()
+        self.generator().generate()
+        self.assertEqual(self.stats.closure_calls, 6)
+        self.assertEqual(self.stats.goto_calls, 7)
+        self.assertListEqual(self.progress, [1, 2, 3, 4, 5, 6])
+
+
+class TestLR0GeneratorTransitions(TestLR0Generator):
+    def subject(self, state):
+        return self.generator().transitions(state)
+
+    # S -> . E $
+    # E -> . T + E
+    # E -> . T
+    # T -> . x
+    @args(lr0_state_1())
+    def test_initial_state(self):
+        self.assertResult({E: lr0_state_2(), T: lr0_state_3(), x: lr0_state_5()})
+
+    # S -> E . $
+    @args(lr0_state_2())
+    def test_final_state(self):
+        self.assertResult({})
+
+    # E -> T . + E
+    # E -> T .
+    @args(lr0_state_3())
+    def test_state_with_reduce_item(self):
+        self.assertResult({PLUS: lr0_state_4()})
+
+    @args(lr0_state_4())
+    def test_closure_of_successors(self):
+        self.assertSetEqual(
+            self.result()[T].items, {LR0Item(rule_2_1, 1), LR0Item(rule_3_1, 1)}
+        )
+
+    @args(lr0_state_1())
+    def test_groups_items_with_same_symbol(self):
+        generator = self.generator()
+        with patch.object(generator, "closure", wraps=generator.closure) as closure:
+            self.result()
+
+        self.assertEqual(closure.call_count, 3)
+
+
 class TestSLRGenerator(TestCase):
     def setUp(self):
         self._generator = SLRGenerator(grammar_1)
@@ -375,6 +551,90 @@ class TestSLRGeneratorGenerateInitialState(TestSLRGenerator):
         self.assertResult(lr0_state_1())
 
 
+class TestLALR1Generator(TestCase):
+    def setUp(self):
+        self._generator = LALR1Generator(self.grammar)
+
+    def generator(self):
+        return self._generator
+
+
+class TestLALR1GeneratorGenerate(TestLALR1Generator):
+    grammar = grammar_4
+
+    def subject(self):
+        return self.generator().generate()
+
+    def test_no_conflicts(self):
+        self.assertListEqual(self.result().conflicts(), [])
+
+    def test_slr_table_has_conflicts(self):
+        self.assertEqual(len(SLRGenerator(self.grammar).generate().conflicts()), 1)
+
+    def test_has_as_many_states_as_lr0_automaton(self):
+        self.assertEqual(
+            len(self.result().rows), len(LR0Generator(self.grammar).get_states())
+        )
+
+
+class TestLALR1GeneratorGenerateActions(TestLALR1Generator):
+    grammar = grammar_4
+
+    def subject(self, items, token):
+        state = LR0State.from_items(items)
+        return self.generator().generate().get(state).get(token)
+
+    def assert_reduce(self, rule):
+        self.assertCountEqual(self.result(), [reduce(rule)])
+
+    # E -> L . = R
+    # R -> L .
+    @args({LR0Item(rule_2_4, 1), LR0Item(rule_6_4, 1)}, EOF)
+    def test_reduce_on_lookahead(self):
+        self.assert_reduce(rule_6_4)
+
+    # E -> L . = R
+    # R -> L .
+    @args({LR0Item(rule_2_4, 1), LR0Item(rule_6_4, 1)}, EQUALS)
+    def test_shift_without_reduce_on_follow_symbol(self):
+        self.assertCountEqual(
+            map(lambda a: a.action_type, self.result()), [ActionType.SHIFT]
+        )
+
+    # L -> id .
+    @args({LR0Item(rule_5_4, 1)}, EQUALS)
+    def test_reduce_on_follow_symbol_of_other_state(self):
+        self.assert_reduce(rule_5_4)
+
+
+class TestLALR1GeneratorGenerateNullable(TestLALR1Generator):
+    grammar = grammar_3
+
+    def subject(self, items):
+        state = LR0State.from_items(items)
+        return self.generator().generate().get(state).keys()
+
+    # S -> . A $
+    # A -> . x B
+    # A -> .
+    @args(
+        {
+            LR0Item(grammar_3.starting_rule, 0),
+            LR0Item(rule_2_3, 0),
+            LR0Item(rule_3_3, 0),
+        }
+    )
+    def test_initial_state(self):
+        self.assertCountEqual(self.result(), {x, A, EOF})
+
+    # B -> y . A
+    # A -> . x B
+    # A -> .
+    @args({LR0Item(rule_4_3, 1), LR0Item(rule_2_3, 0), LR0Item(rule_3_3, 0)})
+    def test_reduce_on_follow_of_mutually_recursive_non_terminals(self):
+        self.assertCountEqual(self.result(), {x, A, EOF, z})
+
+
 class TestLR1Generator(TestCase):
     def setUp(self):
         self._generator = LR1Generator(grammar_2)
@@ -409,6 +669,46 @@ class TestLR1GeneratorGetStates(TestLR1Generator):
         )
 
 
+class TestLR1GeneratorGenerateCallCounts(TestLR1Generator):
+    def subject(self):
+        generator = self.generator()
+        with (
+            patch.object(
+                generator, "_successor_kernels", wraps=generator._successor_kernels
+            ) as successors,
+            patch.object(generator, "closure", wraps=generator.closure) as closure,
+        ):
+            generator.generate()
+
+        return successors.call_count, closure.call_count
+
+    def test_every_state_is_expanded_once(self):
+        self.assertResult((12, 12))
+
+
+class TestLR1GeneratorMergeStates(TestCase):
+    def subject(self, grammar):
+        canonical = LR1Generator(grammar).generate()
+        merged = LR1Generator(grammar, merge_states=True).generate()
+        return len(canonical.rows), len(merged.rows), len(merged.conflicts())
+
+    @args(grammar_2)
+    def test_merges_states_with_same_core(self):
+        self.assertResult((12, 8, 0))
+
+    @args(grammar_3)
+    def test_merges_states_of_nullable_grammar(self):
+        self.assertResult((14, 8, 0))
+
+    @args(grammar_5)
+    def test_does_not_merge_incompatible_states(self):
+        self.assertResult((14, 14, 0))
+
+    @args(grammar_5)
+    def test_lalr1_table_has_reduce_reduce_conflicts(self):
+        self.assertEqual(len(LALR1Generator(grammar_5).generate().conflicts()), 2)
+
+
 class TestLR1GeneratorGenerateEntries(TestLR1Generator):
     def subject(self, state):
         return self.generator().generate().get(state)
@@ -570,19 +870,32 @@ class TestLR1GeneratorClosure(TestLR1Generator):
         return self.generator().closure(items)
 
     # S -> . L, $
-    @args({LR1Item(grammar_2.starting_rule, 0, EOF)})
+    @args({LR1Item(grammar_2.starting_rule, 0, terminal_set_2({EOF}))})
     def test_with_starting_item(self):
         self.assert_items(
             {
                 "S -> . L $, $",
-                "L -> . L C, $",
-                "L -> . L C, (",
-                "L -> . C, $",
-                "L -> . C, (",
-                "C -> . ( C ), $",
-                "C -> . ( C ), (",
-                "C -> . ( ), $",
-                "C -> . ( ), (",
+                "L -> . L C, $/(",
+                "L -> . C, $/(",
+                "C -> . ( C ), $/(",
+                "C -> . ( ), $/(",
+            }
+        )
+
+    # L -> L . C, $
+    # L -> L . C, (
+    @args(
+        {
+            LR1Item(rule_2_2, 1, terminal_set_2({EOF})),
+            LR1Item(rule_2_2, 1, terminal_set_2({LPAREN})),
+        }
+    )
+    def test_merges_items_with_same_core(self):
+        self.assert_items(
+            {
+                "L -> L . C, $/(",
+                "C -> . ( C ), $/(",
+                "C -> . ( ), $/(",
             }
         )
 
@@ -595,11 +908,497 @@ class TestLR1GeneratorGoto(TestLR1Generator):
     def test_starting_item_with_other_token(self):
         self.assert_items(
             {
-                "C -> ( . C ), $",
-                "C -> ( . C ), (",
-                "C -> ( . ), $",
-                "C -> ( . ), (",
+                "C -> ( . C ), $/(",
+                "C -> ( . ), $/(",
                 "C -> . ( C ), )",
                 "C -> . ( ), )",
             }
         )
+
+
+class TestGeneratorGenerateWithWorkers(TestCase):
+    def subject(self, generator_cls, grammar):
+        return generator_cls(grammar).generate(workers=2)
+
+    def assert_same_as_serial(self):
+        generator_cls, grammar = self.subjectArgs()
+        serial = generator_cls(grammar).generate()
+        parallel = self.result()
+
+        self.assertEqual(parallel.pretty_str(), serial.pretty_str())
+        self.assertDictEqual(
+            {s.number: s.kernel for s in parallel.rows},
+            {s.number: s.kernel for s in serial.rows},
+        )
+
+    @args(LR0Generator, grammar_1)
+    def test_lr0(self):
+        self.assert_same_as_serial()
+
+    @args(LALR1Generator, grammar_3)
+    def test_lalr1(self):
+        self.assert_same_as_serial()
+
+    @args(LR1Generator, grammar_2)
+    def test_lr1(self):
+        self.assert_same_as_serial()
+
+    @args(LR1Generator, grammar_2)
+    def test_one_process_per_core(self):
+        with (
+            patch("syntactes.generator._PARALLEL_KERNELS", 1),
+            patch("syntactes.generator.os.cpu_count", return_value=1),
+            patch("syntactes.generator.ProcessPoolExecutor") as executor,
+        ):
+            self.assert_same_as_serial()
+
+        executor.assert_not_called()
+
+    @args(LR1Generator, grammar_2)
+    def test_small_levels_are_expanded_serially(self):
+        with (
+            patch("syntactes.generator.os.cpu_count", return_value=2),
+            patch("syntactes.generator.ProcessPoolExecutor") as executor,
+        ):
+            self.assert_same_as_serial()
+
+        executor.assert_not_called()
+
+    @args(LR1Generator, grammar_2)
+    def test_large_levels_are_expanded_in_pool(self):
+        with (
+            patch("syntactes.generator._PARALLEL_KERNELS", 1),
+            patch("syntactes.generator.os.cpu_count", return_value=2),
+            patch(
+                "syntactes.generator.ProcessPoolExecutor",
+                side_effect=ProcessPoolExecutor,
+            ) as executor,
+        ):
+            self.assert_same_as_serial()
+
+        executor.assert_called_once()
+
+
+class TestGeneratorRegenerate(TestCase):
+    def subject(self, generator_cls, grammar, diff):
+        generator = generator_cls(grammar)
+        previous = generator.generate()
+
+        with (
+            patch.object(
+                generator_cls,
+                "closure",
+                autospec=True,
+                side_effect=generator_cls.closure,
+            ) as closure,
+            patch.object(
+                generator_cls,
+                "_successor_kernels",
+                autospec=True,
+                side_effect=generator_cls._successor_kernels,
+            ) as successor_kernels,
+            patch.object(
+                generator_cls,
+                "_create_reduce_entries",
+                autospec=True,
+                side_effect=generator_cls._create_reduce_entries,
+            ) as create_reduce_entries,
+        ):
+            table = generator.regenerate(previous, diff)
+
+        self.generator = generator
+        self.closure_calls = closure.call_count
+        self.successor_kernels_calls = successor_kernels.call_count
+        [(_, states), _] = create_reduce_entries.call_args
+        self.reduced_states = len(states)
+        return table
+
+    def assert_same_as_fresh_build(self):
+        generator_cls, grammar, diff = self.subjectArgs()
+        fresh = generator_cls(diff.apply(grammar)).generate()
+
+        self.assertEqual(self.result().pretty_str(), fresh.pretty_str())
+
+    @args(LR0Generator, grammar_1, GrammarDiff(added=[Rule(4, T, y)]))
+    def test_lr0_added_rule(self):
+        self.assert_same_as_fresh_build()
+
+    @args(SLRGenerator, grammar_4, GrammarDiff(removed=[rule_4_4]))
+    def test_slr_removed_rule(self):
+        self.assert_same_as_fresh_build()
+
+    @args(LALR1Generator, grammar_3, GrammarDiff(added=[Rule(5, B, z)]))
+    def test_lalr1_added_rule(self):
+        self.assert_same_as_fresh_build()
+
+    @args(LR1Generator, grammar_2, GrammarDiff(removed=[rule_5_2]))
+    def test_lr1_removed_rule(self):
+        self.assert_same_as_fresh_build()
+
+    @args(LR1Generator, grammar_2, GrammarDiff(added=[Rule(5, C, x)]))
+    def test_lr1_added_terminal(self):
+        self.assert_same_as_fresh_build()
+
+    @args(LR1Generator, grammar_2, GrammarDiff(removed=[rule_5_2]))
+    def test_reuses_unaffected_states(self):
+        # 10 states; only the initial state and 3 states with C or L at or
+        # after the dot of some item are closed again.
+        self.result()
+        self.assertEqual(self.closure_calls, 4)
+
+    @args(LR1Generator, grammar_2, GrammarDiff(removed=[rule_5_2]))
+    def test_reuses_successors_and_reduce_entries(self):
+        # only the states that are closed again are expanded and reduced
+        self.result()
+        self.assertEqual(self.successor_kernels_calls, 4)
+        self.assertEqual(self.reduced_states, 4)
+
+    @args(SLRGenerator, grammar_2, GrammarDiff(removed=[rule_5_2]))
+    def test_slr_reuses_reduce_entries(self):
+        self.assert_same_as_fresh_build()
+        self.assertEqual(self.reduced_states, 3)
+
+    @args(LR1Generator, grammar_6, GrammarDiff(removed=[rule_6_6]))
+    def test_lr1_with_precedence(self):
+        self.assert_same_as_fresh_build()
+
+    def test_lr1_merged_states(self):
+        diff = GrammarDiff(removed=[rule_5_2])
+        generator = LR1Generator(grammar_2, merge_states=True)
+        table = generator.regenerate(generator.generate(), diff)
+
+        fresh = LR1Generator(diff.apply(grammar_2), merge_states=True).generate()
+        self.assertEqual(table.pretty_str(), fresh.pretty_str())
+
+    def test_lr1_removed_lookahead(self):
+        # z is not a token, and it is only a lookahead of A -> b . after the
+        # diff, which does not affect that state
+        rule = Rule(1, E, a, A, z)
+        rules = [Rule(0, S, E, EOF), rule, Rule(2, E, b), Rule(3, A, b)]
+        grammar = Grammar(rules[0], rules, {S, E, A, a, b, EOF})
+
+        diff = GrammarDiff(removed=[rule])
+        generator = LR1Generator(grammar)
+        table = generator.regenerate(generator.generate(), diff)
+
+        fresh = LR1Generator(diff.apply(grammar)).generate()
+        self.assertEqual(table.pretty_str(), fresh.pretty_str())
+
+    @args(LR1Generator, grammar_2, GrammarDiff(removed=[rule_5_2]))
+    def test_generator_is_configured_for_edited_grammar(self):
+        self.result()
+        self.assertNotIn(rule_5_2, self.generator.grammar.rules)
+
+
+class TestGeneratorSimplify(TestCase):
+    def subject(self, generator_cls, grammar):
+        self.plain = generator_cls(grammar).generate()
+        self.generator = generator_cls(grammar, simplify=True)
+        return self.generator.generate()
+
+    def tearDown(self):
+        ExecutablesRegistry.clear()
+
+    @args(LALR1Generator, grammar_3)
+    def test_inlining_removes_states(self):
+        self.assertEqual(len(self.result().rows), len(self.plain.rows) - 1)
+
+    @args(LR1Generator, grammar_4)
+    def test_unit_reductions_are_bypassed(self):
+        # the states that only reduce E -> R or R -> L are skipped
+        self.assertEqual(len(self.result().rows), len(self.plain.rows) - 3)
+
+    @args(LR1Generator, grammar_4)
+    def test_unit_rules_with_executables_are_not_bypassed(self):
+        execute_on(rule_3_4)(lambda _: None)
+        execute_on(rule_6_4)(lambda _: None)
+        self.assertEqual(self.result().pretty_str(), self.plain.pretty_str())
+
+    @args(LR0Generator, grammar_3)
+    def test_falls_back_to_given_grammar_on_conflicts(self):
+        self.assertEqual(self.result().pretty_str(), self.plain.pretty_str())
+
+    @args(SLRGenerator, grammar_4)
+    def test_accepts_same_language(self):
+        parser = LR1Parser(self.result())
+        parser.parse([STAR, ID, EQUALS, STAR, STAR, ID, EOF])
+        with self.assertRaises(ParserError):
+            parser.parse([ID, EQUALS, ID, EQUALS, ID, EOF])
+
+    def test_derived_rules_run_executables_of_origins(self):
+        # T is inlined into E -> T, so E -> x runs the executable of T -> x
+        rule_3 = Rule(2, T, x)
+        rules = [Rule(0, S, E, EOF), Rule(1, E, T), rule_3, Rule(3, T, y)]
+        grammar = Grammar(rules[0], rules, {S, E, T, x, y, EOF})
+        generator = LR1Generator(grammar, simplify=True)
+
+        calls = []
+        execute_on(rule_3)(calls.append)
+        table = generator.generate()
+        LR1Parser(table).parse([x, EOF])
+        CompiledParser(table.compile()).parse([x, EOF])
+
+        self.assertEqual(calls, [x, x])
+        self.assertEqual(set(table.origins.values()), {rule_3, Rule(3, T, y)})
+        self.assertFalse(
+            any(ExecutablesRegistry.is_registered(r) for r in table.origins)
+        )
+
+    @args(LALR1Generator, grammar_3)
+    def test_regenerate(self):
+        self.result()
+        diff = GrammarDiff(added=[Rule(5, B, z)])
+        fresh = LALR1Generator(diff.apply(grammar_3), simplify=True).generate()
+        table = self.generator.regenerate(self.result(), diff)
+        self.assertEqual(table.pretty_str(), fresh.pretty_str())
+
+
+class TestGeneratorPrune(TestCase):
+    def subject(self, generator_cls, grammar, **kwargs):
+        self.plain = generator_cls(grammar).generate()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            self.generator = generator_cls(grammar, prune=True, **kwargs)
+        return self.generator.generate()
+
+    @args(LR0Generator, grammar_7)
+    def test_lr0(self):
+        expected = LR0Generator(grammar_1).generate()
+        self.assertEqual(self.result().pretty_str(), expected.pretty_str())
+
+    @args(SLRGenerator, grammar_7)
+    def test_slr(self):
+        expected = SLRGenerator(grammar_1).generate()
+        self.assertEqual(self.result().pretty_str(), expected.pretty_str())
+
+    @args(LALR1Generator, grammar_7)
+    def test_lalr1(self):
+        expected = LALR1Generator(grammar_1).generate()
+        self.assertEqual(self.result().pretty_str(), expected.pretty_str())
+
+    @args(LR1Generator, grammar_7)
+    def test_lr1(self):
+        expected = LR1Generator(grammar_1).generate()
+        self.assertEqual(self.result().pretty_str(), expected.pretty_str())
+
+    @args(LR1Generator, grammar_7)
+    def test_removes_states(self):
+        self.assertLess(len(self.result().rows), len(self.plain.rows))
+
+    @args(SLRGenerator, grammar_7)
+    def test_keeps_report(self):
+        self.result()
+        self.assertEqual(len(self.generator.pruning.removed_rules), 4)
+
+    def test_no_report_without_prune(self):
+        self.assertIsNone(SLRGenerator(grammar_1).pruning)
+
+    def test_warns_about_unused_tokens(self):
+        with self.assertWarns(UserWarning):
+            SLRGenerator(grammar_7, prune=True)
+
+    def test_starting_rule_with_unproductive_symbol(self):
+        rule = Rule(0, S, A, EOF)
+        rules = (rule, Rule(1, S, b, EOF), Rule(2, A, A, a))
+        grammar = Grammar(rule, rules, {S, A, a, b, EOF})
+        for generator_cls in (LR0Generator, SLRGenerator, LALR1Generator, LR1Generator):
+            with self.assertRaises(ValueError):
+                generator_cls(grammar, prune=True)
+
+    @args(LALR1Generator, grammar_7, simplify=True)
+    def test_with_simplify(self):
+        expected = LALR1Generator(grammar_1, simplify=True).generate()
+        self.assertEqual(self.result().pretty_str(), expected.pretty_str())
+
+    @args(LR1Generator, grammar_7, merge_states=True)
+    def test_merged_lr1(self):
+        expected = LR1Generator(grammar_1, merge_states=True).generate()
+        self.assertEqual(self.result().pretty_str(), expected.pretty_str())
+
+    @args(SLRGenerator, grammar_7)
+    def test_parallel(self):
+        table = self.result()
+        self.assertEqual(self.generator.generate(2).pretty_str(), table.pretty_str())
+
+    @args(SLRGenerator, grammar_7)
+    def test_regenerate(self):
+        previous = self.result()
+        diff = GrammarDiff(added=[Rule(8, T, B)])
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            fresh = SLRGenerator(diff.apply(grammar_7), prune=True).generate()
+            table = self.generator.regenerate(previous, diff)
+        self.assertEqual(table.pretty_str(), fresh.pretty_str())
+        self.assertEqual(len(self.generator.pruning.removed_rules), 3)
+
+
+class TestGeneratorPrecedence(TestCase):
+    def subject(self, generator_cls, grammar):
+        return generator_cls(grammar).generate()
+
+    def assert_single_actions(self):
+        table = self.result()
+        self.assertEqual(table.conflicts(), [])
+        for row in table.rows.values():
+            for actions in row.values():
+                self.assertEqual(len(actions), 1)
+
+    @args(LR0Generator, grammar_6)
+    def test_lr0(self):
+        self.assert_single_actions()
+
+    @args(SLRGenerator, grammar_6)
+    def test_slr(self):
+        self.assert_single_actions()
+
+    @args(LALR1Generator, grammar_6)
+    def test_lalr1(self):
+        self.assert_single_actions()
+
+    @args(LR1Generator, grammar_6)
+    def test_lr1(self):
+        self.assert_single_actions()
+
+    @args(SLRGenerator, Grammar(rule_1_6, rules_6, tokens_6))
+    def test_conflicts_without_precedence(self):
+        self.assertGreater(len(self.result().conflicts()), 0)
+
+    @args(SLRGenerator, grammar_6)
+    def test_non_associative_cell_is_error(self):
+        # after `E < E` neither `<` is shifted nor `E -> E < E` reduced
+        table = self.result()
+        state = next(
+            s
+            for s in table.rows
+            if any(i.rule.rhs[1:2] == (LESS,) and i.position == 3 for i in s.items)
+        )
+        self.assertIsNone(table.get_actions(state, LESS))
+        self.assertIsNotNone(table.get_actions(state, PLUS))
+
+
+class TestParsingTableConflicts(TestCase):
+    def subject(self, *entries):
+        table = LR0ParsingTable(grammar_1)
+        for entry in entries:
+            table.add_entry(entry)
+        return table
+
+    @args(Entry(lr0_state_3(), PLUS, shift(lr0_state_4())))
+    def test_no_conflicts(self):
+        self.assertFalse(self.result().has_conflicts())
+        self.assertEqual(self.result().conflicts(), [])
+
+    @args(
+        Entry(lr0_state_3(), PLUS, shift(lr0_state_4())),
+        Entry(lr0_state_3(), PLUS, reduce(rule_3_1)),
+    )
+    def test_conflict_is_indexed(self):
+        table = self.result()
+        self.assertTrue(table.has_conflicts())
+        [conflict] = table.conflicts()
+        self.assertEqual(
+            (conflict.state, conflict.token, conflict.actions),
+            (lr0_state_3(), PLUS, [shift(lr0_state_4()), reduce(rule_3_1)]),
+        )
+
+    @args(
+        Entry(lr0_state_3(), PLUS, shift(lr0_state_4())),
+        Entry(lr0_state_3(), PLUS, reduce(rule_3_1)),
+        Entry(lr0_state_3(), PLUS, reduce(rule_2_1)),
+    )
+    def test_conflict_has_later_actions(self):
+        [conflict] = self.result().conflicts()
+        self.assertEqual(len(conflict.actions), 3)
+
+    @args(
+        Entry(lr0_state_3(), PLUS, reduce(rule_3_1)),
+        Entry(lr0_state_3(), PLUS, reduce(rule_2_1)),
+    )
+    def test_conflict_type_follows_later_actions(self):
+        table = self.result()
+        [conflict] = table.conflicts()
+        self.assertEqual(conflict.conflict_type, ConflictType.REDUCE_REDUCE)
+        table.add_entry(Entry(lr0_state_3(), PLUS, shift(lr0_state_4())))
+        self.assertEqual(conflict.conflict_type, ConflictType.SHIFT_REDUCE)
+
+    def test_same_conflicts_as_rows(self):
+        table = LALR1Generator(grammar_5).generate()
+        self.assertEqual(
+            [(c.state, c.token, c.actions) for c in table.conflicts()],
+            [
+                (state, token, actions)
+                for state, row in table.rows.items()
+                for token, actions in row.items()
+                if len(actions) > 1
+            ],
+        )
+
+
+class TestGeneratorFailOnConflict(TestCase):
+    def subject(self, generator_cls, grammar):
+        self.stats = GenerationStats()
+        return generator_cls(grammar).generate(stats=self.stats, fail_on_conflict=True)
+
+    def conflict(self):
+        with self.assertRaises(ConflictError) as context:
+            self.result()
+        return context.exception.conflict
+
+    def full_closure_calls(self):
+        generator_cls, grammar = self.subjectArgs()
+        stats = GenerationStats()
+        generator_cls(grammar).generate(stats=stats)
+        return stats.closure_calls
+
+    @args(LR0Generator, grammar_1)
+    def test_lr0(self):
+        conflict = self.conflict()
+        self.assertEqual(conflict.conflict_type, ConflictType.SHIFT_REDUCE)
+        self.assertEqual(conflict.token, PLUS)
+        self.assertIn(reduce(rule_3_1), conflict.actions)
+
+    @args(LR0Generator, grammar_1)
+    def test_message(self):
+        with self.assertRaises(ConflictError) as context:
+            self.result()
+        conflict = context.exception.conflict
+        self.assertEqual(
+            str(context.exception),
+            f"shift/reduce conflict in state {conflict.state.number} with token "
+            f"'+': {conflict.actions[0]}, {conflict.actions[1]}",
+        )
+
+    @args(LR1Generator, Grammar(rule_1_6, rules_6, tokens_6))
+    def test_lr1_stops_before_constructing_all_states(self):
+        self.conflict()
+        self.assertLess(self.stats.closure_calls, self.full_closure_calls())
+
+    @args(SLRGenerator, Grammar(rule_1_6, rules_6, tokens_6))
+    def test_slr_stops_before_constructing_all_states(self):
+        self.conflict()
+        self.assertLess(self.stats.closure_calls, self.full_closure_calls())
+
+    @args(LALR1Generator, grammar_5)
+    def test_lalr1_is_checked_once_built(self):
+        self.assertEqual(self.conflict().conflict_type, ConflictType.REDUCE_REDUCE)
+
+    @args(LR1Generator, grammar_6)
+    def test_conflicts_resolved_by_precedence(self):
+        self.assertFalse(self.result().has_conflicts())
+
+    @args(LR1Generator, grammar_5)
+    def test_without_conflicts(self):
+        self.assertFalse(self.result().has_conflicts())
+
+    def test_merged_lr1(self):
+        generator = LR1Generator(
+            Grammar(rule_1_6, rules_6, tokens_6), merge_states=True
+        )
+        with self.assertRaises(ConflictError):
+            generator.generate(fail_on_conflict=True)
+
+    def test_parallel(self):
+        with self.assertRaises(ConflictError):
+            SLRGenerator(Grammar(rule_1_6, rules_6, tokens_6)).generate(
+                2, fail_on_conflict=True
+            )
@@ -0,0 +1,335 @@
+import pickle
+
+from unittest_extensions import TestCase, args
+
+from syntactes import Associativity, Grammar, GrammarDiff, Rule
+from syntactes._action import ActionType
+from syntactes.tests.data import (
+    CARET,
+    EOF,
+    LESS,
+    LPAREN,
+    MINUS,
+    NULL,
+    PLUS,
+    STAR,
+    UMINUS,
+    A,
+    B,
+    C,
+    E,
+    L,
+    S,
+    T,
+    grammar_1,
+    grammar_2,
+    grammar_3,
+    grammar_5,
+    grammar_6,
+    d,
+    rule_1_1,
+    rule_1_2,
+    rule_1_3,
+    rule_2_1,
+    rule_2_2,
+    rule_2_3,
+    rule_3_1,
+    rule_3_2,
+    rule_3_3,
+    rule_4_1,
+    rule_4_2,
+    rule_4_3,
+    rule_5_2,
+    rule_5_3,
+    rule_2_6,
+    rule_4_6,
+    rule_5_6,
+    rule_6_6,
+    rule_7_6,
+    rule_8_6,
+    rules_6,
+    tokens_6,
+    x,
+    y,
+    z,
+)
+
+
+class TestCompiledGrammar(TestCase):
+    def compiled(self):
+        return self.grammar.compile()
+
+
+class TestCompiledGrammarSymbols(TestCompiledGrammar):
+    grammar = grammar_3
+
+    def subject(self):
+        return self.compiled().symbols
+
+    def test_terminals_are_numbered_first(self):
+        self.assertResult((EOF, x, y, z, A, B, S))
+
+    def test_null_token_is_not_a_symbol(self):
+        self.assertNotIn(NULL, self.result())
+
+
+class TestCompiledGrammarSymbolId(TestCompiledGrammar):
+    grammar = grammar_1
+
+    def subject(self, symbol):
+        return self.compiled().symbol_id(symbol)
+
+    @args(EOF)
+    def test_first_terminal(self):
+        self.assertResult(0)
+
+    @args(x)
+    def test_last_terminal(self):
+        self.assertResult(2)
+
+    @args(E)
+    def test_first_non_terminal(self):
+        self.assertResult(3)
+
+    @args(T)
+    def test_last_non_terminal(self):
+        self.assertResult(5)
+
+
+class TestCompiledGrammarRuleId(TestCompiledGrammar):
+    grammar = grammar_1
+
+    def subject(self, rule):
+        return self.compiled().rule_id(rule)
+
+    @args(rule_1_1)
+    def test_starting_rule(self):
+        self.assertResult(0)
+
+    @args(rule_4_1)
+    def test_last_rule(self):
+        self.assertResult(3)
+
+
+class TestCompiledGrammarProductions(TestCompiledGrammar):
+    grammar = grammar_1
+
+    def subject(self, symbol):
+        return self.compiled().productions(symbol)
+
+    @args(E)
+    def test_non_terminal(self):
+        self.assertResult((rule_2_1, rule_3_1))
+
+    @args(S)
+    def test_starting_symbol(self):
+        self.assertResult((rule_1_1,))
+
+    @args(PLUS)
+    def test_terminal(self):
+        self.assertResult(())
+
+
+class TestCompiledGrammarOccurrences(TestCompiledGrammar):
+    grammar = grammar_3
+
+    def subject(self, symbol):
+        return self.compiled().occurrences_of(symbol)
+
+    @args(A)
+    def test_non_terminal(self):
+        self.assertResult(((rule_1_3, 0), (rule_4_3, 1), (rule_5_3, 0)))
+
+    @args(z)
+    def test_terminal(self):
+        self.assertResult(((rule_5_3, 1),))
+
+    @args(y)
+    def test_first_in_rhs(self):
+        self.assertResult(((rule_4_3, 0),))
+
+    @args(S)
+    def test_starting_symbol(self):
+        self.assertResult(())
+
+    @args(B)
+    def test_last_in_rhs(self):
+        self.assertResult(((rule_2_3, 1),))
+
+    @args(NULL)
+    def test_null_token(self):
+        self.assertResult(())
+
+
+class TestCompiledGrammarCompile(TestCompiledGrammar):
+    grammar = grammar_3
+
+    def subject(self):
+        compiled = self.compiled()
+        return compiled.compile() is compiled
+
+    def test_compiling_a_compiled_grammar_returns_it(self):
+        self.assertResult(True)
+
+
+class TestCompiledGrammarRules(TestCompiledGrammar):
+    grammar = grammar_3
+
+    def subject(self):
+        return self.compiled().rules
+
+    def test_rules_are_frozen(self):
+        self.assertResult((rule_1_3, rule_2_3, rule_3_3, rule_4_3, rule_5_3))
+
+
+class TestCompiledGrammarTerminalSet(TestCompiledGrammar):
+    grammar = grammar_3
+
+    def subject(self, tokens):
+        return self.compiled().terminal_set(tokens)
+
+    @args({EOF, y})
+    def test_bits_are_terminal_ids(self):
+        self.assertEqual(self.result().bits, 0b101)
+
+    @args({z, x})
+    def test_iterates_in_id_order(self):
+        self.assertEqual(list(self.result()), [x, z])
+
+    @args({x, y})
+    def test_union(self):
+        self.assertEqual(set(self.result() | self.subject({EOF})), {EOF, x, y})
+
+    @args({x, y})
+    def test_intersection(self):
+        self.assertEqual(set(self.result() & self.subject({y, z})), {y})
+
+    @args({x, y})
+    def test_is_subset(self):
+        self.assertTrue(self.result() <= self.subject({x, y, z}))
+
+    @args(set())
+    def test_empty(self):
+        self.assertFalse(self.result())
+
+    @args({x, y})
+    def test_contains(self):
+        self.assertIn(x, self.result())
+        self.assertNotIn(z, self.result())
+
+    @args({x, y})
+    def test_does_not_contain_other_symbols(self):
+        self.assertNotIn(A, self.result())
+        self.assertNotIn(LPAREN, self.result())
+
+
+class TestGrammarDiff(TestCase):
+    def subject(self, grammar, diff):
+        return diff.apply(grammar)
+
+    @args(grammar_2, GrammarDiff(added=[Rule(5, C, x)], removed=[rule_5_2]))
+    def test_apply_drops_removed_and_appends_added_rules(self):
+        self.assertListEqual(
+            self.result().rules,
+            [rule_1_2, rule_2_2, rule_3_2, rule_4_2, Rule(5, C, x)],
+        )
+
+    @args(grammar_2, GrammarDiff(added=[Rule(5, C, x)]))
+    def test_apply_adds_symbols_of_added_rules(self):
+        self.assertIn(x, self.result().tokens)
+
+    @args(grammar_2, GrammarDiff(removed=[rule_1_2]))
+    def test_starting_rule_cannot_be_removed(self):
+        self.assertResultRaises(ValueError)
+
+
+class TestGrammarDiffAffectedSymbols(TestCase):
+    def subject(self, grammar, diff):
+        return diff.affected_symbols(grammar)
+
+    @args(grammar_5, GrammarDiff(added=[Rule(7, A, d)]))
+    def test_symbols_deriving_changed_symbol(self):
+        self.assertResult({A, E, S})
+
+    @args(grammar_2, GrammarDiff(removed=[rule_5_2]))
+    def test_recursive_symbol(self):
+        self.assertResult({C, L, S})
+
+
+class TestCompiledGrammarPrecedenceToken(TestCompiledGrammar):
+    grammar = grammar_6
+
+    def subject(self, rule):
+        return self.compiled().precedence_token(rule)
+
+    @args(rule_2_6)
+    def test_last_terminal(self):
+        self.assertResult(PLUS)
+
+    @args(rule_7_6)
+    def test_precedence_of_rule(self):
+        self.assertResult(UMINUS)
+
+    @args(rule_8_6)
+    def test_terminal_without_precedence(self):
+        self.assertResult(None)
+
+
+class TestCompiledGrammarResolveShiftReduce(TestCompiledGrammar):
+    grammar = grammar_6
+
+    def subject(self, rule, token):
+        return self.compiled().resolve_shift_reduce(rule, token)
+
+    @args(rule_2_6, STAR)
+    def test_higher_precedence_terminal_is_shifted(self):
+        self.assertResult(ActionType.SHIFT)
+
+    @args(rule_4_6, PLUS)
+    def test_higher_precedence_rule_is_reduced(self):
+        self.assertResult(ActionType.REDUCE)
+
+    @args(rule_2_6, MINUS)
+    def test_left_associative_is_reduced(self):
+        self.assertResult(ActionType.REDUCE)
+
+    @args(rule_5_6, CARET)
+    def test_right_associative_is_shifted(self):
+        self.assertResult(ActionType.SHIFT)
+
+    @args(rule_6_6, LESS)
+    def test_non_associative_is_rejected(self):
+        self.assertResult(ActionType.REJECT)
+
+    @args(rule_7_6, CARET)
+    def test_precedence_of_rule_is_used(self):
+        self.assertResult(ActionType.REDUCE)
+
+    @args(rule_8_6, PLUS)
+    def test_rule_without_precedence(self):
+        self.assertResult(None)
+
+
+class TestCompiledGrammarInvalidPrecedence(TestCase):
+    def subject(self, precedence):
+        return Grammar(rule_1_1, rules_6, tokens_6, precedence).compile()
+
+    @args([(Associativity.LEFT, (PLUS,)), (Associativity.RIGHT, (PLUS,))])
+    def test_declared_twice_raises(self):
+        self.assertResultRaises(ValueError)
+
+    @args([(Associativity.LEFT, (E,))])
+    def test_non_terminal_raises(self):
+        self.assertResultRaises(ValueError)
+
+
+class TestRulePrecedence(TestCase):
+    def subject(self):
+        return rule_7_6
+
+    def test_is_not_part_of_identity(self):
+        self.assertEqual(self.result(), Rule(6, E, MINUS, E))
+
+    def test_pickle(self):
+        rule = pickle.loads(pickle.dumps(self.result()))
+        self.assertEqual(rule.precedence, UMINUS)
@@ -0,0 +1,121 @@
+import os
+import tempfile
+
+from unittest_extensions import TestCase, args
+
+from syntactes import LALR1Generator, LR0Generator, LR1Generator, SLRGenerator
+from syntactes.parser import LR1Parser, ParserError
+from syntactes.parsing_table import LR0ParsingTable, MappedState
+from syntactes.tests.data import (
+    EOF,
+    LPAREN,
+    RPAREN,
+    grammar_1,
+    grammar_2,
+    grammar_3,
+    grammar_4,
+    grammar_8,
+)
+
+
+class TestMappedParsingTable(TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".bin")
+        os.close(fd)
+
+    def tearDown(self):
+        os.unlink(self.path)
+
+    def load(self, table):
+        table.dump(self.path)
+        mapped = LR0ParsingTable.load(self.path)
+        self.addCleanup(mapped.close)
+        return mapped
+
+
+class TestMappedParsingTableLoad(TestMappedParsingTable):
+    def subject(self, generator_cls, grammar):
+        self.table = generator_cls(grammar).generate()
+        return self.load(self.table)
+
+    def assert_same_rows(self):
+        mapped = self.result()
+
+        self.assertEqual(mapped.n_states, len(self.table.rows))
+        for state, row in self.table.rows.items():
+            mapped_state = mapped.state(state.number)
+            self.assertEqual(mapped_state.is_final, state.is_final)
+            self.assertDictEqual(
+                {t: list(map(str, a)) for t, a in mapped.get(mapped_state).items()},
+                {t: list(map(str, a)) for t, a in row.items()},
+            )
+            for token in row:
+                target = self.table.get_goto_state(state, token)
+                self.assertEqual(
+                    mapped.get_goto_state(mapped_state, token),
+                    None if target is None else mapped.state(target.number),
+                )
+
+    @args(LR0Generator, grammar_1)
+    def test_lr0_with_conflict(self):
+        self.assert_same_rows()
+
+    @args(SLRGenerator, grammar_4)
+    def test_slr(self):
+        self.assert_same_rows()
+
+    @args(LALR1Generator, grammar_3)
+    def test_lalr1_with_null_rule(self):
+        self.assert_same_rows()
+
+    @args(LR1Generator, grammar_2)
+    def test_lr1(self):
+        self.assert_same_rows()
+
+    @args(LR1Generator, grammar_2)
+    def test_initial_state(self):
+        self.assertEqual(self.result().initial_state, MappedState(1, False))
+
+
+class TestMappedParsingTableDump(TestMappedParsingTable):
+    def subject(self, simplify):
+        table = LR1Generator(grammar_8, simplify=simplify).generate()
+        return table.dump(self.path)
+
+    @args(False)
+    def test_dumps_table(self):
+        self.result()
+
+    @args(True)
+    def test_table_with_origins(self):
+        self.assertResultRaises(ValueError)
+
+
+class TestMappedParsingTableInvalidFile(TestMappedParsingTable):
+    def subject(self, data):
+        with open(self.path, "wb") as f:
+            f.write(data)
+
+        return LR0ParsingTable.load(self.path)
+
+    @args(b"")
+    def test_empty_file(self):
+        self.assertResultRaises(ValueError)
+
+    @args(b"not a parsing table file")
+    def test_other_file(self):
+        self.assertResultRaises(ValueError)
+
+
+class TestMappedParsingTableParse(TestMappedParsingTable):
+    def subject(self, *stream):
+        parser = LR1Parser(self.load(LR1Generator(grammar_2).generate()))
+        return parser.parse(stream)
+
+    @args(LPAREN, RPAREN, LPAREN, LPAREN, RPAREN, RPAREN, EOF)
+    def test_accepts(self):
+        self.result()
+
+    @args(LPAREN, LPAREN, RPAREN, EOF)
+    def test_rejects(self):
+        self.assertResultRaises(ParserError)
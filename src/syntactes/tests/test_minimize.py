@@ -0,0 +1,117 @@
+from unittest_extensions import TestCase, args
+
+from syntactes import (
+    LALR1Generator,
+    LR0Generator,
+    LR1Generator,
+    MinimizationStats,
+    SLRGenerator,
+)
+from syntactes._action import Action
+from syntactes._item import LR0Item
+from syntactes._state import LR0State
+from syntactes.parser import SLRParser, UnexpectedTokenError
+from syntactes.parsing_table import Entry, SLRParsingTable
+from syntactes.tests.data import (
+    EOF,
+    PLUS,
+    grammar_1,
+    grammar_2,
+    grammar_3,
+    grammar_4,
+    grammar_5,
+    rule_3_1,
+    rule_4_1,
+    slr_parsing_table,
+    x,
+)
+
+
+def duplicated_slr_parsing_table():
+    """
+    The SLR table of grammar 1 with the shift with `x` from state 4 leading to
+    a state 7 with a different kernel and the same row as state 5.
+    """
+    state_7 = LR0State.from_kernel(
+        frozenset({LR0Item(rule_4_1, 1), LR0Item(rule_3_1, 1)}),
+        {LR0Item(rule_4_1, 1), LR0Item(rule_3_1, 1)},
+    )
+    state_7.set_number(7)
+
+    table = SLRParsingTable(grammar_1)
+    for state, row in slr_parsing_table().rows.items():
+        for token, actions in row.items():
+            for action in actions:
+                if state.number == 4 and token == x:
+                    action = Action.shift(state_7)
+                table.add_entry(Entry(state, token, action))
+
+    for token in (PLUS, EOF):
+        table.add_entry(Entry(state_7, token, Action.reduce(rule_4_1)))
+
+    return table
+
+
+class TestMinimize(TestCase):
+    def subject(self, table):
+        self.table = table
+        self.stats = MinimizationStats()
+        return table.minimize(self.stats)
+
+    @args(duplicated_slr_parsing_table())
+    def test_merges_states_with_the_same_rows(self):
+        self.assertEqual(len(self.result().rows), 6)
+
+    @args(duplicated_slr_parsing_table())
+    def test_redirects_shifts_to_merged_states(self):
+        self.assertEqual(self.result().pretty_str(), slr_parsing_table().pretty_str())
+
+    @args(duplicated_slr_parsing_table())
+    def test_returns_table_of_same_type(self):
+        self.assertResultIsInstance(SLRParsingTable)
+
+    @args(duplicated_slr_parsing_table())
+    def test_does_not_modify_table(self):
+        self.result()
+        self.assertEqual(
+            self.table.pretty_str(), duplicated_slr_parsing_table().pretty_str()
+        )
+        self.assertEqual(
+            sorted(s.number for s in self.table.rows), [1, 2, 3, 4, 5, 6, 7]
+        )
+
+    @args(duplicated_slr_parsing_table())
+    def test_stats(self):
+        self.result()
+        self.assertEqual(self.stats.states_before, 7)
+        self.assertEqual(self.stats.states_after, 6)
+        self.assertEqual(self.stats.merged_states, 1)
+        self.assertEqual(self.stats.nbytes_before, self.table.compile().nbytes())
+        self.assertEqual(self.stats.nbytes_after, self.result().compile().nbytes())
+        self.assertLess(self.stats.nbytes_after, self.stats.nbytes_before)
+
+    @args(duplicated_slr_parsing_table())
+    def test_parser_accepts_same_streams(self):
+        parser = SLRParser(self.result())
+        parser.parse([x, PLUS, x, PLUS, x, EOF])
+        with self.assertRaises(UnexpectedTokenError):
+            parser.parse([x, PLUS, PLUS, EOF])
+
+    @args(SLRGenerator(grammar_1).generate())
+    def test_keeps_conflicts(self):
+        self.assertEqual(
+            [str(c) for c in self.result().conflicts()],
+            [str(c) for c in self.table.conflicts()],
+        )
+
+    def test_generated_tables_are_minimal(self):
+        # states of a generated table are distinct items sets, and the
+        # reductions that follow them tell them apart
+        for generator_cls in (LR0Generator, SLRGenerator, LALR1Generator):
+            for grammar in (grammar_1, grammar_2, grammar_3, grammar_4):
+                table = generator_cls(grammar).generate()
+                minimized = table.minimize()
+                self.assertEqual(minimized.pretty_str(), table.pretty_str())
+
+        table = LR1Generator(grammar_5).generate()
+        self.assertEqual(table.minimize().pretty_str(), table.pretty_str())
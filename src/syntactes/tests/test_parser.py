@@ -1,8 +1,9 @@
 from unittest_extensions import TestCase, args
 
-from syntactes import Token
+from syntactes import LR1Generator, Token
 from syntactes.parser import (
     ExecutablesRegistry,
+    LALR1Parser,
     LR0Parser,
     LR1Parser,
     ParserError,
@@ -10,16 +11,39 @@ from syntactes.parser import (
     execute_on,
 )
 from syntactes.tests.data import (
+    CARET,
     EOF,
+    EQUALS,
+    ID,
+    LESS,
     LPAREN,
+    MINUS,
     PLUS,
     RPAREN,
+    STAR,
+    grammar_3,
+    grammar_4,
+    grammar_5,
+    grammar_6,
     lr0_parsing_table,
     lr1_parsing_table,
     rule_2_1,
     rule_4_1,
+    rule_2_6,
+    rule_3_6,
+    rule_4_6,
+    rule_5_6,
+    rule_7_6,
+    rule_8_6,
     slr_parsing_table,
+    a,
+    b,
+    c,
+    d,
+    e,
     x,
+    y,
+    z,
 )
 
 x1 = Token("x", True, 1)
@@ -176,3 +200,154 @@ class TestLR1ParserParse(TestLR1Parser):
     @args(LPAREN, RPAREN, RPAREN, EOF)
     def test_invalid_syntax_raises(self):
         self.assert_parser_error()
+
+
+class TestLR1ParserMergedStatesParse(TestLR1Parser):
+    def setUp(self):
+        generator = LR1Generator(grammar_5, merge_states=True)
+        self._parser = LR1Parser(generator.generate())
+
+    def subject(self, *stream):
+        return self.parser().parse(stream)
+
+    @args(a, c, d, EOF)
+    def test_a_c_d(self):
+        self.result()
+
+    @args(a, c, e, EOF)
+    def test_a_c_e(self):
+        self.result()
+
+    @args(b, c, d, EOF)
+    def test_b_c_d(self):
+        self.result()
+
+    @args(b, c, e, EOF)
+    def test_b_c_e(self):
+        self.result()
+
+    @args(a, c, c, EOF)
+    def test_a_c_c_raises(self):
+        self.assert_parser_error()
+
+
+class TestLALR1Parser(TestCase):
+    def parser(self):
+        return self._parser
+
+    def setUp(self):
+        self._parser = LALR1Parser.from_grammar(self.grammar)
+
+    def assert_parser_error(self):
+        self.assertResultRaises(ParserError)
+
+
+class TestLALR1ParserParse(TestLALR1Parser):
+    grammar = grammar_4
+
+    def subject(self, *stream):
+        return self.parser().parse(stream)
+
+    @args(ID, EQUALS, STAR, ID, EOF)
+    def test_assignment(self):
+        self.result()
+
+    @args(STAR, STAR, ID, EOF)
+    def test_dereference(self):
+        self.result()
+
+    @args(ID, EQUALS, EOF)
+    def test_missing_rhs_raises(self):
+        self.assert_parser_error()
+
+    @args(ID, EQUALS, ID, EQUALS, ID, EOF)
+    def test_chained_assignment_raises(self):
+        self.assert_parser_error()
+
+
+class TestLALR1ParserParseNullable(TestLALR1Parser):
+    grammar = grammar_3
+
+    def subject(self, *stream):
+        return self.parser().parse(stream)
+
+    @args(EOF)
+    def test_empty_stream(self):
+        self.result()
+
+    @args(x, y, EOF)
+    def test_null_rhs_at_end(self):
+        self.result()
+
+    @args(x, z, EOF)
+    def test_null_rhs_in_the_middle(self):
+        self.result()
+
+    @args(x, y, x, z, EOF)
+    def test_nested(self):
+        self.result()
+
+    @args(x, EOF)
+    def test_incomplete_raises(self):
+        self.assert_parser_error()
+
+
+def n(value):
+    return Token("x", True, value)
+
+
+class TestParserPrecedence(TestCase):
+    def subject(self, parser_cls, *stream):
+        parser_cls.from_grammar(grammar_6).parse(stream)
+        return self.stack.pop()
+
+    def setUp(self):
+        self.stack = list()
+        operators = (
+            (rule_2_6, lambda left, right: left + right),
+            (rule_3_6, lambda left, right: left - right),
+            (rule_4_6, lambda left, right: left * right),
+            (rule_5_6, lambda left, right: left**right),
+        )
+        for rule, operator in operators:
+            execute_on(rule)(self.binary(operator))
+        execute_on(rule_7_6)(lambda _e, _minus: self.stack.append(-self.stack.pop()))
+        execute_on(rule_8_6)(lambda x: self.stack.append(x.value))
+
+    def tearDown(self):
+        ExecutablesRegistry.clear()
+
+    def binary(self, operator):
+        def evaluate(_right, _operator, _left):
+            right = self.stack.pop()
+            self.stack.append(operator(self.stack.pop(), right))
+
+        return evaluate
+
+    @args(SLRParser, n(1), PLUS, n(2), STAR, n(3), EOF)
+    def test_higher_precedence_first(self):
+        self.assertResult(7)
+
+    @args(LALR1Parser, n(2), STAR, n(3), PLUS, n(1), EOF)
+    def test_lower_precedence_last(self):
+        self.assertResult(7)
+
+    @args(LR1Parser, n(5), MINUS, n(2), MINUS, n(1), EOF)
+    def test_left_associative(self):
+        self.assertResult(2)
+
+    @args(LALR1Parser, n(2), CARET, n(3), CARET, n(2), EOF)
+    def test_right_associative(self):
+        self.assertResult(512)
+
+    @args(SLRParser, MINUS, n(2), CARET, n(2), EOF)
+    def test_precedence_of_rule(self):
+        self.assertResult(4)
+
+    @args(LR0Parser, n(1), MINUS, MINUS, n(2), STAR, n(3), EOF)
+    def test_lr0(self):
+        self.assertResult(7)
+
+    @args(LALR1Parser, n(1), LESS, n(2), LESS, n(3), EOF)
+    def test_non_associative_raises(self):
+        self.assertResultRaises(ParserError)
@@ -0,0 +1,131 @@
+import warnings
+
+from unittest_extensions import TestCase, args
+
+from syntactes import Grammar, Rule, Token
+from syntactes._prune import GrammarPruning
+from syntactes.tests.data import (
+    EOF,
+    LPAREN,
+    UMINUS,
+    A,
+    B,
+    C,
+    E,
+    S,
+    a,
+    b,
+    grammar_1,
+    grammar_6,
+    grammar_7,
+    precedence_6,
+    rule_1_6,
+    rule_5_7,
+    rule_6_7,
+    rule_7_7,
+    rule_7_6,
+    rule_8_7,
+    rules_1,
+    rules_6,
+    tokens_6,
+    x,
+    y,
+    z,
+)
+
+
+class TestGrammarPruning(TestCase):
+    def subject(self, grammar):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            pruning = GrammarPruning(grammar)
+
+        self.warnings = [str(w.message) for w in caught]
+        return pruning
+
+    @args(grammar_7)
+    def test_removes_useless_rules(self):
+        self.assertTupleEqual(self.result().grammar.rules, rules_1)
+
+    @args(grammar_7)
+    def test_reports_removed_rules(self):
+        self.assertTupleEqual(
+            self.result().removed_rules, (rule_5_7, rule_6_7, rule_7_7, rule_8_7)
+        )
+
+    @args(grammar_7)
+    def test_reports_unproductive_symbols(self):
+        self.assertTupleEqual(self.result().unproductive, (A,))
+
+    @args(grammar_7)
+    def test_reports_unreachable_symbols(self):
+        self.assertTupleEqual(self.result().unreachable, (y, z, B, C))
+
+    @args(grammar_7)
+    def test_drops_useless_tokens(self):
+        self.assertSetEqual(set(self.result().grammar.tokens), set(grammar_1.tokens))
+
+    @args(grammar_7)
+    def test_warns_about_unused_tokens(self):
+        self.assertTupleEqual(self.result().unused_tokens, (LPAREN,))
+        self.assertListEqual(self.warnings, ["Tokens not used by any rule: '('"])
+
+    @args(grammar_1)
+    def test_keeps_reduced_grammar(self):
+        self.assertTupleEqual(self.result().grammar.rules, rules_1)
+        self.assertTupleEqual(self.result().removed_rules, ())
+        self.assertListEqual(self.warnings, [])
+
+    @args(Grammar(rule_1_6, rules_6, tokens_6 | {UMINUS}, precedence_6))
+    def test_precedence_tokens_of_rules_are_used(self):
+        self.assertIn(UMINUS, self.result().grammar.tokens)
+        self.assertTupleEqual(self.result().unreachable, ())
+        self.assertListEqual(self.warnings, [])
+
+    @args(grammar_6)
+    def test_keeps_precedence(self):
+        grammar = self.result().grammar
+        self.assertEqual(grammar.levels, grammar_6.compile().levels)
+        self.assertEqual(grammar.precedence_token(rule_7_6), UMINUS)
+
+    def test_unproductive_starting_rule(self):
+        rule = Rule(0, S, E, EOF)
+        grammar = Grammar(rule, (rule, Rule(1, E, E, x)), {S, E, x, EOF})
+        with self.assertRaises(ValueError):
+            GrammarPruning(grammar)
+
+    def test_starting_rule_with_unproductive_symbol(self):
+        # S -> A $, S -> b $, A -> A a
+        rule = Rule(0, S, A, EOF)
+        rules = (rule, Rule(1, S, b, EOF), Rule(2, A, A, a))
+        grammar = Grammar(rule, rules, {S, A, a, b, EOF})
+        with self.assertRaises(ValueError):
+            GrammarPruning(grammar)
+
+    def test_symbols_productive_through_other_symbols(self):
+        N = Token("N", False)
+        rules = (
+            Rule(0, S, E, EOF),
+            Rule(1, E, N, N),
+            Rule(2, N, E, z),
+            Rule(3, N, Token.null()),
+        )
+        self.assertTupleEqual(
+            self.subject(Grammar(rules[0], rules, {S, E, N, z, EOF})).grammar.rules,
+            rules,
+        )
+
+    @args(grammar_7)
+    def test_pretty_str(self):
+        self.assertEqual(
+            self.result().pretty_str(),
+            "GRAMMAR PRUNING\n"
+            "unproductive: A\n"
+            "unreachable: y, z, B, C\n"
+            "unused tokens: (\n"
+            "removed rules:\n"
+            "4. T -> A y\n"
+            "5. A -> A z\n"
+            "6. B -> y\n"
+            "7. C -> B z\n",
+        )
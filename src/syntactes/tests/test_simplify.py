@@ -0,0 +1,66 @@
+from unittest_extensions import TestCase, args
+
+from syntactes import Grammar, Rule, Token
+from syntactes._simplify import GrammarSimplification
+from syntactes.tests.data import (
+    B,
+    EOF,
+    E,
+    S,
+    grammar_3,
+    rule_4_3,
+    x,
+    y,
+)
+
+N = Token("N", False)
+
+rule_1 = Rule(0, S, E, EOF)
+rule_2 = Rule(1, E, N)
+rule_3 = Rule(2, N, x)
+rule_4 = Rule(3, N, y)
+unit_grammar = Grammar(rule_1, (rule_1, rule_2, rule_3, rule_4), {S, E, N, x, y, EOF})
+
+rule_5 = Rule(4, E, x)
+overlapping_grammar = Grammar(
+    rule_1, (rule_1, rule_2, rule_3, rule_5), {S, E, N, x, EOF}
+)
+
+
+class TestGrammarSimplification(TestCase):
+    def subject(self, grammar, *executables):
+        return GrammarSimplification(grammar, lambda rule: rule in executables)
+
+    def assert_rules(self, *rules):
+        self.assertListEqual([str(r) for r in self.result().grammar.rules], list(rules))
+
+    @args(grammar_3)
+    def test_inlines_single_use_symbol(self):
+        self.assert_rules("S -> A $", "A -> x y A", "A -> x A z", "A -> ε")
+
+    @args(grammar_3)
+    def test_drops_inlined_symbol(self):
+        self.assertNotIn(B, self.result().grammar.tokens)
+
+    @args(grammar_3, rule_4_3)
+    def test_does_not_inline_symbol_with_executables(self):
+        self.assert_rules("S -> A $", "A -> x B", "A -> ε", "B -> y A", "B -> A z")
+
+    @args(unit_grammar, rule_3)
+    def test_inlines_through_unit_rule_with_executables(self):
+        self.assert_rules("S -> E $", "E -> x", "E -> y")
+
+    @args(unit_grammar, rule_3)
+    def test_derived_rules_run_executables_of_their_origins(self):
+        self.assertDictEqual(
+            {str(r): o for r, o in self.result().origins.items()},
+            {"E -> x": rule_3, "E -> y": rule_4},
+        )
+
+    @args(unit_grammar, rule_2)
+    def test_does_not_bypass_unit_rule_with_executable(self):
+        self.assert_rules("S -> E $", "E -> N", "N -> x", "N -> y")
+
+    @args(overlapping_grammar)
+    def test_does_not_inline_into_duplicate_rule(self):
+        self.assert_rules("S -> E $", "E -> N", "N -> x", "E -> x")
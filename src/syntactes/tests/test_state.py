@@ -0,0 +1,63 @@
+from unittest_extensions import TestCase, args
+
+from syntactes._item import LR0Item
+from syntactes._state import LR0State
+from syntactes.tests.data import (
+    grammar_1,
+    lr0_state_1,
+    lr0_state_3,
+    lr0_state_4,
+    rule_2_1,
+    rule_3_1,
+)
+
+
+class TestLR0StateKernel(TestCase):
+    def subject(self, state):
+        return state.kernel
+
+    # S -> . E $
+    # E -> . T + E
+    # E -> . T
+    # T -> . x
+    @args(lr0_state_1())
+    def test_initial_state(self):
+        self.assertResult(frozenset(lr0_state_1().items))
+
+    # E -> T . + E
+    # E -> T .
+    @args(lr0_state_3())
+    def test_state_without_closure(self):
+        self.assertResult({LR0Item(rule_2_1, 1), LR0Item(rule_3_1, 1)})
+
+    # E -> T + . E
+    # E -> . T + E
+    # E -> . T
+    # T -> . x
+    @args(lr0_state_4())
+    def test_state_with_closure(self):
+        self.assertResult({LR0Item(rule_2_1, 2)})
+
+
+class TestLR0StateEquality(TestCase):
+    def subject(self, state, other):
+        return state == other and hash(state) == hash(other)
+
+    @args(lr0_state_4(), LR0State.from_items({LR0Item(rule_2_1, 2)}))
+    def test_states_with_same_kernel_are_equal(self):
+        self.assertResult(True)
+
+    @args(
+        lr0_state_4(),
+        LR0State.from_kernel(frozenset({LR0Item(rule_2_1, 2)}), lr0_state_4().items),
+    )
+    def test_state_from_kernel(self):
+        self.assertResult(True)
+
+    @args(lr0_state_1(), LR0State.from_items({LR0Item(grammar_1.starting_rule, 0)}))
+    def test_initial_states_with_different_items_are_not_equal(self):
+        self.assertResult(False)
+
+    @args(lr0_state_3(), lr0_state_4())
+    def test_states_with_different_kernels_are_not_equal(self):
+        self.assertResult(False)
@@ -1,12 +1,18 @@
 class Token:
     """
     A token of the grammar. Can be a terminal or non-terminal symbol.
+
+    Tokens are immutable; the hash is computed once on creation.
     """
 
+    __slots__ = ("symbol", "is_terminal", "value", "_hash")
+
     def __init__(self, symbol: str, is_terminal: bool, value=None) -> None:
-        self.symbol = symbol
-        self.is_terminal = is_terminal
-        self.value = value
+        _set = object.__setattr__
+        _set(self, "symbol", symbol)
+        _set(self, "is_terminal", is_terminal)
+        _set(self, "value", value)
+        _set(self, "_hash", hash(symbol))
 
     @staticmethod
     def null() -> "Token":
@@ -22,6 +28,12 @@ class Token:
         """
         return Token("$", True)
 
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __reduce__(self):
+        return (Token, (self.symbol, self.is_terminal, self.value))
+
     def __repr__(self) -> str:
         return f"<Token: {self}>"
 
@@ -29,9 +41,12 @@ class Token:
         return self.symbol
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        return self._hash
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, Token):
             return False
 